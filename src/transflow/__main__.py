@@ -1,6 +1,20 @@
 """Main CLI application entry point."""
 
-from transflow.cli import app
+import sys
+
+from transflow import __version__
+
+
+def main() -> None:
+    """Run the CLI, answering a bare --version without loading Typer or Rich."""
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        print(f"TransFlow version {__version__}")
+        return
+
+    from transflow.cli import app
 
-if __name__ == "__main__":
     app()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""bundle command: localize assets into a self-contained folder."""
+
+import logging
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer
+from typing_extensions import Annotated
+
+from transflow.cli import app, console, make_progress, run_async
+from transflow.exceptions import TransFlowException
+
+if TYPE_CHECKING:
+    from transflow.config import TransFlowConfig
+
+
+@app.command()
+def bundle(
+    input_file: Annotated[
+        str,
+        typer.Option(
+            "--input",
+            "-i",
+            help="The Markdown file to bundle",
+        ),
+    ],
+    output_dir: Annotated[
+        str,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Target directory for bundled content",
+        ),
+    ],
+    folder: Annotated[
+        str,
+        typer.Option(
+            "--folder",
+            help="Folder naming format (e.g., {year}/{date}-{slug})",
+        ),
+    ] = "{year}/{date}-{slug}",
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            "-v",
+            help="Enable verbose logging",
+        ),
+    ] = False,
+) -> None:
+    """
+    Localize assets (images) and bundle into a folder.
+
+    Example:
+        transflow bundle -i article.md -o ./output/articles
+    """
+    from transflow.config import load_config
+    from transflow.utils.logger import TransFlowLogger
+
+    try:
+        # Load configuration first to get default log level
+        config = load_config()
+
+        # Setup logging: verbose flag > env var > config default > INFO
+        if verbose:
+            log_level = "DEBUG"
+        else:
+            log_level = config.log_level
+        TransFlowLogger.get_logger(level=log_level)
+
+        # Parse paths
+        input_path = Path(input_file)
+        output_path = Path(output_dir)
+
+        if not input_path.exists():
+            console.print(f"[red]✗ Error:[/red] Input file not found: {input_path}")
+            sys.exit(2)
+
+        # Run bundling
+        with make_progress() as progress:
+            progress.add_task(description="Bundling assets...", total=None)
+
+            result_dir = run_async(_bundle_assets(config, input_path, output_path, folder))
+
+        console.print(f"[green]✓[/green] Bundle created at: [cyan]{result_dir}[/cyan]")
+
+    except TransFlowException as e:
+        console.print(f"[red]✗ Error:[/red] {e}")
+        raise typer.Exit(code=e.exit_code) from e
+    except Exception as e:
+        console.print(f"[red]✗ Unexpected error:[/red] {e}")
+        # Only pay for the traceback when it was asked for
+        if verbose:
+            logging.getLogger("transflow").exception("Unexpected error during bundling")
+        raise typer.Exit(code=1) from e
+
+
+async def _bundle_assets(
+    config: "TransFlowConfig",
+    input_path: Path,
+    output_dir: Path,
+    folder: str,
+) -> Path:
+    """Bundle one file, downloading its assets concurrently over a shared connection pool."""
+    from transflow.core.bundler import AssetBundler
+    from transflow.utils.http import create_session
+
+    session = create_session(config.http_timeout, config.http_concurrent_downloads)
+    async with session:
+        bundler = AssetBundler(config, session=session)
+        return await bundler.bundle(input_path, output_dir, folder)
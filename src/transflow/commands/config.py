@@ -0,0 +1,121 @@
+"""config command: show and validate configuration."""
+
+import sys
+from typing import TYPE_CHECKING
+
+import typer
+from typing_extensions import Annotated
+
+from transflow.cli import app, console
+
+if TYPE_CHECKING:
+    from transflow.config_manager import ConfigItem
+
+
+@app.command()
+def config(
+    show: Annotated[
+        bool,
+        typer.Option(
+            "--show",
+            help="Show current configuration",
+        ),
+    ] = False,
+    validate: Annotated[
+        bool,
+        typer.Option(
+            "--validate",
+            help="Validate configuration",
+        ),
+    ] = False,
+) -> None:
+    """
+    Manage and view TransFlow configuration.
+
+    Use --show to display all configuration values with sources.
+    Use --validate to check if configuration is correct.
+    Both flags may be combined.
+
+    Example:
+        transflow config --show
+        transflow config --validate
+    """
+    try:
+        # Buffer the report and write it in one flush instead of per line
+        with console:
+            # Default: show config
+            if show or not validate:
+                _show_config()
+            if validate:
+                _validate_config()
+
+    except Exception as e:
+        console.print(f"[red]✗ Error:[/red] {e}")
+        raise typer.Exit(code=1) from e
+
+
+def _show_config() -> None:
+    """Display current configuration in a formatted table."""
+    from rich.table import Table
+
+    from transflow.config_manager import get_config_items
+
+    items = get_config_items()
+
+    console.print("[bold cyan]TransFlow Configuration[/bold cyan]\n")
+
+    for category, config_items in items.items():
+        # Create table for each category
+        table = Table(title=category, show_header=True, header_style="bold magenta")
+        table.add_column("Key", style="cyan")
+        table.add_column("Value", style="green")
+        table.add_column("Source", style="dim")
+        table.add_column("Status", style="yellow")
+
+        rows = [
+            (item.key, item.display_value(), item.source_display(), _styled_status(item))
+            for item in config_items
+        ]
+        for row in rows:
+            table.add_row(*row)
+
+        console.print(table)
+        console.print()
+
+
+_STATUS_STYLES = {"[MISSING]": "red", "[SET]": "green"}
+
+
+def _styled_status(item: "ConfigItem") -> str:
+    """Get the item's status wrapped in its Rich color markup."""
+    status = item.status_display()
+    style = _STATUS_STYLES.get(status, "yellow")
+    return f"[{style}]{status}[/{style}]"
+
+
+def _validate_config() -> None:
+    """Validate configuration and show issues."""
+    from transflow.config_manager import validate_config
+
+    is_valid, warnings, errors = validate_config()
+
+    console.print("[bold cyan]Configuration Validation[/bold cyan]\n")
+
+    if is_valid:
+        console.print("[green]✓ Configuration is valid![/green]\n")
+    else:
+        console.print("[red]✗ Configuration has issues:[/red]\n")
+
+    # One print per section instead of one per issue
+    if errors:
+        error_block = "\n".join(f"  {i}. {error}" for i, error in enumerate(errors, 1))
+        console.print(f"[bold red]Errors:[/bold red]\n{error_block}\n")
+
+    if warnings:
+        warning_block = "\n".join(f"  {i}. {warning}" for i, warning in enumerate(warnings, 1))
+        console.print(f"[bold yellow]Warnings:[/bold yellow]\n{warning_block}\n")
+
+    if not errors and not warnings:
+        console.print("No issues found.")
+
+    sys.exit(0 if is_valid else 1)
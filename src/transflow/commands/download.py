@@ -0,0 +1,102 @@
+"""download command: fetch a URL and save it as Markdown."""
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import typer
+from typing_extensions import Annotated
+
+from transflow.cli import app, console, make_progress, run_async
+from transflow.exceptions import TransFlowException
+
+if TYPE_CHECKING:
+    from transflow.config import TransFlowConfig
+
+
+@app.command()
+def download(
+    url: Annotated[str, typer.Argument(help="The URL to fetch and convert to Markdown")],
+    output: Annotated[
+        str,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Output filename (default: auto-generated from URL)",
+        ),
+    ] = "",
+    engine: Annotated[
+        str,
+        typer.Option(
+            "--engine",
+            help="Extraction engine to use",
+        ),
+    ] = "firecrawl",
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            "-v",
+            help="Enable verbose logging",
+        ),
+    ] = False,
+) -> None:
+    """
+    Download web content and convert to clean Markdown.
+
+    Example:
+        transflow download https://example.com/article -o article.md
+    """
+    from transflow.config import load_config
+    from transflow.utils.http import prefetch_dns
+    from transflow.utils.logger import TransFlowLogger
+
+    try:
+        # Load configuration first to get default log level
+        config = load_config()
+
+        # Warm DNS for the API hosts while the rest of start-up runs
+        prefetch_dns(config.firecrawl_base_url)
+
+        # Setup logging: verbose flag > env var > config default > INFO
+        if verbose:
+            log_level = "DEBUG"
+        else:
+            log_level = config.log_level
+        TransFlowLogger.get_logger(level=log_level)
+
+        # Parse output path
+        output_path = Path(output) if output else None
+
+        # Run async fetch
+        with make_progress() as progress:
+            progress.add_task(description=f"Downloading from {url}...", total=None)
+
+            result_path = run_async(_download_url(config, url, output_path))
+
+        console.print(f"[green]✓[/green] Successfully saved to: [cyan]{result_path}[/cyan]")
+
+    except TransFlowException as e:
+        console.print(f"[red]✗ Error:[/red] {e}")
+        raise typer.Exit(code=e.exit_code) from e
+    except Exception as e:
+        console.print(f"[red]✗ Unexpected error:[/red] {e}")
+        # Only pay for the traceback when it was asked for
+        if verbose:
+            logging.getLogger("transflow").exception("Unexpected error during download")
+        raise typer.Exit(code=1) from e
+
+
+async def _download_url(
+    config: "TransFlowConfig",
+    url: str,
+    output_path: Optional[Path],
+) -> Path:
+    """Fetch and save one URL; retries reuse the same connection pool."""
+    from transflow.core.extractor import MarkdownExtractor
+    from transflow.utils.http import create_session
+
+    session = create_session(config.http_timeout)
+    async with session:
+        extractor = MarkdownExtractor(config, session=session)
+        return await extractor.fetch_and_save(url, output_path)
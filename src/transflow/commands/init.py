@@ -0,0 +1,24 @@
+"""init command: interactive configuration wizard."""
+
+import typer
+
+from transflow.cli import app, console
+
+
+@app.command()
+def init() -> None:
+    """
+    Initialize TransFlow configuration interactively.
+
+    This command guides you through setting up API keys and preferences.
+
+    Example:
+        transflow init
+    """
+    from transflow.config_wizard import ConfigWizard
+
+    try:
+        ConfigWizard.run()
+    except Exception as e:
+        console.print(f"[red]✗ Setup failed:[/red] {e}")
+        raise typer.Exit(code=1) from e
@@ -0,0 +1,139 @@
+"""run command: download, bundle and translate in one pipeline."""
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer
+from typing_extensions import Annotated
+
+from transflow.cli import app, console, make_progress, run_async
+from transflow.exceptions import TransFlowException
+
+if TYPE_CHECKING:
+    from transflow.config import TransFlowConfig
+
+
+@app.command()
+def run(
+    url: Annotated[str, typer.Argument(help="The URL to process")],
+    output_dir: Annotated[
+        str,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Target directory for final output",
+        ),
+    ],
+    lang: Annotated[
+        str,
+        typer.Option(
+            "--lang",
+            help="Target language for translation",
+        ),
+    ] = "zh",
+    folder: Annotated[
+        str,
+        typer.Option(
+            "--folder",
+            help="Folder naming format (e.g., {year}/{date}-{slug})",
+        ),
+    ] = "{year}/{date}-{slug}",
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            "-v",
+            help="Enable verbose logging",
+        ),
+    ] = False,
+) -> None:
+    """
+    Run the complete pipeline: download → bundle → translate.
+
+    Example:
+        transflow run https://example.com/article -o ./output
+    """
+    from transflow.config import load_config
+    from transflow.utils.http import prefetch_dns
+    from transflow.utils.logger import TransFlowLogger
+
+    try:
+        # Load configuration first to get default log level
+        config = load_config()
+
+        # Warm DNS for the API hosts while the rest of start-up runs
+        prefetch_dns(config.firecrawl_base_url, config.openai_base_url)
+
+        # Setup logging: verbose flag > env var > config default > INFO
+        if verbose:
+            log_level = "DEBUG"
+        else:
+            log_level = config.log_level
+        TransFlowLogger.get_logger(level=log_level)
+
+        # Run all stages on a single event loop
+        with make_progress() as progress:
+            progress.add_task(description=f"Processing {url}...", total=None)
+
+            result_dir = run_async(_run_pipeline(config, url, Path(output_dir), lang, folder))
+
+        console.print(f"[green]✓[/green] Bundle created at: [cyan]{result_dir}[/cyan]")
+
+    except TransFlowException as e:
+        console.print(f"[red]✗ Error:[/red] {e}")
+        raise typer.Exit(code=e.exit_code) from e
+    except Exception as e:
+        console.print(f"[red]✗ Unexpected error:[/red] {e}")
+        # Only pay for the traceback when it was asked for
+        if verbose:
+            logging.getLogger("transflow").exception("Unexpected error during pipeline")
+        raise typer.Exit(code=1) from e
+
+
+async def _run_pipeline(
+    config: "TransFlowConfig",
+    url: str,
+    output_dir: Path,
+    lang: str,
+    folder: str,
+) -> Path:
+    """
+    Download, bundle and translate one URL sharing a single HTTP connection pool.
+
+    The downloaded Markdown is kept in a temporary directory. It is bundled
+    before translation, because the bundler reads the frontmatter and the
+    ``![..](..)`` image links that the translator's rendering does not keep.
+    The bundle's README.md is then translated in place.
+    """
+    import tempfile
+
+    from transflow.core.bundler import AssetBundler
+    from transflow.core.extractor import MarkdownExtractor
+    from transflow.core.translator import MarkdownTranslator
+    from transflow.utils.filesystem import FileSystemHelper
+    from transflow.utils.http import create_session
+
+    # Room for the asset downloads, the concurrent LLM requests and Firecrawl
+    session = create_session(
+        config.http_timeout,
+        config.http_concurrent_downloads + config.translate_concurrency + 1,
+    )
+    async with session:
+        extractor = MarkdownExtractor(config, session=session)
+        translator = MarkdownTranslator(
+            config, model=config.openai_model, target_language=lang, session=session
+        )
+        bundler = AssetBundler(config, session=session)
+
+        with tempfile.TemporaryDirectory(prefix="transflow-") as tmp:
+            # Keep the URL-derived filename so the bundle falls back to a meaningful slug
+            filename = FileSystemHelper.generate_filename_from_url(url)
+            downloaded_path = Path(tmp) / filename
+
+            await extractor.fetch_and_save(url, downloaded_path)
+            bundle_dir = await bundler.bundle(downloaded_path, output_dir, folder)
+
+        readme_path = bundle_dir / "README.md"
+        await translator.translate_file(readme_path, readme_path)
+        return bundle_dir
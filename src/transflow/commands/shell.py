@@ -0,0 +1,53 @@
+"""shell command: interactive session running commands in-process."""
+
+from transflow.cli import app, console
+
+
+@app.command()
+def shell() -> None:
+    """
+    Start an interactive session that runs TransFlow commands in-process.
+
+    Python, configuration and command modules are loaded once and reused,
+    so consecutive commands skip the interpreter start-up cost.
+
+    Example:
+        transflow shell
+        transflow> download https://example.com/article -o article.md
+        transflow> translate -i article.md -o article_zh.md
+    """
+    import shlex
+
+    console.print("[bold cyan]TransFlow shell[/bold cyan] (type 'exit' or press Ctrl-D to quit)")
+
+    while True:
+        try:
+            line = console.input("[bold cyan]transflow>[/bold cyan] ")
+        except (EOFError, KeyboardInterrupt):
+            console.print()
+            break
+
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            console.print(f"[red]✗ Error:[/red] {e}")
+            continue
+
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            break
+        if args[0] == "shell":
+            console.print("[yellow]Already in the TransFlow shell[/yellow]")
+            continue
+
+        _run_shell_command(args)
+
+
+def _run_shell_command(args: list[str]) -> None:
+    """Dispatch one shell command line to the CLI without ending the session."""
+    try:
+        app(args, prog_name="transflow")
+    except SystemExit:
+        # Commands and usage errors terminate via sys.exit(); keep the shell alive
+        pass
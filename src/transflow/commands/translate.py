@@ -0,0 +1,110 @@
+"""translate command: translate a Markdown file."""
+
+import logging
+import sys
+from pathlib import Path
+
+import typer
+from typing_extensions import Annotated
+
+from transflow.cli import app, console, make_progress, run_async
+from transflow.exceptions import TransFlowException
+
+
+@app.command()
+def translate(
+    input_file: Annotated[
+        str,
+        typer.Option(
+            "--input",
+            "-i",
+            help="Source Markdown file",
+        ),
+    ],
+    output_file: Annotated[
+        str,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Destination Markdown file",
+        ),
+    ],
+    lang: Annotated[
+        str,
+        typer.Option(
+            "--lang",
+            help="Target language code (e.g., zh, en, ja)",
+        ),
+    ] = "zh",
+    model: Annotated[
+        str | None,
+        typer.Option(
+            "--model",
+            help="LLM model to use (e.g., gpt-4o, deepseek-chat). Uses TRANSFLOW_OPENAI_MODEL if not specified.",
+        ),
+    ] = None,
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            "-v",
+            help="Enable verbose logging",
+        ),
+    ] = False,
+) -> None:
+    """
+    Translate Markdown content while preserving structure.
+
+    Example:
+        transflow translate -i raw.md -o trans.md --lang zh
+    """
+    from transflow.config import load_config
+    from transflow.core.translator import MarkdownTranslator
+    from transflow.utils.http import prefetch_dns
+    from transflow.utils.logger import TransFlowLogger
+
+    try:
+        # Load configuration first to get default log level
+        config = load_config()
+
+        # Warm DNS for the API hosts while the rest of start-up runs
+        prefetch_dns(config.openai_base_url)
+
+        # Setup logging: verbose flag > env var > config default > INFO
+        if verbose:
+            log_level = "DEBUG"
+        else:
+            log_level = config.log_level
+        TransFlowLogger.get_logger(level=log_level)
+
+        # Use provided model or fall back to config default
+        effective_model = model or config.openai_model
+
+        # Create translator
+        translator = MarkdownTranslator(config, model=effective_model, target_language=lang)
+
+        # Parse paths
+        input_path = Path(input_file)
+        output_path = Path(output_file)
+
+        if not input_path.exists():
+            console.print(f"[red]✗ Error:[/red] Input file not found: {input_path}")
+            sys.exit(2)
+
+        # Run translation
+        with make_progress() as progress:
+            progress.add_task(description=f"Translating to {lang}...", total=None)
+
+            run_async(translator.translate_file(input_path, output_path))
+
+        console.print(f"[green]✓[/green] Translation saved to: [cyan]{output_path}[/cyan]")
+
+    except TransFlowException as e:
+        console.print(f"[red]✗ Error:[/red] {e}")
+        raise typer.Exit(code=e.exit_code) from e
+    except Exception as e:
+        console.print(f"[red]✗ Unexpected error:[/red] {e}")
+        # Only pay for the traceback when it was asked for
+        if verbose:
+            logging.getLogger("transflow").exception("Unexpected error during translation")
+        raise typer.Exit(code=1) from e
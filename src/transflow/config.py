@@ -1,11 +1,19 @@
 """Configuration management for TransFlow."""
 
+import functools
+import hashlib
+import json
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Literal, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from transflow import __version__
+
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
 
 class TransFlowConfig(BaseSettings):
     """Application configuration with environment variable support."""
@@ -26,6 +34,7 @@ class TransFlowConfig(BaseSettings):
     )
     firecrawl_timeout: int = Field(
         default=30,
+        gt=0,
         description="Request timeout in seconds",
         alias="TRANSFLOW_FIRECRAWL_TIMEOUT",
     )
@@ -34,6 +43,17 @@ class TransFlowConfig(BaseSettings):
         description="Firecrawl API base URL",
         alias="TRANSFLOW_FIRECRAWL_BASE_URL",
     )
+    firecrawl_cache_ttl: int = Field(
+        default=0,
+        ge=0,
+        description="Seconds to reuse a cached scrape of the same URL (0 disables caching)",
+        alias="TRANSFLOW_FIRECRAWL_CACHE_TTL",
+    )
+    firecrawl_prevalidate: bool = Field(
+        default=False,
+        description="Send a HEAD request first and skip the scrape for dead URLs",
+        alias="TRANSFLOW_FIRECRAWL_PREVALIDATE",
+    )
 
     # LLM settings
     openai_api_key: Optional[str] = Field(
@@ -56,10 +76,45 @@ class TransFlowConfig(BaseSettings):
         description="Default target language",
         alias="TRANSFLOW_DEFAULT_LANGUAGE",
     )
+    translate_batch_size: int = Field(
+        default=10,
+        ge=1,
+        description="Number of text blocks sent per translation request",
+        alias="TRANSFLOW_TRANSLATE_BATCH_SIZE",
+    )
+    translate_batch_tokens: int = Field(
+        default=3000,
+        ge=0,
+        description="Approximate input tokens per translation request (0 = no limit)",
+        alias="TRANSFLOW_TRANSLATE_BATCH_TOKENS",
+    )
+    translate_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=20,
+        description="Maximum concurrent translation requests",
+        alias="TRANSFLOW_TRANSLATE_CONCURRENCY",
+    )
+    translate_cache: bool = Field(
+        default=False,
+        description="Reuse translations of identical text from earlier runs",
+        alias="TRANSFLOW_TRANSLATE_CACHE",
+    )
+    translate_batch_api: bool = Field(
+        default=False,
+        description="Translate through the provider's Batch API (cheaper, but can take hours)",
+        alias="TRANSFLOW_TRANSLATE_BATCH_API",
+    )
+    translate_parser: Literal["marko", "markdown-it"] = Field(
+        default="marko",
+        description="Markdown parser used by the translator",
+        alias="TRANSFLOW_TRANSLATE_PARSER",
+    )
 
     # HTTP settings
     http_timeout: int = Field(
         default=30,
+        gt=0,
         description="HTTP timeout in seconds",
         alias="TRANSFLOW_HTTP_TIMEOUT",
     )
@@ -70,6 +125,8 @@ class TransFlowConfig(BaseSettings):
     )
     http_concurrent_downloads: int = Field(
         default=5,
+        ge=1,
+        le=20,
         description="Maximum concurrent downloads",
         alias="TRANSFLOW_HTTP_CONCURRENT_DOWNLOADS",
     )
@@ -91,33 +148,108 @@ class TransFlowConfig(BaseSettings):
         alias="TRANSFLOW_LOG_JSON",
     )
 
-    @field_validator("log_level")
-    @classmethod
-    def validate_log_level(cls, v: str) -> str:
-        """Validate log level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        v = v.upper()
-        if v not in valid_levels:
-            raise ValueError(f"log_level must be one of {valid_levels}")
-        return v
-
-    @field_validator("http_timeout", "firecrawl_timeout")
+    # Numeric bounds are declared on the fields and checked by pydantic-core;
+    # only log_level needs Python-side normalization.
+    @field_validator("log_level", mode="before")
     @classmethod
-    def validate_timeout(cls, v: int) -> int:
-        """Validate timeout values."""
-        if v <= 0:
-            raise ValueError("Timeout must be positive")
-        return v
-
-    @field_validator("http_concurrent_downloads")
-    @classmethod
-    def validate_concurrent_downloads(cls, v: int) -> int:
-        """Validate concurrent downloads."""
-        if v < 1 or v > 20:
-            raise ValueError("Concurrent downloads must be between 1 and 20")
-        return v
+    def validate_log_level(cls, v: Any) -> Any:
+        """Validate log level, normalizing it to upper case."""
+        if v in LOG_LEVELS:
+            return v
+        if isinstance(v, str) and v.upper() in LOG_LEVELS:
+            return v.upper()
+        raise ValueError(f"log_level must be one of {list(LOG_LEVELS)}")
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> TransFlowConfig:
-    """Load configuration from environment and .env file."""
-    return TransFlowConfig()
+    """
+    Load configuration from environment and .env file.
+
+    Validated settings are snapshotted on disk, keyed by a hash of the .env
+    file and the TRANSFLOW_* environment variables, so later invocations with
+    the same inputs skip pydantic parsing and validation.
+
+    The result is also cached for the lifetime of the process; call
+    ``load_config.cache_clear()`` to force a reload.
+    """
+    snapshot_path = _config_snapshot_path()
+
+    try:
+        data = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = None
+
+    if isinstance(data, dict):
+        if data.get("log_file"):
+            data["log_file"] = Path(data["log_file"])
+        return TransFlowConfig.model_construct(**data)
+
+    config = TransFlowConfig()
+    _write_config_snapshot(snapshot_path, config)
+    return config
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the directory for TransFlow's cache files.
+
+    Returns:
+        $XDG_CACHE_HOME/transflow (defaults to ~/.cache/transflow)
+    """
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_home / "transflow"
+
+
+def _config_snapshot_path() -> Path:
+    """
+    Get the snapshot file path for the current configuration inputs.
+
+    Returns:
+        Path under $XDG_CACHE_HOME/transflow (defaults to ~/.cache/transflow)
+    """
+    env_file = Path(str(TransFlowConfig.model_config.get("env_file") or ".env"))
+    try:
+        env_bytes = env_file.read_bytes()
+    except OSError:
+        env_bytes = b""
+
+    environ = sorted(
+        (key.upper(), value)
+        for key, value in os.environ.items()
+        if key.upper().startswith("TRANSFLOW_")
+    )
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(__version__.encode())
+    digest.update(",".join(TransFlowConfig.model_fields).encode())
+    digest.update(env_bytes)
+    digest.update(repr(environ).encode())
+
+    return get_cache_dir() / f"cfg-{digest.hexdigest()}.json"
+
+
+def _write_config_snapshot(path: Path, config: TransFlowConfig) -> None:
+    """
+    Write a configuration snapshot, replacing older snapshots.
+
+    The file may contain API keys, so it is created readable by the owner only.
+    Failures are ignored: the snapshot is only an optimization.
+
+    Args:
+        path: Snapshot file path
+        config: Validated configuration
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in path.parent.glob("cfg-*.json"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+
+        tmp_path = path.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(config.model_dump(mode="json"), f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
@@ -1,11 +1,15 @@
 """Configuration management utilities."""
 
+import functools
 import os
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-from transflow.config import TransFlowConfig
-from transflow.utils.logger import TransFlowLogger
+from pydantic import ValidationError
+from pydantic_settings import SettingsConfigDict
+
+from transflow.config import TransFlowConfig, load_config
 
 
 class ConfigSource(Enum):
@@ -17,24 +21,23 @@ class ConfigSource(Enum):
     NOT_SET = "not set"
 
 
+@dataclass(slots=True, frozen=True)
 class ConfigItem:
     """Configuration item with metadata."""
 
-    def __init__(
-        self,
-        key: str,
-        value: Any,
-        source: ConfigSource,
-        category: str = "",
-        description: str = "",
-        required: bool = False,
-    ):
-        self.key = key
-        self.value = value
-        self.source = source
-        self.category = category
-        self.description = description
-        self.required = required
+    key: str
+    value: Any
+    source: ConfigSource
+    category: str = ""
+    description: str = ""
+    required: bool = False
+    # Derived once from the fields above; items never change after creation
+    _source_display: str = field(init=False, repr=False, compare=False)
+    _status_display: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_source_display", self._compute_source_display())
+        object.__setattr__(self, "_status_display", self._compute_status_display())
 
     def display_value(self) -> str:
         """Get display value with masking for sensitive info."""
@@ -53,6 +56,14 @@ class ConfigItem:
 
     def source_display(self) -> str:
         """Get source display string."""
+        return self._source_display
+
+    def status_display(self) -> str:
+        """Get status indicator."""
+        return self._status_display
+
+    def _compute_source_display(self) -> str:
+        """Build the source display string."""
         if self.source == ConfigSource.ENVIRONMENT:
             env_var = f"TRANSFLOW_{self.key.upper()}"
             return f"({self.source.value}: {env_var})"
@@ -63,8 +74,8 @@ class ConfigItem:
         else:
             return ""
 
-    def status_display(self) -> str:
-        """Get status indicator."""
+    def _compute_status_display(self) -> str:
+        """Build the status indicator."""
         if self.value is None or self.value == "":
             if self.required:
                 return "[MISSING]"
@@ -72,131 +83,207 @@ class ConfigItem:
         return "[SET]"
 
 
+# (section, category, key, default, description, required) for each item shown
+# by ``transflow config``; the environment variable is TRANSFLOW_<KEY>
+_CONFIG_SPEC: tuple[tuple[str, str, str, Optional[str], str, bool], ...] = (
+    (
+        "API Configuration",
+        "API",
+        "openai_api_key",
+        None,
+        "OpenAI/LLM API key for translations",
+        True,
+    ),
+    (
+        "API Configuration",
+        "API",
+        "openai_base_url",
+        "https://api.openai.com/v1",
+        "OpenAI/LLM API base URL",
+        False,
+    ),
+    ("API Configuration", "API", "openai_model", "gpt-4o", "LLM model name to use", False),
+    (
+        "Extraction Configuration",
+        "Extraction",
+        "firecrawl_api_key",
+        None,
+        "Firecrawl API key for web extraction",
+        False,
+    ),
+    (
+        "Extraction Configuration",
+        "Extraction",
+        "firecrawl_base_url",
+        "https://api.firecrawl.dev/v1",
+        "Firecrawl API base URL",
+        False,
+    ),
+    (
+        "Extraction Configuration",
+        "Extraction",
+        "firecrawl_timeout",
+        "30",
+        "Firecrawl request timeout (seconds)",
+        False,
+    ),
+    (
+        "Extraction Configuration",
+        "Extraction",
+        "firecrawl_cache_ttl",
+        "0",
+        "Seconds to reuse a cached scrape (0 disables caching)",
+        False,
+    ),
+    (
+        "Extraction Configuration",
+        "Extraction",
+        "firecrawl_prevalidate",
+        "False",
+        "Check URLs with a HEAD request before scraping",
+        False,
+    ),
+    ("HTTP Configuration", "HTTP", "http_timeout", "30", "HTTP request timeout (seconds)", False),
+    ("HTTP Configuration", "HTTP", "http_max_retries", "3", "Maximum HTTP retry attempts", False),
+    (
+        "HTTP Configuration",
+        "HTTP",
+        "http_concurrent_downloads",
+        "5",
+        "Maximum concurrent downloads",
+        False,
+    ),
+    (
+        "Logging Configuration",
+        "Logging",
+        "log_level",
+        "INFO",
+        "Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
+        False,
+    ),
+    ("Logging Configuration", "Logging", "log_file", None, "Log file path (optional)", False),
+    ("Logging Configuration", "Logging", "log_json", "False", "Use JSON log format", False),
+    (
+        "Translation Configuration",
+        "Translation",
+        "translate_batch_size",
+        "10",
+        "Number of text blocks sent per translation request",
+        False,
+    ),
+    (
+        "Translation Configuration",
+        "Translation",
+        "translate_batch_tokens",
+        "3000",
+        "Approximate input tokens per translation request (0 = no limit)",
+        False,
+    ),
+    (
+        "Translation Configuration",
+        "Translation",
+        "translate_concurrency",
+        "4",
+        "Maximum concurrent translation requests",
+        False,
+    ),
+    (
+        "Translation Configuration",
+        "Translation",
+        "translate_cache",
+        "False",
+        "Reuse translations of identical text from earlier runs",
+        False,
+    ),
+    (
+        "Translation Configuration",
+        "Translation",
+        "translate_batch_api",
+        "False",
+        "Use the provider's Batch API (cheaper, but can take hours)",
+        False,
+    ),
+    (
+        "Translation Configuration",
+        "Translation",
+        "translate_parser",
+        "marko",
+        "Markdown parser for translation (marko or markdown-it)",
+        False,
+    ),
+    (
+        "Default Language",
+        "Language",
+        "default_language",
+        "zh",
+        "Default target language for translations",
+        False,
+    ),
+)
+
+
+class _ValidationConfig(TransFlowConfig):
+    """TransFlowConfig that validates only the current runtime environment."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="TRANSFLOW_",
+        env_file=None,  # Don't load from .env during validation
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        populate_by_name=True,
+    )
+
+
+# (failed, message, is_error) checks run by validate_config(); the message is
+# formatted with the config only when the check fails. Value checks (numeric
+# ranges, log_level) are enforced by TransFlowConfig itself, so they are not
+# repeated here
+_CONFIG_CHECKS: tuple[tuple[Callable[[TransFlowConfig], bool], str, bool], ...] = (
+    (
+        lambda config: not config.openai_api_key,
+        "openai_api_key is required for 'translate' command. "
+        "Set it with: export TRANSFLOW_OPENAI_API_KEY=your_key",
+        True,
+    ),
+    (
+        lambda config: not config.firecrawl_api_key,
+        "firecrawl_api_key is not set. 'download' command will not work. "
+        "Set it with: export TRANSFLOW_FIRECRAWL_API_KEY=your_key",
+        False,
+    ),
+)
+
+
 def get_config_items() -> dict[str, list[ConfigItem]]:
     """
     Get all configuration items grouped by category.
 
+    Results are memoized per set of TRANSFLOW_* environment variables; the
+    returned structure is shared and must not be mutated.
+
     Returns:
         Dictionary mapping category to list of ConfigItem
     """
+    return _get_config_items(_environment_key())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_config_items(env_key: tuple[tuple[str, str], ...]) -> dict[str, list[ConfigItem]]:
+    """Build configuration items (cached by ``get_config_items``)."""
     config = TransFlowConfig()
 
-    items = {
-        "API Configuration": [
-            ConfigItem(
-                "openai_api_key",
-                config.openai_api_key,
-                _get_source("TRANSFLOW_OPENAI_API_KEY"),
-                category="API",
-                description="OpenAI/LLM API key for translations",
-                required=True,
-            ),
-            ConfigItem(
-                "openai_base_url",
-                config.openai_base_url,
-                _get_source("TRANSFLOW_OPENAI_BASE_URL", "https://api.openai.com/v1"),
-                category="API",
-                description="OpenAI/LLM API base URL",
-                required=False,
-            ),
-            ConfigItem(
-                "openai_model",
-                config.openai_model,
-                _get_source("TRANSFLOW_OPENAI_MODEL", "gpt-4o"),
-                category="API",
-                description="LLM model name to use",
-                required=False,
-            ),
-        ],
-        "Extraction Configuration": [
-            ConfigItem(
-                "firecrawl_api_key",
-                config.firecrawl_api_key,
-                _get_source("TRANSFLOW_FIRECRAWL_API_KEY"),
-                category="Extraction",
-                description="Firecrawl API key for web extraction",
-                required=False,
-            ),
-            ConfigItem(
-                "firecrawl_base_url",
-                config.firecrawl_base_url,
-                _get_source("TRANSFLOW_FIRECRAWL_BASE_URL", "https://api.firecrawl.dev/v1"),
-                category="Extraction",
-                description="Firecrawl API base URL",
-                required=False,
-            ),
-            ConfigItem(
-                "firecrawl_timeout",
-                config.firecrawl_timeout,
-                _get_source("TRANSFLOW_FIRECRAWL_TIMEOUT", "30"),
-                category="Extraction",
-                description="Firecrawl request timeout (seconds)",
-                required=False,
-            ),
-        ],
-        "HTTP Configuration": [
-            ConfigItem(
-                "http_timeout",
-                config.http_timeout,
-                _get_source("TRANSFLOW_HTTP_TIMEOUT", "30"),
-                category="HTTP",
-                description="HTTP request timeout (seconds)",
-                required=False,
-            ),
-            ConfigItem(
-                "http_max_retries",
-                config.http_max_retries,
-                _get_source("TRANSFLOW_HTTP_MAX_RETRIES", "3"),
-                category="HTTP",
-                description="Maximum HTTP retry attempts",
-                required=False,
-            ),
-            ConfigItem(
-                "http_concurrent_downloads",
-                config.http_concurrent_downloads,
-                _get_source("TRANSFLOW_HTTP_CONCURRENT_DOWNLOADS", "5"),
-                category="HTTP",
-                description="Maximum concurrent downloads",
-                required=False,
-            ),
-        ],
-        "Logging Configuration": [
+    items: dict[str, list[ConfigItem]] = {}
+    for section, category, key, default, description, required in _CONFIG_SPEC:
+        items.setdefault(section, []).append(
             ConfigItem(
-                "log_level",
-                config.log_level,
-                _get_source("TRANSFLOW_LOG_LEVEL", "INFO"),
-                category="Logging",
-                description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
-                required=False,
-            ),
-            ConfigItem(
-                "log_file",
-                config.log_file,
-                _get_source("TRANSFLOW_LOG_FILE"),
-                category="Logging",
-                description="Log file path (optional)",
-                required=False,
-            ),
-            ConfigItem(
-                "log_json",
-                config.log_json,
-                _get_source("TRANSFLOW_LOG_JSON", "False"),
-                category="Logging",
-                description="Use JSON log format",
-                required=False,
-            ),
-        ],
-        "Default Language": [
-            ConfigItem(
-                "default_language",
-                config.default_language,
-                _get_source("TRANSFLOW_DEFAULT_LANGUAGE", "zh"),
-                category="Language",
-                description="Default target language for translations",
-                required=False,
-            ),
-        ],
-    }
+                key,
+                getattr(config, key),
+                _get_source(f"TRANSFLOW_{key.upper()}", default),
+                category=category,
+                description=description,
+                required=required,
+            )
+        )
 
     return items
 
@@ -220,30 +307,43 @@ def _get_source(env_key: str, default_value: Any = None) -> ConfigSource:
         return ConfigSource.NOT_SET
 
 
+def _environment_key() -> tuple[tuple[str, str], ...]:
+    """Get the TRANSFLOW_* environment variables as a hashable cache key."""
+    return tuple(
+        sorted(
+            (key, value)
+            for key, value in os.environ.items()
+            if key.upper().startswith("TRANSFLOW_")
+        )
+    )
+
+
+def clear_config_cache() -> None:
+    """Drop memoized configuration, e.g. after the .env file was rewritten."""
+    load_config.cache_clear()
+    _get_config_items.cache_clear()
+    _validate_config.cache_clear()
+
+
 def validate_config() -> tuple[bool, list[str], list[str]]:
     """
     Validate configuration.
 
+    Results are memoized per set of TRANSFLOW_* environment variables; the
+    returned lists are shared and must not be mutated.
+
     Returns:
         (is_valid, warnings, errors)
     """
-    from pydantic import ValidationError
-    from pydantic_settings import SettingsConfigDict
+    return _validate_config(_environment_key())
+
 
+@functools.lru_cache(maxsize=1)
+def _validate_config(env_key: tuple[tuple[str, str], ...]) -> tuple[bool, list[str], list[str]]:
+    """Validate configuration (cached by ``validate_config``)."""
     warnings = []
     errors = []
 
-    # Create a validation config that doesn't load from .env file
-    # This ensures we validate only the current runtime environment
-    class _ValidationConfig(TransFlowConfig):
-        model_config = SettingsConfigDict(
-            env_prefix="TRANSFLOW_",
-            env_file=None,  # Don't load from .env during validation
-            env_file_encoding="utf-8",
-            case_sensitive=False,
-            populate_by_name=True,
-        )
-
     # Try to load config, catching validation errors
     try:
         config = _ValidationConfig()
@@ -256,38 +356,9 @@ def validate_config() -> tuple[bool, list[str], list[str]]:
         # If there are validation errors, return early
         return False, warnings, errors
 
-    # Check required configs
-    if not config.openai_api_key:
-        errors.append(
-            "openai_api_key is required for 'translate' command. "
-            "Set it with: export TRANSFLOW_OPENAI_API_KEY=your_key"
-        )
-
-    # Check optional but useful configs
-    if not config.firecrawl_api_key:
-        warnings.append(
-            "firecrawl_api_key is not set. 'download' command will not work. "
-            "Set it with: export TRANSFLOW_FIRECRAWL_API_KEY=your_key"
-        )
-
-    # Validate timeout values
-    if config.http_timeout <= 0:
-        errors.append(f"http_timeout must be positive, got {config.http_timeout}")
-
-    if config.firecrawl_timeout <= 0:
-        errors.append(f"firecrawl_timeout must be positive, got {config.firecrawl_timeout}")
-
-    # Validate concurrent downloads
-    if config.http_concurrent_downloads < 1 or config.http_concurrent_downloads > 20:
-        errors.append(
-            f"http_concurrent_downloads must be between 1 and 20, "
-            f"got {config.http_concurrent_downloads}"
-        )
-
-    # Validate log level
-    valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-    if config.log_level.upper() not in valid_levels:
-        errors.append(f"log_level must be one of {valid_levels}, got {config.log_level}")
+    for failed, message, is_error in _CONFIG_CHECKS:
+        if failed(config):
+            (errors if is_error else warnings).append(message.format(config=config))
 
     is_valid = len(errors) == 0
 
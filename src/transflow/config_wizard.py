@@ -45,7 +45,12 @@ class ConfigWizard:
             cls._setup_env_file()
         else:
             cls._setup_user_config()
-        
+
+        # Make commands run later in this process (e.g. in the shell) see the new values
+        from transflow.config_manager import clear_config_cache
+
+        clear_config_cache()
+
         console.print("\n[green]✓[/green] Configuration saved successfully!\n")
 
     @classmethod
@@ -55,41 +60,10 @@ class ConfigWizard:
         
         console.print(f"\n[bold]Setting up .env file at:[/bold] {env_path}\n")
         
-        # Collect API keys
-        firecrawl_key = Prompt.ask(
-            "[yellow]Firecrawl API Key[/yellow] (leave blank to skip)",
-            default=""
-        )
-        
-        openai_key = Prompt.ask(
-            "[yellow]OpenAI API Key[/yellow] (leave blank to skip)",
-            default=""
-        )
-        
-        openai_base_url = Prompt.ask(
-            "[yellow]OpenAI Base URL[/yellow] (for custom servers like Ollama, localai, etc.)",
-            default="https://api.openai.com/v1"
-        )
-        
-        # Collect optional settings
-        model = Prompt.ask(
-            "[yellow]Default Model[/yellow]",
-            default="gpt-4o"
-        )
-        
-        language = Prompt.ask(
-            "[yellow]Default Language[/yellow]",
-            default="zh"
-        )
-        
-        log_level = Prompt.ask(
-            "[yellow]Log Level[/yellow]",
-            choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-            default="INFO"
-        )
-        
+        settings = cls._collect_settings()
+
         # Build .env content
-        content = cls._build_env_content(firecrawl_key, openai_key, openai_base_url, model, language, log_level)
+        content = cls._build_env_content(*settings)
         
         # Write file
         env_path.write_text(content, encoding="utf-8")
@@ -105,6 +79,27 @@ class ConfigWizard:
         
         console.print(f"\n[bold]Setting up config file at:[/bold] {config_path}\n")
         
+        settings = cls._collect_settings()
+
+        # Build env content for source command
+        content = cls._build_env_content(*settings)
+        
+        # Write file
+        config_path.write_text(content, encoding="utf-8")
+        console.print(f"\n[green]✓[/green] Config file created at: [cyan]{config_path}[/cyan]")
+        
+        # Show how to use it
+        console.print("\n[bold]To use this configuration, add to your shell profile:[/bold]")
+        console.print(f"  source {config_path}")
+
+    @staticmethod
+    def _collect_settings() -> tuple[str, str, str, str, str, str]:
+        """
+        Prompt for the settings written by both setup targets.
+
+        Returns:
+            (firecrawl_key, openai_key, openai_base_url, model, language, log_level)
+        """
         # Collect API keys
         firecrawl_key = Prompt.ask(
             "[yellow]Firecrawl API Key[/yellow] (leave blank to skip)",
@@ -137,17 +132,8 @@ class ConfigWizard:
             choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
             default="INFO"
         )
-        
-        # Build env content for source command
-        content = cls._build_env_content(firecrawl_key, openai_key, openai_base_url, model, language, log_level)
-        
-        # Write file
-        config_path.write_text(content, encoding="utf-8")
-        console.print(f"\n[green]✓[/green] Config file created at: [cyan]{config_path}[/cyan]")
-        
-        # Show how to use it
-        console.print("\n[bold]To use this configuration, add to your shell profile:[/bold]")
-        console.print(f"  source {config_path}")
+
+        return firecrawl_key, openai_key, openai_base_url, model, language, log_level
 
     @staticmethod
     def _build_env_content(
@@ -186,6 +172,14 @@ class ConfigWizard:
             "# TRANSFLOW_HTTP_TIMEOUT=30",
             "# TRANSFLOW_HTTP_MAX_RETRIES=3",
             "# TRANSFLOW_HTTP_CONCURRENT_DOWNLOADS=5",
+            "# TRANSFLOW_FIRECRAWL_CACHE_TTL=0",
+            "# TRANSFLOW_FIRECRAWL_PREVALIDATE=false",
+            "# TRANSFLOW_TRANSLATE_BATCH_SIZE=10",
+            "# TRANSFLOW_TRANSLATE_BATCH_TOKENS=3000",
+            "# TRANSFLOW_TRANSLATE_CONCURRENCY=4",
+            "# TRANSFLOW_TRANSLATE_CACHE=false",
+            "# TRANSFLOW_TRANSLATE_BATCH_API=false",
+            "# TRANSFLOW_TRANSLATE_PARSER=marko",
         ])
         
         return "\n".join(lines)
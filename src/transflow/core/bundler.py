@@ -4,10 +4,12 @@ import asyncio
 import hashlib
 import logging
 import re
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 from urllib.parse import urlparse
 
+import httpx
 import yaml
 
 from transflow.config import TransFlowConfig
@@ -15,22 +17,81 @@ from transflow.exceptions import NetworkError
 from transflow.utils.filesystem import FileSystemHelper
 from transflow.utils.http import HTTPClient
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+# YAML frontmatter block at the start of a document
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+# Pattern: ![alt](url) or ![alt](url "title")
+_IMAGE_LINK_RE = re.compile(r"!\[(.*?)\]\(([^)\s]+)(?:\s+[\"'].*?[\"'])?\)")
+
+# Characters not allowed in local asset filenames
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w\-.]")
+
+# Default for frontmatter lookups, so keys set to null are still copied
+_MISSING = object()
+
 
 class AssetBundler:
     """Bundle Markdown with localized assets."""
 
-    def __init__(self, config: TransFlowConfig):
+    def __init__(self, config: TransFlowConfig, session: Optional[httpx.AsyncClient] = None):
         """
         Initialize bundler.
 
         Args:
             config: Application configuration
+            session: Optional shared httpx client for connection reuse
         """
         self.config = config
         self.logger = logging.getLogger("transflow.bundler")
         self.http_client = HTTPClient(
             timeout=config.http_timeout,
             max_retries=config.http_max_retries,
+            session=session,
+        )
+        # Created on first use; shared by concurrent bundle() calls
+        self._download_semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AssetBundler":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client's own connection pool (a shared session is left open)."""
+        await self.http_client.aclose()
+
+    async def bundle_many(
+        self,
+        input_paths: list[Path],
+        output_dir: Path,
+        folder_pattern: Optional[str] = None,
+    ) -> list[Path]:
+        """
+        Bundle several Markdown files concurrently.
+
+        All bundles share one download limit, so at most
+        config.http_concurrent_downloads assets are fetched at a time overall.
+
+        Args:
+            input_paths: Input Markdown files
+            output_dir: Output directory root
+            folder_pattern: Folder naming pattern (e.g., "{year}/{date}-{slug}")
+
+        Returns:
+            Paths to the created bundle directories, in input order
+        """
+        return list(
+            await asyncio.gather(
+                *[self.bundle(path, output_dir, folder_pattern) for path in input_paths]
+            )
         )
 
     async def bundle(
@@ -56,11 +117,12 @@ class AssetBundler:
         try:
             # Read input file
             content = input_path.read_text(encoding="utf-8")
-            self.logger.info(f"Bundling: {input_path}")
+            self.logger.info("Bundling: %s", input_path)
 
             # Extract metadata from frontmatter
             metadata = self._extract_frontmatter(content)
-            title = metadata.get("title", input_path.stem)
+            # A null, empty or non-string title still yields a usable folder name
+            title = str(metadata.get("title") or input_path.stem)
 
             # Determine target directory
             if folder_pattern:
@@ -77,7 +139,7 @@ class AssetBundler:
 
             # Extract image URLs
             image_urls = self._extract_image_urls(content)
-            self.logger.info(f"Found {len(image_urls)} images to download")
+            self.logger.info("Found %d images to download", len(image_urls))
 
             # Download images
             downloads = await self._download_assets(image_urls, assets_dir)
@@ -92,17 +154,18 @@ class AssetBundler:
             # Generate meta.yaml
             meta = self._generate_metadata(metadata, downloads)
             meta_path = bundle_dir / "meta.yaml"
-            meta_path.write_text(yaml.dump(meta, allow_unicode=True, sort_keys=False), encoding="utf-8")
+            meta_yaml = yaml.dump(meta, Dumper=_SafeDumper, allow_unicode=True, sort_keys=False)
+            meta_path.write_text(meta_yaml, encoding="utf-8")
 
-            self.logger.info(f"Bundle created at: {bundle_dir}")
+            self.logger.info("Bundle created at: %s", bundle_dir)
 
             return bundle_dir
 
         except Exception as e:
-            self.logger.error(f"Bundling failed: {e}")
+            self.logger.error("Bundling failed: %s", e)
             raise
 
-    def _extract_frontmatter(self, content: str) -> dict[str, str]:
+    def _extract_frontmatter(self, content: str) -> dict[str, Any]:
         """
         Extract YAML frontmatter from Markdown.
 
@@ -112,12 +175,11 @@ class AssetBundler:
         Returns:
             Dictionary of metadata
         """
-        pattern = r"^---\s*\n(.*?)\n---\s*\n"
-        match = re.match(pattern, content, re.DOTALL)
+        match = _FRONTMATTER_RE.match(content)
 
         if match:
             try:
-                return yaml.safe_load(match.group(1)) or {}
+                return yaml.load(match.group(1), Loader=_SafeLoader) or {}
             except yaml.YAMLError:
                 return {}
 
@@ -133,9 +195,7 @@ class AssetBundler:
         Returns:
             List of image URLs
         """
-        # Pattern: ![alt](url) or ![alt](url "title")
-        pattern = r"!\[.*?\]\(([^)\s]+)(?:\s+[\"'].*?[\"'])?\)"
-        urls = re.findall(pattern, content)
+        urls = [match.group(2) for match in _IMAGE_LINK_RE.finditer(content)]
 
         # Filter for HTTP/HTTPS URLs only
         return [url for url in urls if url.startswith(("http://", "https://"))]
@@ -158,36 +218,64 @@ class AssetBundler:
         if not urls:
             return {}
 
-        # Limit concurrent downloads
-        semaphore = asyncio.Semaphore(self.config.http_concurrent_downloads)
+        # Download each distinct URL once, in document order
+        unique_urls = list(dict.fromkeys(urls))
+        results: list[Optional[str]] = [None] * len(unique_urls)
         downloads = {}
 
-        async def download_one(url: str) -> tuple[str, Optional[str]]:
-            async with semaphore:
-                try:
-                    filename = self._generate_asset_filename(url)
-                    local_path = dest_dir / filename
+        # Non-empty assets left by a previous bundle run are reused
+        existing: set[str] = set()
+        if dest_dir.is_dir():
+            existing = {
+                entry.name
+                for entry in dest_dir.iterdir()
+                if entry.is_file() and entry.stat().st_size > 0
+            }
 
-                    self.logger.debug(f"Downloading: {url}")
+        async def download_one(url: str) -> Optional[str]:
+            try:
+                filename = self._generate_asset_filename(url)
+                local_path = dest_dir / filename
+
+                if filename in existing:
+                    self.logger.debug("Already downloaded: %s", url)
+                    return filename
+
+                self.logger.debug("Downloading: %s", url)
+                async with self._download_limit():
                     await self.http_client.download_file(url, str(local_path))
 
-                    return url, filename
-                except Exception as e:
-                    self.logger.warning(f"Failed to download {url}: {e}")
-                    return url, None
+                return filename
+            except Exception as e:
+                self.logger.warning("Failed to download %s: %s", url, e)
+                return None
+
+        # Workers share one iterator, so only http_concurrent_downloads
+        # coroutines exist at a time regardless of the number of assets
+        pending = iter(enumerate(unique_urls))
 
-        # Execute downloads concurrently
-        results = await asyncio.gather(*[download_one(url) for url in urls])
+        async def worker() -> None:
+            for index, url in pending:
+                results[index] = await download_one(url)
+
+        worker_count = min(self.config.http_concurrent_downloads, len(unique_urls))
+        await asyncio.gather(*[worker() for _ in range(worker_count)])
 
         # Build mapping (skip failed downloads)
-        for url, filename in results:
+        for url, filename in zip(unique_urls, results):
             if filename:
                 downloads[url] = filename
 
-        self.logger.info(f"Downloaded {len(downloads)}/{len(urls)} assets")
+        self.logger.info("Downloaded %d/%d assets", len(downloads), len(unique_urls))
 
         return downloads
 
+    def _download_limit(self) -> asyncio.Semaphore:
+        """Get the semaphore bounding downloads across all bundles of this bundler."""
+        if self._download_semaphore is None:
+            self._download_semaphore = asyncio.Semaphore(self.config.http_concurrent_downloads)
+        return self._download_semaphore
+
     def _generate_asset_filename(self, url: str) -> str:
         """
         Generate filename for downloaded asset.
@@ -204,12 +292,12 @@ class AssetBundler:
         # If no name or extension, generate one
         if not original_name or "." not in original_name:
             # Use URL hash as filename
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+            url_hash = hashlib.blake2b(url.encode("utf-8"), digest_size=4).hexdigest()
             extension = ".jpg"  # Default extension
             return f"image_{url_hash}{extension}"
 
         # Sanitize filename
-        safe_name = re.sub(r"[^\w\-.]", "_", original_name)
+        safe_name = _UNSAFE_FILENAME_RE.sub("_", original_name)
 
         return safe_name
 
@@ -224,22 +312,24 @@ class AssetBundler:
         Returns:
             Updated Markdown content
         """
-        updated = content
+        if not downloads:
+            return content
 
-        for url, filename in downloads.items():
-            # Pattern: ![alt](url) or ![alt](url "title")
+        def replace(match: re.Match[str]) -> str:
+            filename = downloads.get(match.group(2))
+            if filename is None:
+                return match.group(0)
             # Replace with: ![alt](assets/filename)
-            pattern = rf"!\[(.*?)\]\({re.escape(url)}(\s+[\"'].*?[\"'])?\)"
-            replacement = rf"![\1](assets/{filename})"
-            updated = re.sub(pattern, replacement, updated)
+            return f"![{match.group(1)}](assets/{filename})"
 
-        return updated
+        # Single pass over the document for all downloaded images
+        return _IMAGE_LINK_RE.sub(replace, content)
 
     def _generate_metadata(
         self,
-        frontmatter: dict[str, str],
+        frontmatter: dict[str, Any],
         downloads: dict[str, str],
-    ) -> dict[str, any]:
+    ) -> dict[str, Any]:
         """
         Generate bundle metadata.
 
@@ -250,8 +340,6 @@ class AssetBundler:
         Returns:
             Metadata dictionary
         """
-        from datetime import datetime
-
         meta = {
             "bundled_at": datetime.now().isoformat(),
             "asset_count": len(downloads),
@@ -259,11 +347,8 @@ class AssetBundler:
         }
 
         # Include relevant frontmatter fields
-        if "title" in frontmatter:
-            meta["title"] = frontmatter["title"]
-        if "source_url" in frontmatter:
-            meta["source_url"] = frontmatter["source_url"]
-        if "fetched_at" in frontmatter:
-            meta["fetched_at"] = frontmatter["fetched_at"]
+        for key in ("title", "source_url", "fetched_at"):
+            if (value := frontmatter.get(key, _MISSING)) is not _MISSING:
+                meta[key] = value
 
         return meta
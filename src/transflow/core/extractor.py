@@ -1,19 +1,125 @@
 """Markdown extractor using Firecrawl API."""
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
+import os
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 from urllib.parse import urlparse
 
+import httpx
 import yaml
 
-from transflow.config import TransFlowConfig
+from transflow.config import TransFlowConfig, get_cache_dir
 from transflow.exceptions import APIError, ValidationError
 from transflow.utils.filesystem import FileSystemHelper
 from transflow.utils.http import HTTPClient
 
 
+# Frontmatter block as written by MarkdownDocument.to_markdown_with_frontmatter
+_FRONTMATTER_RE = re.compile(r"\A---\n(.*?\n)---\n\n", re.DOTALL)
+
+CACHE_BACKENDS = ("memory", "disk")
+
+# Scrapes kept in memory per extractor; the least recently used is evicted first
+_MEMORY_CACHE_SIZE = 128
+
+# HEAD responses that mean the page is gone; anything else (including servers
+# that reject HEAD or block bots) is left for Firecrawl to try
+_DEAD_URL_STATUSES = frozenset({404, 410})
+_HEAD_CHECK_TIMEOUT = 5.0
+
+# Characters that are never written unescaped: controls, line/paragraph
+# separators, the byte order mark and code points YAML does not allow
+_UNSAFE_CHARS = r"\x00-\x1f\x7f-\x9f\u2028\u2029\ud800-\udfff\ufeff\ufffe\uffff"
+_UNSAFE_CHAR_RE = re.compile(f"[{_UNSAFE_CHARS}]")
+
+# Strings that can be written as plain YAML scalars: no indicator characters
+# at the start and no characters that need quoting anywhere
+_PLAIN_SCALAR_RE = re.compile(
+    rf"[^ {_UNSAFE_CHARS}\-?:,\[\]{{}}#&*!|>'\"%@`]"
+    rf"[^{_UNSAFE_CHARS}\"'\\\[\]{{}},&*!|>%@`]*"
+)
+_YAML_RESOLVER = yaml.resolver.Resolver()
+
+
+def _yaml_scalar(value: Any) -> str:
+    """
+    Format a value as a YAML scalar.
+
+    Plain strings are written as-is (matching PyYAML's output); anything that
+    YAML would read differently is written as a double-quoted scalar. Values
+    that are not strings (Firecrawl may send a null title) are left to PyYAML.
+
+    Args:
+        value: Value to format
+
+    Returns:
+        YAML scalar text
+    """
+    if not isinstance(value, str):
+        dumped = yaml.dump(value, default_flow_style=True, allow_unicode=True, width=float("inf"))
+        return dumped.removesuffix("\n...\n").rstrip("\n")
+
+    if (
+        _PLAIN_SCALAR_RE.fullmatch(value)
+        and ": " not in value
+        and " #" not in value
+        and not value.endswith((":", " "))
+        and _YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False))
+        == "tag:yaml.org,2002:str"
+    ):
+        return value
+
+    # JSON strings are valid YAML double-quoted scalars; escape the characters
+    # JSON leaves raw but YAML rejects or folds
+    quoted = json.dumps(value, ensure_ascii=False)
+    return _UNSAFE_CHAR_RE.sub(lambda m: f"\\u{ord(m.group()):04x}", quoted)
+
+
+@functools.lru_cache(maxsize=256)
+def _url_error(url: str) -> Optional[str]:
+    """
+    Check that a URL is an http(s) URL with a host.
+
+    Plain ``http://host/...`` URLs are checked with string operations; only
+    unusual ones (upper-case scheme, userinfo, IPv6 hosts, ...) go through
+    urlparse.
+
+    Args:
+        url: URL to check
+
+    Returns:
+        None if the URL is valid, otherwise the reason it is not
+    """
+    for prefix in ("https://", "http://"):
+        if url.startswith(prefix):
+            start = len(prefix)
+            end = len(url)
+            for separator in "/?#":
+                index = url.find(separator, start)
+                if index != -1 and index < end:
+                    end = index
+            host = url[start:end]
+            if host and "@" not in host and "[" not in host:
+                return None
+            break
+
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https"):
+        return f"Invalid URL scheme: {parsed.scheme}. Must be http or https"
+    if not parsed.netloc:
+        return f"Invalid URL: {url}. Missing domain"
+    return None
+
+
 class MarkdownDocument:
     """Container for Markdown document with metadata."""
 
@@ -38,6 +144,23 @@ class MarkdownDocument:
         self.source_url = source_url
         self.fetched_at = fetched_at or datetime.now()
 
+    def frontmatter(self) -> str:
+        """
+        Build the YAML frontmatter block that precedes the content.
+
+        Returns:
+            Frontmatter including its ``---`` delimiters and trailing blank line
+        """
+        # The schema is fixed, so format the YAML directly instead of running
+        # PyYAML's emitter; fetched_at stays a quoted string as before
+        yaml_content = (
+            f"title: {_yaml_scalar(self.title)}\n"
+            f"source_url: {_yaml_scalar(self.source_url)}\n"
+            f"fetched_at: '{self.fetched_at.isoformat()}'\n"
+        )
+
+        return f"---\n{yaml_content}---\n\n"
+
     def to_markdown_with_frontmatter(self) -> str:
         """
         Convert to Markdown with YAML frontmatter.
@@ -45,39 +168,115 @@ class MarkdownDocument:
         Returns:
             Complete Markdown document with metadata
         """
-        frontmatter = {
-            "title": self.title,
-            "source_url": self.source_url,
-            "fetched_at": self.fetched_at.isoformat(),
-        }
+        return self.frontmatter() + self.content
+
+    def write(self, path: Path) -> None:
+        """
+        Write the document with its frontmatter as UTF-8.
+
+        The frontmatter and content are encoded and written separately, so a
+        large page is never copied into one combined string first.
+
+        Args:
+            path: Destination file path
+        """
+        with open(path, "wb") as f:
+            f.write(self.frontmatter().encode("utf-8"))
+            f.write(self.content.encode("utf-8"))
+
+    @classmethod
+    def from_markdown_with_frontmatter(cls, text: str) -> "MarkdownDocument":
+        """
+        Parse a document written by ``to_markdown_with_frontmatter``.
+
+        Args:
+            text: Markdown document with YAML frontmatter
 
-        yaml_content = yaml.dump(frontmatter, allow_unicode=True, sort_keys=False)
+        Returns:
+            MarkdownDocument with content and metadata
+
+        Raises:
+            ValueError: If the frontmatter is missing or incomplete
+        """
+        match = _FRONTMATTER_RE.match(text)
+        if not match:
+            raise ValueError("Missing frontmatter")
 
-        return f"---\n{yaml_content}---\n\n{self.content}"
+        try:
+            meta = yaml.safe_load(match.group(1)) or {}
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid frontmatter: {e}") from e
+        if not isinstance(meta, dict) or "source_url" not in meta:
+            raise ValueError("Incomplete frontmatter")
+
+        fetched_at = meta.get("fetched_at")
+        if isinstance(fetched_at, str):
+            fetched_at = datetime.fromisoformat(fetched_at)
+
+        return cls(
+            content=text[match.end():],
+            title=str(meta.get("title", "Untitled")),
+            source_url=str(meta["source_url"]),
+            fetched_at=fetched_at if isinstance(fetched_at, datetime) else None,
+        )
 
 
 class MarkdownExtractor:
     """Extract web content and convert to Markdown using Firecrawl."""
 
-    def __init__(self, config: TransFlowConfig):
+    def __init__(
+        self,
+        config: TransFlowConfig,
+        session: Optional[httpx.AsyncClient] = None,
+        cache_backend: str = "disk",
+    ):
         """
         Initialize extractor.
 
+        Scrapes are cached for config.firecrawl_cache_ttl seconds (disabled
+        when 0), in a bounded in-memory LRU and, with the "disk" backend,
+        under the TransFlow cache directory so later runs can reuse them.
+        Expired disk entries are deleted the first time a scrape is stored.
+
         Args:
             config: Application configuration
+            session: Optional shared httpx client for connection reuse
+            cache_backend: Where to cache scrapes ("memory" or "disk")
         """
         self.config = config
         self.logger = logging.getLogger("transflow.extractor")
 
         if not config.firecrawl_api_key:
             raise ValidationError("Firecrawl API key is required (TRANSFLOW_FIRECRAWL_API_KEY)")
+        if cache_backend not in CACHE_BACKENDS:
+            raise ValidationError(
+                f"Invalid cache backend: {cache_backend}. Must be one of {list(CACHE_BACKENDS)}"
+            )
+
+        self.cache_backend = cache_backend
+        self._cache: OrderedDict[str, tuple[float, MarkdownDocument]] = OrderedDict()
+        self._disk_cache_pruned = False
+        self._session = session
+        # Created on first use; bounds concurrent scrapes across fetch() calls
+        self._scrape_semaphore: Optional[asyncio.Semaphore] = None
 
         self.http_client = HTTPClient(
             timeout=config.firecrawl_timeout,
             max_retries=config.http_max_retries,
             headers={"Authorization": f"Bearer {config.firecrawl_api_key}"},
+            session=session,
         )
 
+    async def __aenter__(self) -> "MarkdownExtractor":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client's own connection pool (a shared session is left open)."""
+        await self.http_client.aclose()
+
     def validate_url(self, url: str) -> bool:
         """
         Validate URL format and scheme.
@@ -92,14 +291,12 @@ class MarkdownExtractor:
             ValidationError: If URL is invalid
         """
         try:
-            parsed = urlparse(url)
-            if parsed.scheme not in ("http", "https"):
-                raise ValidationError(f"Invalid URL scheme: {parsed.scheme}. Must be http or https")
-            if not parsed.netloc:
-                raise ValidationError(f"Invalid URL: {url}. Missing domain")
-            return True
+            error = _url_error(url)
         except Exception as e:
             raise ValidationError(f"Invalid URL: {url}. Error: {e}") from e
+        if error:
+            raise ValidationError(error)
+        return True
 
     async def fetch(self, url: str) -> MarkdownDocument:
         """
@@ -116,18 +313,28 @@ class MarkdownExtractor:
             APIError: If Firecrawl API fails
         """
         self.validate_url(url)
+
+        cached = self._get_cached(url)
+        if cached is not None:
+            self.logger.info(f"Using cached content for: {url}")
+            return cached
+
+        if self.config.firecrawl_prevalidate:
+            await self._head_check(url)
+
         self.logger.info(f"Fetching content from: {url}")
 
         try:
             # Call Firecrawl API
             api_url = f"{self.config.firecrawl_base_url}/scrape"
-            response = await self.http_client.post(
-                api_url,
-                json={
-                    "url": url,
-                    "formats": ["markdown"],
-                },
-            )
+            async with self._scrape_limit():
+                response = await self.http_client.post(
+                    api_url,
+                    json={
+                        "url": url,
+                        "formats": ["markdown"],
+                    },
+                )
 
             data = response.json()
 
@@ -143,11 +350,14 @@ class MarkdownExtractor:
 
             self.logger.info(f"Successfully fetched content (title: {title})")
 
-            return MarkdownDocument(
+            document = MarkdownDocument(
                 content=markdown_content,
                 title=title,
                 source_url=url,
             )
+            self._store_cached(url, document)
+
+            return document
 
         except APIError:
             raise
@@ -155,6 +365,144 @@ class MarkdownExtractor:
             self.logger.error(f"Failed to fetch content: {e}")
             raise APIError(f"Firecrawl API error: {e}") from e
 
+    async def fetch_many(self, urls: list[str]) -> list[MarkdownDocument]:
+        """
+        Fetch several URLs concurrently.
+
+        All URLs are validated before anything is fetched. At most
+        config.http_concurrent_downloads scrapes run at a time; cache lookups
+        and HEAD checks for the other URLs proceed while those are in flight.
+
+        Args:
+            urls: Target URLs
+
+        Returns:
+            MarkdownDocuments, in input order
+
+        Raises:
+            ValidationError: If a URL is invalid
+            APIError: If Firecrawl API fails
+        """
+        for url in urls:
+            self.validate_url(url)
+        return list(await asyncio.gather(*[self.fetch(url) for url in urls]))
+
+    def _scrape_limit(self) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent Firecrawl scrapes."""
+        if self._scrape_semaphore is None:
+            self._scrape_semaphore = asyncio.Semaphore(self.config.http_concurrent_downloads)
+        return self._scrape_semaphore
+
+    async def _head_check(self, url: str) -> None:
+        """
+        Check that a URL exists before paying for a scrape.
+
+        Only unreachable hosts and 404/410 responses fail the check; timeouts,
+        other statuses and servers that reject HEAD are let through.
+
+        Args:
+            url: Target URL
+
+        Raises:
+            ValidationError: If the URL is known to be dead
+        """
+        try:
+            if self._session is not None:
+                response = await self._session.head(
+                    url, follow_redirects=True, timeout=_HEAD_CHECK_TIMEOUT
+                )
+            else:
+                async with httpx.AsyncClient(timeout=_HEAD_CHECK_TIMEOUT) as client:
+                    response = await client.head(url, follow_redirects=True)
+        except httpx.ConnectError as e:
+            raise ValidationError(f"URL is not reachable: {url} ({e})") from e
+        except httpx.HTTPError as e:
+            self.logger.debug(f"HEAD check inconclusive for {url}: {e}")
+            return
+
+        if response.status_code in _DEAD_URL_STATUSES:
+            raise ValidationError(f"URL returned HTTP {response.status_code}: {url}")
+
+    def _get_cached(self, url: str) -> Optional[MarkdownDocument]:
+        """
+        Get a cached scrape of a URL if it is still fresh.
+
+        Args:
+            url: Source URL
+
+        Returns:
+            Cached MarkdownDocument, or None on a miss or when caching is disabled
+        """
+        ttl = self.config.firecrawl_cache_ttl
+        if ttl <= 0:
+            return None
+
+        key = _cache_key(url)
+        now = time.time()
+
+        entry = self._cache.get(key)
+        if entry is not None:
+            if now - entry[0] < ttl:
+                self._cache.move_to_end(key)
+                return entry[1]
+            del self._cache[key]
+
+        if self.cache_backend != "disk":
+            return None
+
+        path = _cache_path(key)
+        try:
+            mtime = path.stat().st_mtime
+            if now - mtime >= ttl:
+                return None
+            document = MarkdownDocument.from_markdown_with_frontmatter(
+                path.read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            return None
+
+        self._remember(key, mtime, document)
+        return document
+
+    def _store_cached(self, url: str, document: MarkdownDocument) -> None:
+        """
+        Cache a fresh scrape of a URL.
+
+        Disk write failures are ignored: the cache is only an optimization.
+
+        Args:
+            url: Source URL
+            document: Scraped document
+        """
+        if self.config.firecrawl_cache_ttl <= 0:
+            return
+
+        key = _cache_key(url)
+        self._remember(key, time.time(), document)
+
+        if self.cache_backend != "disk":
+            return
+
+        if not self._disk_cache_pruned:
+            self._disk_cache_pruned = True
+            _prune_disk_cache(self.config.firecrawl_cache_ttl)
+
+        path = _cache_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            document.write(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.debug(f"Could not write scrape cache: {e}")
+
+    def _remember(self, key: str, stored_at: float, document: MarkdownDocument) -> None:
+        """Add a scrape to the in-memory LRU, evicting the oldest beyond its size."""
+        self._cache[key] = (stored_at, document)
+        self._cache.move_to_end(key)
+        while len(self._cache) > _MEMORY_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
     async def fetch_and_save(self, url: str, output_path: Optional[Path] = None) -> Path:
         """
         Fetch content and save to file.
@@ -176,13 +524,76 @@ class MarkdownExtractor:
             filename = FileSystemHelper.generate_filename_from_url(url)
             output_path = Path.cwd() / filename
 
-        # Ensure parent directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write file
-        markdown_with_frontmatter = document.to_markdown_with_frontmatter()
-        output_path.write_text(markdown_with_frontmatter, encoding="utf-8")
+        # Write off the event loop so other fetches keep going meanwhile
+        await asyncio.to_thread(_save_document, document, output_path)
 
         self.logger.info(f"Saved to: {output_path}")
 
         return output_path
+
+    async def fetch_and_save_many(
+        self, urls: list[str], output_dir: Optional[Path] = None
+    ) -> list[Path]:
+        """
+        Fetch several URLs concurrently and save each to its own file.
+
+        Like ``fetch_many``, all URLs are validated first and scrapes are
+        bounded by config.http_concurrent_downloads.
+
+        Args:
+            urls: Source URLs
+            output_dir: Directory for the files (current directory if None);
+                filenames are generated from the URLs
+
+        Returns:
+            Paths to the saved files, in input order
+
+        Raises:
+            ValidationError: If a URL is invalid
+            APIError: If a fetch fails
+        """
+        for url in urls:
+            self.validate_url(url)
+        output_dir = output_dir or Path.cwd()
+        return list(
+            await asyncio.gather(
+                *[
+                    self.fetch_and_save(
+                        url, output_dir / FileSystemHelper.generate_filename_from_url(url)
+                    )
+                    for url in urls
+                ]
+            )
+        )
+
+
+def _save_document(document: MarkdownDocument, output_path: Path) -> None:
+    """Write a document, creating its parent directory if needed."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    document.write(output_path)
+
+
+def _cache_key(url: str) -> str:
+    """Get the cache key for a URL."""
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cache_path(key: str) -> Path:
+    """Get the on-disk cache file for a cache key."""
+    return get_cache_dir() / "scrapes" / f"{key}.md"
+
+
+def _prune_disk_cache(ttl: int) -> None:
+    """Delete cached scrapes older than the TTL; errors are ignored."""
+    cutoff = time.time() - ttl
+    try:
+        paths = list((get_cache_dir() / "scrapes").iterdir())
+    except OSError:
+        return
+
+    for path in paths:
+        try:
+            if path.stat().st_mtime <= cutoff:
+                path.unlink()
+        except OSError:
+            continue
@@ -1,24 +1,135 @@
 """LLM client for translation using OpenAI API."""
 
+import asyncio
+import functools
+import json
 import logging
-from typing import Optional
+import re
+from typing import Any, Optional
 
-from openai import AsyncOpenAI, OpenAI
+import httpx
+from openai import DEFAULT_MAX_RETRIES, DEFAULT_TIMEOUT, AsyncOpenAI, OpenAI
+from openai.types.chat import ChatCompletionSystemMessageParam
 
 from transflow.config import TransFlowConfig
 from transflow.exceptions import APIError, TranslationError
 
+# CJK ideographs, kana and hangul, which tokenize at roughly one token per character
+_CJK_RE = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]")
+
+# Seconds between status checks of a Batch API job
+_BATCH_POLL_INTERVAL = 30.0
+# Batch API job states after which no more progress will be made
+_BATCH_FINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Translations remembered per LLMClient; the least recently used are evicted
+_TRANSLATION_CACHE_SIZE = 10_000
+
+# Display names used in translation prompts; other codes are used verbatim
+LANGUAGE_NAMES = {
+    "zh": "Chinese",
+    "en": "English",
+    "ja": "Japanese",
+    "ko": "Korean",
+    "fr": "French",
+    "de": "German",
+    "es": "Spanish",
+}
+
+# Request parts that are the same for every call; the OpenAI client only
+# reads them, so they are shared rather than rebuilt per request
+_SYSTEM_MESSAGE: ChatCompletionSystemMessageParam = {
+    "role": "system",
+    "content": "You are a professional translator. Translate the given text accurately while preserving formatting and tone.",
+}
+_BATCH_SYSTEM_MESSAGE: ChatCompletionSystemMessageParam = {
+    "role": "system",
+    "content": "You are a professional translator. Translate the given text accurately while preserving the ---SPLIT--- markers exactly as they appear.",
+}
+# Disable "thinking" output on reasoning models served behind OpenAI-compatible APIs
+_EXTRA_BODY = {
+    "enable_thinking": False,
+    "chat_template_kwargs": {"enable_thinking": False},
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _prompt_prefix(target_language: str, source_language: str) -> str:
+    """
+    Get the instruction placed before the text in a translation prompt.
+
+    Args:
+        target_language: Target language code
+        source_language: Source language code, or "auto"
+
+    Returns:
+        Prompt prefix ending in a blank line
+    """
+    target_lang_name = LANGUAGE_NAMES.get(target_language, target_language)
+
+    if source_language == "auto":
+        return f"Translate the following text to {target_lang_name}:\n\n"
+    source_lang_name = LANGUAGE_NAMES.get(source_language, source_language)
+    return f"Translate the following text from {source_lang_name} to {target_lang_name}:\n\n"
+
+
+@functools.lru_cache(maxsize=8)
+def _get_sync_client(api_key: str, base_url: Optional[str]) -> OpenAI:
+    """
+    Get a process-wide synchronous OpenAI client.
+
+    Unlike the async client, which is tied to the event loop it first runs on,
+    the sync client can safely be reused by every LLMClient.
+
+    Args:
+        api_key: OpenAI API key
+        base_url: API base URL (None for the OpenAI default)
+
+    Returns:
+        OpenAI client
+    """
+    return OpenAI(api_key=api_key, base_url=base_url)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoder(model: str) -> Optional[Any]:
+    """
+    Get the tiktoken encoder for a model.
+
+    Args:
+        model: Model name
+
+    Returns:
+        tiktoken Encoding, or None if tiktoken is not installed
+    """
+    try:
+        import tiktoken  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Unknown (e.g. self-hosted) model: use the common OpenAI encoding
+        return tiktoken.get_encoding("cl100k_base")
+
 
 class LLMClient:
     """Client for interacting with Large Language Models."""
 
-    def __init__(self, config: TransFlowConfig, model: Optional[str] = None):
+    def __init__(
+        self,
+        config: TransFlowConfig,
+        model: Optional[str] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Initialize LLM client.
 
         Args:
             config: Application configuration
             model: Model name (uses config default if not provided)
+            session: Optional shared httpx client for the async OpenAI client
 
         Raises:
             APIError: If API key is missing
@@ -26,25 +137,34 @@ class LLMClient:
         self.config = config
         self.model = model or config.openai_model
         self.logger = logging.getLogger("transflow.llm")
+        # (text, target_language, source_language) -> translation
+        self._translations: dict[tuple[str, str, str], str] = {}
 
         if not config.openai_api_key:
             raise APIError("OpenAI API key is required (TRANSFLOW_OPENAI_API_KEY)")
 
-        # Initialize both sync and async clients
+        # The sync client is created on first use (see ``client``)
         # Only set base_url if it's not the default OpenAI URL
         base_url = None
         if config.openai_base_url and config.openai_base_url != "https://api.openai.com/v1":
             base_url = config.openai_base_url
 
-        self.client = OpenAI(
-            api_key=config.openai_api_key,
-            base_url=base_url,
-        )
+        self._base_url = base_url
+        # Explicit timeout and retries: otherwise the SDK adopts the shared
+        # session's timeout, which is sized for downloads, not completions
         self.async_client = AsyncOpenAI(
             api_key=config.openai_api_key,
             base_url=base_url,
+            http_client=session,
+            timeout=DEFAULT_TIMEOUT,
+            max_retries=DEFAULT_MAX_RETRIES,
         )
 
+    @functools.cached_property
+    def client(self) -> OpenAI:
+        """Synchronous OpenAI client, shared by clients with the same key and URL."""
+        return _get_sync_client(self.config.openai_api_key, self._base_url)
+
     async def translate_text(
         self,
         text: str,
@@ -68,31 +188,25 @@ class LLMClient:
         if not text.strip():
             return text
 
+        cached = self._get_translation(text, target_language, source_language)
+        if cached is not None:
+            return cached
+
         prompt = self._build_translation_prompt(text, target_language, source_language)
 
         try:
             response = await self.async_client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a professional translator. Translate the given text accurately while preserving formatting and tone.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+                messages=[_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
                 temperature=0.3,
-                extra_body={
-                    "enable_thinking": False,
-                    "chat_template_kwargs":{
-                        "enable_thinking": False
-                    }
-                }                
+                extra_body=_EXTRA_BODY,
             )
 
             translated = response.choices[0].message.content.strip()
 
             self.logger.debug(f"Translated: {text[:50]}... -> {translated[:50]}...")
 
+            self._store_translation(text, target_language, source_language, translated)
             return translated
 
         except Exception as e:
@@ -122,12 +236,22 @@ class LLMClient:
         if not texts:
             return []
 
-        # Filter out empty texts but preserve indices
-        non_empty_indices = [i for i, t in enumerate(texts) if t.strip()]
-        non_empty_texts = [texts[i] for i in non_empty_indices]
+        # Skip empty and already translated texts; repeated texts are sent once
+        results = texts[:]
+        pending: dict[str, list[int]] = {}
+        for i, t in enumerate(texts):
+            if not t.strip():
+                continue
+            cached = self._get_translation(t, target_language, source_language)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(t, []).append(i)
+
+        if not pending:
+            return results
 
-        if not non_empty_texts:
-            return texts
+        non_empty_texts = list(pending)
 
         # Combine texts with markers for splitting later
         combined_text = "\n\n---SPLIT---\n\n".join(non_empty_texts)
@@ -136,26 +260,18 @@ class LLMClient:
         try:
             response = await self.async_client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a professional translator. Translate the given text accurately while preserving the ---SPLIT--- markers exactly as they appear.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+                messages=[_BATCH_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
                 temperature=0.3,
-                extra_body={
-                    "enable_thinking": False,
-                    "chat_template_kwargs":{
-                        "enable_thinking": False
-                    }
-                }
+                extra_body=_EXTRA_BODY,
             )
 
             translated_combined = response.choices[0].message.content.strip()
 
             # Split back into individual translations
-            translated_texts = translated_combined.split("\n\n---SPLIT---\n\n")
+            translated_texts = [
+                translated.strip()
+                for translated in translated_combined.split("\n\n---SPLIT---\n\n")
+            ]
 
             # Handle case where split count doesn't match
             if len(translated_texts) != len(non_empty_texts):
@@ -163,21 +279,149 @@ class LLMClient:
                     f"Translation split mismatch: expected {len(non_empty_texts)}, got {len(translated_texts)}"
                 )
                 # Fall back to individual translation
-                return await self._translate_individually(texts, target_language, source_language)
+                translated_texts = await self._translate_individually(
+                    non_empty_texts, target_language, source_language
+                )
+            else:
+                self.logger.info(f"Batch translated {len(non_empty_texts)} texts")
+                for text, translated in zip(non_empty_texts, translated_texts):
+                    self._store_translation(text, target_language, source_language, translated)
+
+        except Exception as e:
+            self.logger.error(f"Batch translation failed: {e}")
+            # Fall back to individual translation
+            translated_texts = await self._translate_individually(
+                non_empty_texts, target_language, source_language
+            )
+
+        # Reconstruct full list with empty and cached texts preserved
+        for text, translated in zip(non_empty_texts, translated_texts):
+            for idx in pending[text]:
+                results[idx] = translated
+
+        return results
+
+    async def translate_batch_offline(
+        self,
+        texts: list[str],
+        target_language: str,
+        source_language: str = "auto",
+        poll_interval: float = _BATCH_POLL_INTERVAL,
+    ) -> list[str]:
+        """
+        Translate texts through the provider's Batch API.
+
+        Each text becomes one request in a JSONL file that is uploaded and
+        submitted as a batch job, which is then polled until it finishes.
+        Batch jobs are cheaper than live requests but can take minutes to
+        hours, so this suits non-interactive runs only. Texts the job did not
+        translate are retried with live requests.
+
+        Args:
+            texts: List of texts to translate
+            target_language: Target language code
+            source_language: Source language
+            poll_interval: Seconds between job status checks
 
-            # Reconstruct full list with empty texts preserved
-            results = texts[:]
-            for idx, translated in zip(non_empty_indices, translated_texts):
-                results[idx] = translated.strip()
+        Returns:
+            List of translated texts (same order as input)
 
-            self.logger.info(f"Batch translated {len(non_empty_texts)} texts")
+        Raises:
+            TranslationError: If the batch job cannot be run
+        """
+        results = texts[:]
+        pending: dict[str, list[int]] = {}
+        for i, t in enumerate(texts):
+            if not t.strip():
+                continue
+            cached = self._get_translation(t, target_language, source_language)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(t, []).append(i)
 
+        if not pending:
             return results
 
+        requests = list(pending)
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": str(number),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": [
+                            _SYSTEM_MESSAGE,
+                            {
+                                "role": "user",
+                                "content": self._build_translation_prompt(
+                                    text, target_language, source_language
+                                ),
+                            },
+                        ],
+                        "temperature": 0.3,
+                        **_EXTRA_BODY,
+                    },
+                },
+                ensure_ascii=False,
+            )
+            for number, text in enumerate(requests)
+        ]
+
+        try:
+            input_file = await self.async_client.files.create(
+                file=("transflow-batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = await self.async_client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            self.logger.info(f"Submitted batch job {batch.id} with {len(requests)} texts")
+
+            while batch.status not in _BATCH_FINAL_STATES:
+                await asyncio.sleep(poll_interval)
+                batch = await self.async_client.batches.retrieve(batch.id)
+                self.logger.debug(f"Batch job {batch.id}: {batch.status}")
+
+            translated: dict[int, str] = {}
+            if batch.output_file_id:
+                output = await self.async_client.files.content(batch.output_file_id)
+                for line in output.text.splitlines():
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    response = record.get("response") or {}
+                    if response.get("status_code") != 200:
+                        continue
+                    content = response["body"]["choices"][0]["message"]["content"]
+                    translated[int(record["custom_id"])] = content.strip()
         except Exception as e:
-            self.logger.error(f"Batch translation failed: {e}")
-            # Fall back to individual translation
-            return await self._translate_individually(texts, target_language, source_language)
+            self.logger.error(f"Batch job failed: {e}")
+            raise TranslationError(f"Failed to run batch translation: {e}") from e
+
+        if batch.status != "completed":
+            self.logger.warning(f"Batch job {batch.id} ended as {batch.status}")
+
+        missing = [text for number, text in enumerate(requests) if number not in translated]
+        if missing:
+            self.logger.warning(f"Batch job left {len(missing)} texts untranslated; retrying live")
+            retried = await self._translate_individually(missing, target_language, source_language)
+            retried_by_text = dict(zip(missing, retried))
+
+        for number, text in enumerate(requests):
+            if number in translated:
+                translation = translated[number]
+                self._store_translation(text, target_language, source_language, translation)
+            else:
+                translation = retried_by_text[text]
+            for idx in pending[text]:
+                results[idx] = translation
+
+        return results
 
     async def _translate_individually(
         self,
@@ -186,7 +430,9 @@ class LLMClient:
         source_language: str,
     ) -> list[str]:
         """
-        Translate texts one by one (fallback method).
+        Translate texts one request per text (fallback method).
+
+        Requests run concurrently, at most config.translate_concurrency at a time.
 
         Args:
             texts: List of texts to translate
@@ -194,16 +440,35 @@ class LLMClient:
             source_language: Source language
 
         Returns:
-            List of translated texts
+            List of translated texts (same order as input)
         """
-        results = []
-        for text in texts:
-            if text.strip():
-                translated = await self.translate_text(text, target_language, source_language)
-                results.append(translated)
-            else:
-                results.append(text)
-        return results
+        semaphore = asyncio.Semaphore(self.config.translate_concurrency)
+
+        async def translate_one(text: str) -> str:
+            if not text.strip():
+                return text
+            async with semaphore:
+                return await self.translate_text(text, target_language, source_language)
+
+        return list(await asyncio.gather(*[translate_one(text) for text in texts]))
+
+    def _get_translation(
+        self, text: str, target_language: str, source_language: str
+    ) -> Optional[str]:
+        """Get a remembered translation, marking it as recently used."""
+        key = (text, target_language, source_language)
+        translated = self._translations.pop(key, None)
+        if translated is not None:
+            self._translations[key] = translated
+        return translated
+
+    def _store_translation(
+        self, text: str, target_language: str, source_language: str, translated: str
+    ) -> None:
+        """Remember a translation, evicting the least recently used if full."""
+        self._translations[(text, target_language, source_language)] = translated
+        if len(self._translations) > _TRANSLATION_CACHE_SIZE:
+            del self._translations[next(iter(self._translations))]
 
     def _build_translation_prompt(
         self,
@@ -222,27 +487,14 @@ class LLMClient:
         Returns:
             Translation prompt
         """
-        language_names = {
-            "zh": "Chinese",
-            "en": "English",
-            "ja": "Japanese",
-            "ko": "Korean",
-            "fr": "French",
-            "de": "German",
-            "es": "Spanish",
-        }
-
-        target_lang_name = language_names.get(target_language, target_language)
-
-        if source_language == "auto":
-            return f"Translate the following text to {target_lang_name}:\n\n{text}"
-        else:
-            source_lang_name = language_names.get(source_language, source_language)
-            return f"Translate the following text from {source_lang_name} to {target_lang_name}:\n\n{text}"
+        return _prompt_prefix(target_language, source_language) + text
 
     def estimate_tokens(self, text: str) -> int:
         """
-        Estimate token count for text (rough approximation).
+        Estimate token count for text.
+
+        Counts exactly with tiktoken when it is installed
+        (``pip install transflow[tokens]``), otherwise approximates.
 
         Args:
             text: Input text
@@ -250,6 +502,12 @@ class LLMClient:
         Returns:
             Estimated token count
         """
-        # Rough estimation: 1 token ≈ 4 characters for English, ≈ 1.5 for Chinese
-        # Use conservative estimate
-        return len(text) // 3
+        encoder = _get_encoder(self.model)
+        if encoder is not None:
+            return len(encoder.encode(text, disallowed_special=()))
+
+        # Rough estimation without tiktoken: CJK characters are about one token
+        # each, other text about 3-4 characters per token (use the
+        # conservative end)
+        cjk = len(_CJK_RE.findall(text))
+        return (len(text) - cjk) // 3 + cjk
@@ -0,0 +1,106 @@
+"""markdown-it-py based parsing for the translator.
+
+markdown-it-py tokenizes a document into a flat token stream, which is
+considerably faster than building marko's element tree and lets the
+translatable text be collected in a single linear pass.
+"""
+
+from markdown_it import MarkdownIt
+from markdown_it.token import Token
+
+# Blocks whose inline content is translated; code and HTML blocks carry no
+# inline tokens, so they are never visited
+_TRANSLATABLE_BLOCKS = frozenset({"paragraph_open", "heading_open"})
+
+_LINE_BREAKS = frozenset({"softbreak", "hardbreak"})
+
+
+class MarkdownItBackend:
+    """Parse, collect and render Markdown with markdown-it-py."""
+
+    def __init__(self) -> None:
+        """Initialize the CommonMark parser."""
+        self.md = MarkdownIt("commonmark")
+
+    def parse(self, content: str) -> list[Token]:
+        """
+        Tokenize Markdown content.
+
+        Args:
+            content: Markdown text
+
+        Returns:
+            Flat list of block tokens
+        """
+        return self.md.parse(content)
+
+    def render(self, tokens: list[Token]) -> str:
+        """
+        Render tokens to HTML, as ``marko.render`` does for the marko parser.
+
+        Args:
+            tokens: Tokens from ``parse``
+
+        Returns:
+            Rendered document
+        """
+        html: str = self.md.renderer.render(tokens, self.md.options, {})
+        return html
+
+    def extract_translatable(self, tokens: list[Token]) -> list[tuple[Token, str]]:
+        """
+        Collect the inline tokens of paragraphs and headings with their text.
+
+        Args:
+            tokens: Tokens from ``parse``
+
+        Returns:
+            List of (inline token, text) tuples in document order
+        """
+        translatable = []
+        for index, token in enumerate(tokens[:-1]):
+            if token.type not in _TRANSLATABLE_BLOCKS:
+                continue
+            inline = tokens[index + 1]
+            if inline.type != "inline":
+                continue
+            text = _extract_text(inline.children or [])
+            if text.strip():
+                translatable.append((inline, text))
+        return translatable
+
+    def replace_text(self, inline: Token, new_text: str) -> None:
+        """
+        Replace an inline token's content with plain translated text.
+
+        The text is rendered escaped, so it cannot inject HTML or Markdown.
+        Images are kept after it, so their assets stay in the document.
+
+        Args:
+            inline: Inline token from ``extract_translatable``
+            new_text: Translated text
+        """
+        text = Token("text", "", 0)
+        text.content = new_text
+        images = [child for child in inline.children or [] if child.type == "image"]
+        inline.content = new_text
+        inline.children = [text, *images]
+
+
+def _extract_text(children: list[Token]) -> str:
+    """
+    Concatenate the text of inline tokens.
+
+    Code spans and inline HTML are left out, and links contribute only their
+    text, never their URL.
+    """
+    parts = []
+    for child in children:
+        if child.type == "text":
+            parts.append(child.content)
+        elif child.type in _LINE_BREAKS:
+            parts.append("\n")
+        elif child.type == "image":
+            # Alt text is translated, the image path is not
+            parts.append(_extract_text(child.children or []))
+    return "".join(parts)
@@ -0,0 +1,129 @@
+"""Persistent cache of translated text segments."""
+
+import hashlib
+import logging
+import sqlite3
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Optional
+
+from transflow.config import get_cache_dir
+
+# Stay below SQLite's default limit on variables per statement (999)
+_QUERY_CHUNK_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    key BLOB PRIMARY KEY,
+    model TEXT NOT NULL,
+    target_language TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    created_at INTEGER NOT NULL
+)
+"""
+
+
+class TranslationCache:
+    """
+    SQLite-backed cache mapping source text to its translation.
+
+    Entries are keyed by a hash of the model, target language and text, so
+    changing either of the first two never returns a stale translation.
+    Database errors are logged and otherwise ignored: the cache is only an
+    optimization.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize translation cache.
+
+        Args:
+            path: SQLite database file (defaults to <cache dir>/translations.db)
+        """
+        self.path = path or get_cache_dir() / "translations.db"
+        self.logger = logging.getLogger("transflow.translation_cache")
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def get_many(self, model: str, target_language: str, texts: Iterable[str]) -> dict[str, str]:
+        """
+        Look up cached translations.
+
+        Args:
+            model: LLM model name
+            target_language: Target language code
+            texts: Source texts
+
+        Returns:
+            Dictionary mapping each cached source text to its translation
+        """
+        keys = {_cache_key(model, target_language, text): text for text in texts}
+        if not keys:
+            return {}
+
+        found = {}
+        try:
+            connection = self._connect()
+            key_list = list(keys)
+            for start in range(0, len(key_list), _QUERY_CHUNK_SIZE):
+                chunk = key_list[start : start + _QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = connection.execute(
+                    f"SELECT key, translation FROM translations WHERE key IN ({placeholders})",
+                    chunk,
+                )
+                for key, translation in rows:
+                    found[keys[key]] = translation
+        except sqlite3.Error as e:
+            self.logger.debug(f"Could not read translation cache: {e}")
+
+        return found
+
+    def put_many(self, model: str, target_language: str, translations: dict[str, str]) -> None:
+        """
+        Store translations.
+
+        Args:
+            model: LLM model name
+            target_language: Target language code
+            translations: Dictionary mapping source text to translation
+        """
+        if not translations:
+            return
+
+        now = int(time.time())
+        rows = [
+            (_cache_key(model, target_language, text), model, target_language, translated, now)
+            for text, translated in translations.items()
+        ]
+        try:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)", rows
+                )
+        except sqlite3.Error as e:
+            self.logger.debug(f"Could not write translation cache: {e}")
+
+    def close(self) -> None:
+        """Close the database connection if it was opened."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use, creating it if needed."""
+        if self._connection is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                raise sqlite3.OperationalError(str(e)) from e
+            connection = sqlite3.connect(self.path)
+            connection.execute(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+
+def _cache_key(model: str, target_language: str, text: str) -> bytes:
+    """Get the cache key for a translation."""
+    return hashlib.sha256(f"{model}|{target_language}|{text}".encode()).digest()
@@ -7,18 +7,56 @@ Key design principles:
 4. Handle batch translations efficiently
 """
 
+import asyncio
 import logging
+import re
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any, Optional
 
+import httpx
 import marko
-from marko.block import BlockElement, CodeBlock, FencedCode, Heading, HTMLBlock, Paragraph, Quote
-from marko.inline import CodeSpan, Image, Link, RawText
+from marko.block import CodeBlock, FencedCode, Heading, HTMLBlock, Paragraph, Quote
+from marko.inline import CodeSpan, Image, RawText
 
 from transflow.config import TransFlowConfig
 from transflow.core.llm import LLMClient
+from transflow.core.markdown_it_backend import MarkdownItBackend
+from transflow.core.translation_cache import TranslationCache
 from transflow.exceptions import TranslationError
 
+# YAML frontmatter is metadata, not prose: it is kept verbatim and never
+# sent to the LLM
+_FRONTMATTER_RE = re.compile(r"\A---[ \t]*\n.*?\n---[ \t]*\n", re.DOTALL)
+
+# How the AST walk treats a node type
+_SKIP = 0  # code and HTML blocks: neither translated nor descended into
+_TRANSLATE = 1  # blocks whose inline text is translated
+_DESCEND = 2  # everything else: only its children are visited
+
+_node_kinds: dict[type, int] = {}
+
+
+def _node_kind(node_type: type) -> int:
+    """
+    Classify a node type for the AST walk.
+
+    Memoized per type, so each node costs one dict lookup instead of two
+    isinstance() checks against tuples; subclasses are classified like their
+    bases.
+    """
+    kind = _node_kinds.get(node_type)
+    if kind is None:
+        if issubclass(node_type, (CodeBlock, FencedCode, HTMLBlock)):
+            kind = _SKIP
+        elif issubclass(node_type, (Paragraph, Heading, Quote)):
+            kind = _TRANSLATE
+        else:
+            kind = _DESCEND
+        _node_kinds[node_type] = kind
+    return kind
+
+
 class MarkdownTranslator:
     """Translate Markdown content while preserving structure."""
 
@@ -27,6 +65,7 @@ class MarkdownTranslator:
         config: TransFlowConfig,
         model: Optional[str] = None,
         target_language: str = "zh",
+        session: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize translator.
@@ -35,11 +74,15 @@ class MarkdownTranslator:
             config: Application configuration
             model: LLM model name
             target_language: Target language code
+            session: Optional shared httpx client for connection reuse
         """
         self.config = config
         self.target_language = target_language
         self.logger = logging.getLogger("transflow.translator")
-        self.llm_client = LLMClient(config, model)
+        self.llm_client = LLMClient(config, model, session=session)
+        self.cache = TranslationCache() if config.translate_cache else None
+        # None means the default marko parser
+        self.markdown_it = MarkdownItBackend() if config.translate_parser == "markdown-it" else None
 
     async def translate_file(self, input_path: Path, output_path: Path) -> None:
         """
@@ -53,12 +96,16 @@ class MarkdownTranslator:
             TranslationError: If translation fails
         """
         try:
-            # Read input file
-            content = input_path.read_text(encoding="utf-8")
+            # File I/O runs in a worker thread so concurrent translations
+            # keep making progress on the event loop
+            content = await asyncio.to_thread(input_path.read_text, encoding="utf-8")
             self.logger.info(f"Translating: {input_path}")
 
+            match = _FRONTMATTER_RE.match(content)
+            frontmatter = match.group(0) if match else ""
+
             # Parse to AST
-            doc = marko.parse(content)
+            doc = self._parse(content[len(frontmatter) :])
 
             # Extract translatable text nodes
             text_nodes = self._extract_translatable_nodes(doc)
@@ -66,57 +113,80 @@ class MarkdownTranslator:
 
             if not text_nodes:
                 self.logger.warning("No translatable content found")
-                output_path.write_text(content, encoding="utf-8")
+                await asyncio.to_thread(output_path.write_text, content, encoding="utf-8")
                 return
 
             # Translate in batches
             translations = await self._translate_nodes_in_batches(text_nodes)
 
             # Apply translations back to AST
-            self._apply_translations(doc, translations)
+            self._apply_translations(text_nodes, translations)
 
             # Render back to Markdown
-            translated_content = marko.render(doc)
+            translated_content = frontmatter + self._render(doc)
 
             # Write output
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(translated_content, encoding="utf-8")
+            await asyncio.to_thread(_write_text, output_path, translated_content)
 
             self.logger.info(f"Translation saved to: {output_path}")
 
         except Exception as e:
             self.logger.error(f"Translation failed: {e}")
             raise TranslationError(f"Failed to translate file: {e}") from e
+        finally:
+            # Reopened on the next call, so translators can be reused
+            if self.cache is not None:
+                self.cache.close()
+
+    def _parse(self, content: str) -> Any:
+        """Parse Markdown with the configured parser."""
+        if self.markdown_it is not None:
+            return self.markdown_it.parse(content)
+        return marko.parse(content)
+
+    def _render(self, doc: Any) -> str:
+        """Render a document parsed by ``_parse``."""
+        if self.markdown_it is not None:
+            return self.markdown_it.render(doc)
+        return marko.render(doc)
 
     def _extract_translatable_nodes(self, doc: Any) -> list[tuple[Any, str]]:
         """
         Extract translatable text nodes from AST.
 
         Args:
-            doc: Marko document AST
+            doc: Document from ``_parse``
 
         Returns:
             List of (node, text) tuples
         """
+        if self.markdown_it is not None:
+            return self.markdown_it.extract_translatable(doc)
+
         translatable_nodes = []
 
-        def traverse(node: Any) -> None:
+        # Iterative pre-order walk; children are pushed in reverse so they
+        # are visited in document order
+        stack = [doc]
+        while stack:
+            node = stack.pop()
+
+            kind = _node_kind(type(node))
+
             # Skip code blocks and HTML blocks
-            if isinstance(node, (CodeBlock, FencedCode, HTMLBlock)):
-                return
+            if kind == _SKIP:
+                continue
 
             # Extract text from specific block types
-            if isinstance(node, (Paragraph, Heading, Quote)):
+            if kind == _TRANSLATE:
                 text = self._extract_text_from_inline(node)
                 if text.strip():
                     translatable_nodes.append((node, text))
 
-            # Recurse into children
-            if hasattr(node, "children") and node.children:
-                for child in node.children:
-                    traverse(child)
+            children = getattr(node, "children", None)
+            if children and not isinstance(children, str):
+                stack.extend(reversed(children))
 
-        traverse(doc)
         return translatable_nodes
 
     def _extract_text_from_inline(self, node: Any) -> str:
@@ -129,102 +199,131 @@ class MarkdownTranslator:
         Returns:
             Concatenated text content
         """
-        if not hasattr(node, "children"):
+        children = getattr(node, "children", None)
+        if not children:
             return ""
 
+        # Fast path: most paragraphs and headings are a single plain text run
+        if len(children) == 1 and type(children[0]) is RawText:
+            return children[0].children
+
         text_parts = []
 
-        def extract(element: Any) -> None:
+        # Iterative walk in document order (children pushed in reverse).
+        # Links and images contribute only their text, never their URL.
+        stack = list(reversed(children))
+        while stack:
+            element = stack.pop()
             if isinstance(element, RawText):
                 text_parts.append(element.children)
             elif isinstance(element, CodeSpan):
                 # Skip code spans
-                pass
-            elif isinstance(element, (Link, Image)):
-                # For links, only extract text content (not URL)
-                if hasattr(element, "children"):
-                    for child in element.children:
-                        extract(child)
+                continue
             elif hasattr(element, "children"):
-                for child in element.children:
-                    extract(child)
-
-        for child in node.children:
-            extract(child)
+                stack.extend(reversed(element.children))
 
         return "".join(text_parts)
 
     async def _translate_nodes_in_batches(
         self,
         nodes: list[tuple[Any, str]],
-        batch_size: int = 10,
+        batch_size: Optional[int] = None,
+        batch_tokens: Optional[int] = None,
     ) -> dict[str, str]:
         """
-        Translate nodes in batches.
+        Translate nodes in batches, sending several batches concurrently.
 
         Args:
             nodes: List of (node, text) tuples
-            batch_size: Number of texts per batch
+            batch_size: Number of texts per batch (defaults to config.translate_batch_size)
+            batch_tokens: Approximate input tokens per batch, 0 for no limit
+                (defaults to config.translate_batch_tokens)
 
         Returns:
             Dictionary mapping original text to translation
         """
-        translations = {}
-        texts = [text for _, text in nodes]
+        batch_size = batch_size or self.config.translate_batch_size
+        if batch_tokens is None:
+            batch_tokens = self.config.translate_batch_tokens
+        # Translate repeated texts (e.g. recurring headings) once; the result
+        # maps by original text, so every occurrence still gets it
+        texts = list(dict.fromkeys(text for _, text in nodes))
+
+        # Only send texts that were not translated in an earlier run
+        cached: dict[str, str] = {}
+        if self.cache is not None:
+            cached = self.cache.get_many(self.llm_client.model, self.target_language, texts)
+            if cached:
+                self.logger.info(f"Reusing {len(cached)} cached translations")
+                texts = [text for text in texts if text not in cached]
+
+        translate: Callable[[list[str], str], Awaitable[list[str]]]
+        if self.config.translate_batch_api:
+            # One Batch API job covers the whole document
+            batches = [texts] if texts else []
+            translate = self.llm_client.translate_batch_offline
+        else:
+            batches = _group_batches(
+                texts, batch_size, batch_tokens, self.llm_client.estimate_tokens
+            )
+            translate = self.llm_client.translate_batch
 
-        # Process in batches
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            self.logger.debug(f"Translating batch {i // batch_size + 1} ({len(batch)} items)")
+        # Limit in-flight requests to the LLM API
+        semaphore = asyncio.Semaphore(self.config.translate_concurrency)
 
-            self.logger.debug("=" * 20 + "TRANSLATING" + "=" * 20)
-            for s in batch:
-                self.logger.debug(s)
-            self.logger.debug("=" * 50)
+        # Batch bodies are only formatted when debug logging is on
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
-            translated_batch = await self.llm_client.translate_batch(
-                batch,
-                self.target_language,
-            )
+        async def translate_one(number: int, batch: list[str]) -> list[str]:
+            async with semaphore:
+                if debug:
+                    self.logger.debug(
+                        "Translating batch %d (%d items):\n%s", number, len(batch), "\n".join(batch)
+                    )
 
-            self.logger.debug("=" * 20 + "TRANSLATED" + "=" * 20)
-            for s in translated_batch:
-                self.logger.debug(s)
-            self.logger.debug("=" * 50)
+                translated_batch = await translate(batch, self.target_language)
 
-            # Map original to translated
+                if debug:
+                    self.logger.debug(
+                        "Translated batch %d:\n%s", number, "\n".join(translated_batch)
+                    )
+
+                return translated_batch
+
+        # Execute batches concurrently; gather preserves batch order
+        results = await asyncio.gather(
+            *[translate_one(number, batch) for number, batch in enumerate(batches, 1)]
+        )
+
+        # Map original to translated
+        translations = {}
+        for batch, translated_batch in zip(batches, results):
             for original, translated in zip(batch, translated_batch):
                 translations[original] = translated
 
+        if self.cache is not None:
+            self.cache.put_many(self.llm_client.model, self.target_language, translations)
+            translations.update(cached)
+
         return translations
 
-    def _apply_translations(self, doc: Any, translations: dict[str, str]) -> None:
+    def _apply_translations(
+        self, nodes: list[tuple[Any, str]], translations: dict[str, str]
+    ) -> None:
         """
-        Apply translations back to AST nodes.
+        Apply translations back to the extracted AST nodes.
+
+        Works on the node references from ``_extract_translatable_nodes``, so
+        the tree is not walked and no text is extracted a second time.
 
         Args:
-            doc: Marko document AST
+            nodes: List of (node, text) tuples
             translations: Dictionary mapping original text to translation
         """
-
-        def traverse(node: Any) -> None:
-            # Skip code blocks and HTML blocks
-            if isinstance(node, (CodeBlock, FencedCode, HTMLBlock)):
-                return
-
-            # Apply translation to specific block types
-            if isinstance(node, (Paragraph, Heading, Quote)):
-                original_text = self._extract_text_from_inline(node)
-                if original_text.strip() and original_text in translations:
-                    translated_text = translations[original_text]
-                    self._replace_text_in_inline(node, translated_text)
-
-            # Recurse into children
-            if hasattr(node, "children") and node.children:
-                for child in node.children:
-                    traverse(child)
-
-        traverse(doc)
+        for node, original_text in nodes:
+            translated_text = translations.get(original_text)
+            if translated_text is not None:
+                self._replace_text_in_inline(node, translated_text)
 
     def _replace_text_in_inline(self, node: Any, new_text: str) -> None:
         """
@@ -236,24 +335,72 @@ class MarkdownTranslator:
             node: AST node with inline children
             new_text: New text content (plain text, no Markdown syntax)
         """
+        if self.markdown_it is not None:
+            self.markdown_it.replace_text(node, new_text)
+            return
+
         if not hasattr(node, "children"):
             return
 
-        # Clear existing children and create new RawText node
-        # This ensures the text is treated as plain text, not HTML/Markdown
-        try:
-            # Create a new RawText node with the translated text
-            new_raw_text = RawText(new_text)
-            
-            # Replace all children with just the new RawText node
-            # This prevents any inline formatting issues
-            node.children = [new_raw_text]
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to create RawText node: {e}")
-            # Fallback: try to find and update existing RawText
-            for i, child in enumerate(node.children):
-                if isinstance(child, RawText):
-                    child.children = new_text
-                    node.children = [child]
-                    break
+        # Replace all children with a single RawText node, so the text is
+        # treated as plain text (escaped on render) and inline formatting
+        # cannot leak in. Images are kept after it, or their assets would
+        # vanish from the translated document.
+        images = []
+        stack = list(reversed(node.children))
+        while stack:
+            element = stack.pop()
+            if isinstance(element, Image):
+                images.append(element)
+            elif isinstance(getattr(element, "children", None), list):
+                stack.extend(reversed(element.children))
+        node.children = [RawText(new_text), *images]
+
+
+def _write_text(path: Path, content: str) -> None:
+    """Write a UTF-8 text file, creating its parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def _group_batches(
+    texts: list[str],
+    max_items: int,
+    max_tokens: int,
+    count_tokens: Callable[[str], int],
+) -> list[list[str]]:
+    """
+    Split texts into batches of at most ``max_items`` texts and roughly
+    ``max_tokens`` input tokens.
+
+    Every batch shares one prompt, so packing short blocks together saves
+    resending the instructions per block while long blocks still get a
+    request of their own.
+
+    Args:
+        texts: Texts to translate, in order
+        max_items: Maximum texts per batch
+        max_tokens: Approximate token budget per batch (0 for no limit)
+        count_tokens: Function estimating the token count of a text
+
+    Returns:
+        List of batches, preserving text order
+    """
+    if not max_tokens:
+        return [texts[i : i + max_items] for i in range(0, len(texts), max_items)]
+
+    batches: list[list[str]] = []
+    batch: list[str] = []
+    batch_tokens = 0
+    for text in texts:
+        tokens = count_tokens(text)
+        if batch and (len(batch) >= max_items or batch_tokens + tokens > max_tokens):
+            batches.append(batch)
+            batch = []
+            batch_tokens = 0
+        batch.append(text)
+        batch_tokens += tokens
+
+    if batch:
+        batches.append(batch)
+    return batches
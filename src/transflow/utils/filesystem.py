@@ -1,21 +1,32 @@
 """Filesystem utilities."""
 
-import hashlib
+import functools
+import os
+import re
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlparse
 
 from slugify import slugify
 
+# Placeholders understood by format_folder_path; other text, including other
+# braces, is copied unchanged
+_FOLDER_PLACEHOLDER_RE = re.compile(r"\{(year|month|day|date|slug)\}")
+
 
 class FileSystemHelper:
     """Helper for filesystem operations."""
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def generate_slug(text: str, max_length: int = 50) -> str:
         """
         Generate URL-safe slug from text.
 
+        Results are memoized; slugify is deterministic but comparatively slow.
+
         Args:
             text: Input text
             max_length: Maximum slug length
@@ -26,18 +37,20 @@ class FileSystemHelper:
         return slugify(text, max_length=max_length)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def generate_filename_from_url(url: str) -> str:
         """
         Generate filename from URL.
 
+        Results are memoized, so repeated lookups of the same URL skip both
+        parsing and slugifying.
+
         Args:
             url: Source URL
 
         Returns:
             Generated filename with .md extension
         """
-        from urllib.parse import urlparse
-        
         # Parse URL to get path
         parsed = urlparse(url)
         path = parsed.path.rstrip("/")
@@ -89,10 +102,9 @@ class FileSystemHelper:
         if not filepath.exists():
             return filename
 
-        # Generate hash suffix
-        hash_suffix = hashlib.md5(
-            (base_name + str(datetime.now().timestamp())).encode()
-        ).hexdigest()[:8]
+        # Random 8-hex-digit suffix; it only needs to differ from the
+        # existing file, so no clock read or hashing is required
+        hash_suffix = os.urandom(4).hex()
 
         return f"{base_name}_{hash_suffix}{extension}"
 
@@ -101,6 +113,8 @@ class FileSystemHelper:
         pattern: str,
         title: str,
         date: Optional[datetime] = None,
+        *,
+        now: Callable[[], datetime] = datetime.now,
     ) -> str:
         """
         Format folder path using pattern template.
@@ -109,25 +123,22 @@ class FileSystemHelper:
             pattern: Format pattern (e.g., "{year}/{date}-{slug}")
             title: Article title
             date: Optional date (defaults to now)
+            now: Clock used when no date is given
 
         Returns:
             Formatted folder path
         """
         if date is None:
-            date = datetime.now()
+            date = now()
 
         slug = FileSystemHelper.generate_slug(title)
 
         replacements = {
-            "{year}": str(date.year),
-            "{month}": f"{date.month:02d}",
-            "{day}": f"{date.day:02d}",
-            "{date}": date.strftime("%Y%m%d"),
-            "{slug}": slug,
+            "year": str(date.year),
+            "month": f"{date.month:02d}",
+            "day": f"{date.day:02d}",
+            "date": date.strftime("%Y%m%d"),
+            "slug": slug,
         }
 
-        result = pattern
-        for key, value in replacements.items():
-            result = result.replace(key, value)
-
-        return result
+        return _FOLDER_PLACEHOLDER_RE.sub(lambda m: replacements[m.group(1)], pattern)
@@ -1,12 +1,17 @@
 """HTTP client utilities with retry logic."""
 
-import asyncio
+import os
+import socket
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any, Optional
+from urllib.parse import urlparse
 
 import httpx
 from tenacity import (
+    AsyncRetrying,
     RetryError,
-    retry,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
@@ -14,15 +19,101 @@ from tenacity import (
 
 from transflow.exceptions import NetworkError
 
+# Bytes read from the network per write while streaming a download
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Retry policy shared by every request: transient network failures and HTTP
+# error statuses are retried with exponential backoff
+_RETRY_WAIT = wait_exponential(multiplier=1, min=2, max=10)
+_RETRY_ON = retry_if_exception_type(
+    (httpx.TimeoutException, httpx.NetworkError, httpx.HTTPStatusError)
+)
+
+
+def create_session(
+    timeout: int = 30,
+    max_connections: int = 10,
+    keepalive_expiry: float = 60.0,
+) -> httpx.AsyncClient:
+    """
+    Create a pooled httpx client to share between HTTPClient instances.
+
+    Connections (and their TLS sessions) to the same host are kept alive and
+    reused by every client the session is passed to. The caller owns the
+    session and must close it, typically with ``async with``.
+
+    Args:
+        timeout: Default request timeout in seconds
+        max_connections: Maximum number of open connections
+        keepalive_expiry: Seconds an idle connection is kept for reuse
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    return httpx.AsyncClient(timeout=timeout, limits=limits)
+
+
+def prefetch_dns(*urls: Optional[str]) -> list[threading.Thread]:
+    """
+    Resolve the hosts of the given URLs in background threads.
+
+    The lookups warm the system resolver cache while the command is still
+    starting up, so the first request to each API host does not wait on DNS.
+    Failures are ignored; the real request reports them.
+
+    Args:
+        urls: Base URLs whose hosts should be resolved (empty values are skipped)
+
+    Returns:
+        The started daemon threads
+    """
+
+    def resolve(host: str, port: int) -> None:
+        try:
+            socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError:
+            pass
+
+    threads = []
+    for host, port in {_host_and_port(url) for url in urls if url}:
+        if not host:
+            continue
+        thread = threading.Thread(target=resolve, args=(host, port), daemon=True)
+        thread.start()
+        threads.append(thread)
+    return threads
+
+
+def _host_and_port(url: str) -> tuple[Optional[str], int]:
+    """Return the host and port a URL connects to."""
+    parsed = urlparse(url)
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+    return parsed.hostname, port or (80 if parsed.scheme == "http" else 443)
+
 
 class HTTPClient:
-    """Async HTTP client with automatic retry logic."""
+    """
+    Async HTTP client with automatic retry logic.
+
+    Without a shared session, the client opens its own connection pool on the
+    first request and keeps it for later requests and retries; close it with
+    ``aclose()`` or use the client as an async context manager.
+    """
 
     def __init__(
         self,
         timeout: int = 30,
         max_retries: int = 3,
         headers: Optional[dict[str, str]] = None,
+        session: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize HTTP client.
@@ -31,10 +122,46 @@ class HTTPClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             headers: Optional default headers
+            session: Optional shared httpx client (the caller keeps ownership);
+                if omitted, the client creates and owns one on first use
         """
         self.timeout = timeout
         self.max_retries = max_retries
         self.default_headers = headers or {}
+        self.session = session
+        self._own_session: Optional[httpx.AsyncClient] = None
+        self._retry_stop = stop_after_attempt(max_retries)
+
+    async def __aenter__(self) -> "HTTPClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connection pool this client created (a shared session is left open)."""
+        if self._own_session is not None:
+            await self._own_session.aclose()
+            self._own_session = None
+
+    def _retrying(self) -> AsyncRetrying:
+        """
+        Start a retry loop for one request.
+
+        The policy objects are built once; only the per-request loop state is
+        created here, since a retry loop cannot be shared by concurrent requests.
+        """
+        return AsyncRetrying(stop=self._retry_stop, wait=_RETRY_WAIT, retry=_RETRY_ON, reraise=True)
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared session if one was provided, else this client's own pool."""
+        if self.session is not None:
+            yield self.session
+            return
+        if self._own_session is None:
+            self._own_session = httpx.AsyncClient(timeout=self.timeout)
+        yield self._own_session
 
     async def get(
         self,
@@ -57,23 +184,15 @@ class HTTPClient:
             NetworkError: If request fails after retries
         """
         merged_headers = {**self.default_headers, **(headers or {})}
-
-        @retry(
-            stop=stop_after_attempt(self.max_retries),
-            wait=wait_exponential(multiplier=1, min=2, max=10),
-            retry=retry_if_exception_type(
-                (httpx.TimeoutException, httpx.NetworkError, httpx.HTTPStatusError)
-            ),
-            reraise=True,
-        )
-        async def _get_with_retry() -> httpx.Response:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=merged_headers, **kwargs)
-                response.raise_for_status()
-                return response
+        kwargs.setdefault("timeout", self.timeout)
 
         try:
-            return await _get_with_retry()
+            async for attempt in self._retrying():
+                with attempt:
+                    async with self._client() as client:
+                        response = await client.get(url, headers=merged_headers, **kwargs)
+                        response.raise_for_status()
+            return response
         except RetryError as e:
             raise NetworkError(f"Failed to fetch {url} after {self.max_retries} retries") from e
         except httpx.HTTPError as e:
@@ -102,23 +221,17 @@ class HTTPClient:
             NetworkError: If request fails after retries
         """
         merged_headers = {**self.default_headers, **(headers or {})}
-
-        @retry(
-            stop=stop_after_attempt(self.max_retries),
-            wait=wait_exponential(multiplier=1, min=2, max=10),
-            retry=retry_if_exception_type(
-                (httpx.TimeoutException, httpx.NetworkError, httpx.HTTPStatusError)
-            ),
-            reraise=True,
-        )
-        async def _post_with_retry() -> httpx.Response:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, json=json, headers=merged_headers, **kwargs)
-                response.raise_for_status()
-                return response
+        kwargs.setdefault("timeout", self.timeout)
 
         try:
-            return await _post_with_retry()
+            async for attempt in self._retrying():
+                with attempt:
+                    async with self._client() as client:
+                        response = await client.post(
+                            url, json=json, headers=merged_headers, **kwargs
+                        )
+                        response.raise_for_status()
+            return response
         except RetryError as e:
             raise NetworkError(f"Failed to post to {url} after {self.max_retries} retries") from e
         except httpx.HTTPError as e:
@@ -133,6 +246,11 @@ class HTTPClient:
         """
         Download file from URL to local path.
 
+        The body is streamed to disk in chunks, so memory use does not grow
+        with the file size. Data goes to a temporary ``.part`` file that is
+        renamed into place once complete, so a failed download never leaves
+        a truncated file at ``dest_path``.
+
         Args:
             url: Source URL
             dest_path: Destination file path
@@ -141,7 +259,25 @@ class HTTPClient:
         Raises:
             NetworkError: If download fails
         """
-        response = await self.get(url, headers=headers)
-        
-        with open(dest_path, "wb") as f:
-            f.write(response.content)
+        merged_headers = {**self.default_headers, **(headers or {})}
+        part_path = f"{dest_path}.part"
+
+        try:
+            async for attempt in self._retrying():
+                with attempt:
+                    async with self._client() as client:
+                        async with client.stream(
+                            "GET", url, headers=merged_headers, timeout=self.timeout
+                        ) as response:
+                            response.raise_for_status()
+                            with open(part_path, "wb") as f:
+                                async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                                    f.write(chunk)
+            os.replace(part_path, dest_path)
+        except RetryError as e:
+            raise NetworkError(f"Failed to download {url} after {self.max_retries} retries") from e
+        except httpx.HTTPError as e:
+            raise NetworkError(f"HTTP error downloading {url}: {e}") from e
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
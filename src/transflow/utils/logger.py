@@ -42,13 +42,15 @@ class TransFlowLogger:
         if logger.handlers:
             return logger
 
-        # Console handler with Rich formatting
+        # Console handler with Rich formatting. Rendering every frame's local
+        # variables is slow and noisy, so tracebacks only include them when
+        # debugging (e.g. --verbose)
         console_handler = RichHandler(
             console=Console(stderr=True),
             show_time=True,
             show_path=False,
             rich_tracebacks=True,
-            tracebacks_show_locals=True,
+            tracebacks_show_locals=level.upper() == "DEBUG",
         )
         console_handler.setLevel(getattr(logging, level.upper()))
         console_formatter = logging.Formatter("%(message)s", datefmt="[%X]")
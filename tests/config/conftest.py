@@ -1,3 +1,17 @@
 """Shared fixtures for config tests."""
 
+from unittest.mock import MagicMock
+
 import pytest
+
+
+@pytest.fixture(autouse=True)
+def async_openai(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the OpenAI client class; these tests only check what LLMClient passes it.
+
+    Returns:
+        The mock standing in for ``AsyncOpenAI``
+    """
+    mock = MagicMock()
+    monkeypatch.setattr("transflow.core.llm.AsyncOpenAI", mock)
+    return mock
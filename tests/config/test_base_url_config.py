@@ -1,6 +1,6 @@
 """Tests for configuration and base_url handling."""
 
-import pytest
+from unittest.mock import MagicMock
 
 from transflow.config import TransFlowConfig
 from transflow.core.llm import LLMClient
@@ -9,7 +9,7 @@ from transflow.core.llm import LLMClient
 class TestConfigValidation:
     """Test configuration validation and base_url handling."""
 
-    def test_custom_base_url_is_applied(self) -> None:
+    def test_custom_base_url_is_applied(self, async_openai: MagicMock) -> None:
         """Test that custom base_url is properly applied to OpenAI client."""
         custom_url = "http://192.168.5.233:8000/v1"
         config = TransFlowConfig(
@@ -22,8 +22,9 @@ class TestConfigValidation:
         # Verify config is stored correctly
         assert client.config.openai_base_url == custom_url
         assert client.model == config.openai_model
+        assert async_openai.call_args.kwargs["base_url"] == custom_url
 
-    def test_default_base_url_works(self) -> None:
+    def test_default_base_url_works(self, async_openai: MagicMock) -> None:
         """Test that default OpenAI base_url works correctly."""
         config = TransFlowConfig(openai_api_key="test_key")
 
@@ -31,6 +32,8 @@ class TestConfigValidation:
 
         # Default URL should be set in config
         assert client.config.openai_base_url == "https://api.openai.com/v1"
+        # ...and left to the OpenAI SDK rather than passed explicitly
+        assert async_openai.call_args.kwargs["base_url"] is None
 
     def test_base_url_with_trailing_slash(self) -> None:
         """Test handling of base_url with trailing slash."""
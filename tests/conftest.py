@@ -1,8 +1,18 @@
 """Tests configuration and fixtures."""
 
+from pathlib import Path
+
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep on-disk caches (e.g. config snapshots) out of the user's home."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
 @pytest.fixture
 def sample_markdown() -> str:
     """Sample Markdown content for testing."""
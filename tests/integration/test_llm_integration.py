@@ -5,8 +5,8 @@ These tests validate real API compatibility and require:
 2. Optional custom base URL (TRANSFLOW_OPENAI_BASE_URL)
 
 Environment consistency guarantees:
-    - Tests use isolated client instances (no shared state)
-    - Each test gets fresh config from environment
+    - Tests share one client; isolation checks use their own instances
+    - Config is read from the environment once per session and never mutated
     - Tests skip gracefully if credentials not available
     - No credentials logged or printed
     - Environment variables never modified by tests
@@ -31,112 +31,86 @@ from transflow.core.llm import LLMClient
 
 pytestmark = pytest.mark.integration
 
-
-@pytest.fixture(scope="function")
-def integration_config() -> TransFlowConfig:
-    """Load and validate integration test configuration.
-    
-    Scope: function - Fresh config for each test
-    
-    Returns:
-        TransFlowConfig with real API credentials
-        
-    Raises:
-        pytest.skip if credentials not properly configured
-    """
-    api_key = os.getenv("TRANSFLOW_OPENAI_API_KEY", "").strip()
-    base_url = os.getenv("TRANSFLOW_OPENAI_BASE_URL", "https://api.openai.com/v1").strip()
-    
-    # Validate credentials
-    if not api_key or api_key in ("test_key", "sk_test_", ""):
-        pytest.skip(
-            "Integration tests require valid TRANSFLOW_OPENAI_API_KEY. "
-            "Set environment variable: export TRANSFLOW_OPENAI_API_KEY=<your_key>"
-        )
-    
-    return TransFlowConfig(
-        openai_api_key=api_key,
-        openai_base_url=base_url,
-    )
+# Tests that reach the API share the session client and batched request, so
+# pytest-xdist (--dist=loadgroup) keeps them on one worker to avoid paying for
+# those once per worker
+llm_api = pytest.mark.xdist_group("llm_api")
 
 
-@pytest.fixture(scope="function")
-def isolated_client(integration_config: TransFlowConfig) -> LLMClient:
-    """Create an isolated LLM client for testing.
+@pytest.fixture(scope="session")
+async def batch_results(shared_client: LLMClient) -> dict[str, str]:
+    """Translate the texts checked by several tests in one API round-trip.
     
-    Scope: function - New client for each test, ensuring isolation
+    Scope: session - One request for the whole run
     
     Returns:
-        Fresh LLMClient instance
+        Dictionary mapping each source text to its translation
     """
-    return LLMClient(integration_config)
+    texts = ["test", "The quick brown fox"]
+    results = await shared_client.translate_batch(texts, "zh", source_language="auto")
+    return dict(zip(texts, results))
 
 
-@pytest.mark.asyncio
-async def test_api_connectivity(isolated_client: LLMClient) -> None:
+@llm_api
+def test_api_connectivity(batch_results: dict[str, str]) -> None:
     """Verify API endpoint is reachable and responding."""
-    result = await isolated_client.translate_text("test", "zh")
-    
+    result = batch_results["test"]
+
     assert result is not None
     assert isinstance(result, str)
 
 
-@pytest.mark.asyncio
-async def test_translate_text_with_real_api(isolated_client: LLMClient) -> None:
+@llm_api
+async def test_translate_text_with_real_api(shared_client: LLMClient) -> None:
     """Test single text translation with real API."""
-    result = await isolated_client.translate_text("Hello, world", "zh")
+    # Not among the batched texts, so the client's translation memo cannot answer it
+    result = await shared_client.translate_text("Hello, world", "zh")
 
     assert result
     assert isinstance(result, str)
     assert len(result) > 0
 
 
-@pytest.mark.asyncio
-async def test_translate_batch_with_real_api(isolated_client: LLMClient) -> None:
+@llm_api
+async def test_translate_batch_with_real_api(shared_client: LLMClient) -> None:
     """Test batch translation with real API."""
     texts = ["Hello", "World", "Test"]
-    results = await isolated_client.translate_batch(texts, "zh")
+    results = await shared_client.translate_batch(texts, "zh")
 
     assert len(results) == len(texts)
     assert all(isinstance(r, str) for r in results)
 
 
-@pytest.mark.asyncio
-async def test_custom_base_url(integration_config: TransFlowConfig) -> None:
+@llm_api
+def test_custom_base_url(shared_client: LLMClient, batch_results: dict[str, str]) -> None:
     """Test that custom base_url is properly applied and working."""
     base_url = os.getenv("TRANSFLOW_OPENAI_BASE_URL")
     
     if base_url and base_url != "https://api.openai.com/v1":
-        # Only test if custom base_url is configured
-        client = LLMClient(integration_config)
-        result = await client.translate_text("test", "zh")
-        assert result is not None
+        # Only test if custom base_url is configured; the shared client was
+        # built from the same config and already translated "test"
+        assert str(shared_client.async_client.base_url).rstrip("/") == base_url.rstrip("/")
+        assert batch_results["test"] is not None
 
 
-@pytest.mark.asyncio
-async def test_auto_language_detection(isolated_client: LLMClient) -> None:
+@llm_api
+def test_auto_language_detection(batch_results: dict[str, str]) -> None:
     """Test automatic language detection."""
-    # English text with auto detection
-    result_en = await isolated_client.translate_text(
-        "The quick brown fox",
-        target_language="zh",
-        source_language="auto"
-    )
+    # English text, translated with source_language="auto"
+    result_en = batch_results["The quick brown fox"]
     assert result_en is not None
     assert isinstance(result_en, str)
 
 
-@pytest.mark.asyncio
-async def test_empty_text_handling(isolated_client: LLMClient) -> None:
+async def test_empty_text_handling(shared_client: LLMClient) -> None:
     """Test that empty text is handled correctly without API calls."""
-    result = await isolated_client.translate_text("", "zh")
+    result = await shared_client.translate_text("", "zh")
     assert result == ""
     
-    result_spaces = await isolated_client.translate_text("   ", "zh")
+    result_spaces = await shared_client.translate_text("   ", "zh")
     assert result_spaces.strip() == ""
 
 
-@pytest.mark.asyncio
 async def test_environment_isolation(integration_config: TransFlowConfig) -> None:
     """Verify that test environment doesn't leak between tests.
     
@@ -0,0 +1,108 @@
+"""Shared fixtures for core module tests."""
+
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+import pytest
+
+from transflow.config import TransFlowConfig
+from transflow.core.bundler import AssetBundler
+from transflow.core.extractor import MarkdownExtractor
+from transflow.core.llm import LLMClient
+from transflow.core.translator import MarkdownTranslator
+
+# Configurations are never modified by the code under test, so one
+# validated instance serves the whole run
+
+
+@pytest.fixture(scope="session")
+def config() -> TransFlowConfig:
+    """Configuration with a test API key."""
+    return TransFlowConfig(openai_api_key="test_key")
+
+
+@pytest.fixture(scope="session")
+def firecrawl_config() -> TransFlowConfig:
+    """Configuration with a test Firecrawl API key."""
+    return TransFlowConfig(firecrawl_api_key="test_key")
+
+
+# The objects below keep per-instance state (caches, lazily created HTTP
+# clients, attributes patched by tests), so each test gets its own
+
+
+@pytest.fixture
+def bundler(config: TransFlowConfig) -> AssetBundler:
+    """Asset bundler using the shared configuration."""
+    return AssetBundler(config)
+
+
+@pytest.fixture
+def extractor(firecrawl_config: TransFlowConfig) -> MarkdownExtractor:
+    """Markdown extractor using the shared Firecrawl configuration."""
+    return MarkdownExtractor(firecrawl_config)
+
+
+@pytest.fixture
+def firecrawl_replies() -> list[dict[str, Any]]:
+    """JSON bodies the fake Firecrawl scrape API returns, in order."""
+    return []
+
+
+@pytest.fixture
+async def firecrawl_extractor(
+    firecrawl_config: TransFlowConfig, firecrawl_replies: list[dict[str, Any]]
+) -> AsyncIterator[MarkdownExtractor]:
+    """Markdown extractor whose scrape requests are answered from ``firecrawl_replies``."""
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=firecrawl_replies.pop(0))
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handle)) as session:
+        yield MarkdownExtractor(firecrawl_config, session=session)
+
+
+@pytest.fixture
+def chat_replies() -> list[str]:
+    """Message contents the fake chat completions API returns, in order."""
+    return []
+
+
+@pytest.fixture
+def chat_requests() -> list[dict[str, Any]]:
+    """JSON bodies of the requests sent to the fake chat completions API."""
+    return []
+
+
+@pytest.fixture
+async def llm_client(
+    config: TransFlowConfig, chat_replies: list[str], chat_requests: list[dict[str, Any]]
+) -> AsyncIterator[LLMClient]:
+    """LLM client whose HTTP traffic is answered from ``chat_replies``."""
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        chat_requests.append(body)
+        message = {"role": "assistant", "content": chat_replies.pop(0)}
+        return httpx.Response(
+            200,
+            json={
+                "id": f"chatcmpl-{len(chat_requests)}",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [{"index": 0, "finish_reason": "stop", "message": message}],
+            },
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handle)) as session:
+        yield LLMClient(config, session=session)
+
+
+@pytest.fixture
+def translator(config: TransFlowConfig) -> MarkdownTranslator:
+    """Markdown translator using the shared configuration."""
+    return MarkdownTranslator(config)
+
@@ -5,9 +5,9 @@ Following Google Python testing guidelines.
 
 import asyncio
 from pathlib import Path
-from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from transflow.config import TransFlowConfig
@@ -17,11 +17,8 @@ from transflow.core.bundler import AssetBundler
 class TestAssetBundler:
     """Tests for AssetBundler class."""
 
-    def test_init_creates_http_client(self) -> None:
+    def test_init_creates_http_client(self, config: TransFlowConfig) -> None:
         """Test bundler initialization creates HTTP client."""
-        # Arrange
-        config = TransFlowConfig()
-
         # Act
         bundler = AssetBundler(config)
 
@@ -29,211 +26,160 @@ class TestAssetBundler:
         assert bundler.config == config
         assert bundler.http_client is not None
 
-    @pytest.mark.asyncio
-    async def test_bundle_creates_directory_structure(self) -> None:
-        """Test bundle creates output directory and assets folder."""
+    async def test_context_manager_closes_own_connection_pool(
+        self, config: TransFlowConfig
+    ) -> None:
+        """Test leaving the bundler closes the pool its HTTP client created."""
         # Arrange
-        config = TransFlowConfig()
-        bundler = AssetBundler(config)
+        transport = httpx.MockTransport(lambda request: httpx.Response(200))
+        real_init = httpx.AsyncClient.__init__
 
-        input_content = "---\ntitle: Test\n---\n\n# Test"
-        input_path = Path("/tmp/test.md")
-        output_dir = Path("/tmp/output")
+        def init(self: httpx.AsyncClient, **kwargs: object) -> None:
+            real_init(self, transport=transport, **kwargs)
 
-        mkdir_calls = []
+        # Act
+        with patch.object(httpx.AsyncClient, "__init__", new=init):
+            async with AssetBundler(config) as bundler:
+                await bundler.http_client.get("https://example.com/a.png")
+                own_session = bundler.http_client._own_session
 
-        def track_mkdir(*args, **kwargs):
-            mkdir_calls.append(args[0] if args else kwargs.get("self"))
+        # Assert
+        assert own_session is not None and own_session.is_closed
+
+    async def test_bundle_creates_directory_structure(
+        self, bundler: AssetBundler, tmp_path: Path
+    ) -> None:
+        """Test bundle creates output directory and assets folder."""
+        # Arrange
+        input_path = tmp_path / "test.md"
+        input_path.write_text("---\ntitle: Test\n---\n\n# Test", encoding="utf-8")
+        output_dir = tmp_path / "output"
 
         # Act
-        with patch.object(Path, "read_text", return_value=input_content):
-            with patch.object(Path, "write_text"):
-                with patch.object(Path, "mkdir", side_effect=track_mkdir):
-                    result = await bundler.bundle(input_path, output_dir)
+        result = await bundler.bundle(input_path, output_dir)
 
         # Assert
-        assert isinstance(result, Path)
-        assert len(mkdir_calls) >= 2  # bundle_dir and assets_dir
+        assert result.parent == output_dir
+        assert (result / "assets").is_dir()
 
-    @pytest.mark.asyncio
-    async def test_bundle_downloads_images(self) -> None:
+    async def test_bundle_downloads_images(self, bundler: AssetBundler, tmp_path: Path) -> None:
         """Test bundle downloads remote images."""
         # Arrange
-        config = TransFlowConfig()
-        bundler = AssetBundler(config)
-
-        input_content = "---\ntitle: Test\n---\n\n![Image](https://example.com/image.png)"
-        input_path = Path("/tmp/test.md")
-        output_dir = Path("/tmp/output")
+        input_path = tmp_path / "test.md"
+        input_path.write_text(
+            "---\ntitle: Test\n---\n\n![Image](https://example.com/image.png)", encoding="utf-8"
+        )
+        output_dir = tmp_path / "output"
 
         mock_download = AsyncMock()
 
         # Act
-        with patch.object(Path, "read_text", return_value=input_content):
-            with patch.object(Path, "write_text"):
-                with patch.object(Path, "mkdir"):
-                    with patch.object(
-                        bundler.http_client,
-                        "download_file",
-                        new=mock_download,
-                    ):
-                        await bundler.bundle(input_path, output_dir)
+        with patch.object(bundler.http_client, "download_file", new=mock_download):
+            await bundler.bundle(input_path, output_dir)
 
         # Assert
         mock_download.assert_called_once()
         call_args = mock_download.call_args
         assert "https://example.com/image.png" in call_args[0]
 
-    @pytest.mark.asyncio
-    async def test_bundle_rewrites_image_links(self) -> None:
+    async def test_bundle_rewrites_image_links(
+        self, bundler: AssetBundler, tmp_path: Path
+    ) -> None:
         """Test bundle rewrites remote image URLs to local paths."""
         # Arrange
-        config = TransFlowConfig()
-        bundler = AssetBundler(config)
-
-        input_content = "![Alt](https://example.com/img.png)"
-        input_path = Path("/tmp/test.md")
-        output_dir = Path("/tmp/output")
-
-        write_calls: list[tuple[str, str]] = []
-
-        def capture_write(content: str, **kwargs: Any) -> None:
-            write_calls.append(("readme", content))
+        input_path = tmp_path / "test.md"
+        input_path.write_text("![Alt](https://example.com/img.png)", encoding="utf-8")
+        output_dir = tmp_path / "output"
 
         # Act
-        with patch.object(Path, "read_text", return_value=input_content):
-            with patch.object(Path, "write_text", side_effect=capture_write):
-                with patch.object(Path, "mkdir"):
-                    with patch.object(bundler.http_client, "download_file", new=AsyncMock()):
-                        await bundler.bundle(input_path, output_dir)
+        with patch.object(bundler.http_client, "download_file", new=AsyncMock()):
+            result = await bundler.bundle(input_path, output_dir)
 
         # Assert
-        assert len(write_calls) > 0
-        # First call is the README.md content
-        readme_content = write_calls[0][1]
+        readme_content = (result / "README.md").read_text(encoding="utf-8")
         assert "assets/" in readme_content
         assert "https://example.com" not in readme_content
 
-    @pytest.mark.asyncio
-    async def test_bundle_creates_meta_yaml(self) -> None:
+    async def test_bundle_creates_meta_yaml(self, bundler: AssetBundler, tmp_path: Path) -> None:
         """Test bundle generates meta.yaml file."""
         # Arrange
-        config = TransFlowConfig()
-        bundler = AssetBundler(config)
-
-        input_content = "---\ntitle: Test Article\nsource_url: https://example.com\n---\n\nContent"
-        input_path = Path("/tmp/test.md")
-        output_dir = Path("/tmp/output")
-
-        write_calls: list[str] = []
-
-        def track_write(content: str, **kwargs: Any) -> None:
-            write_calls.append(content)
+        input_path = tmp_path / "test.md"
+        input_path.write_text(
+            "---\ntitle: Test Article\nsource_url: https://example.com\n---\n\nContent",
+            encoding="utf-8",
+        )
+        output_dir = tmp_path / "output"
 
         # Act
-        with patch.object(Path, "read_text", return_value=input_content):
-            with patch.object(Path, "write_text", side_effect=track_write):
-                with patch.object(Path, "mkdir"):
-                    await bundler.bundle(input_path, output_dir)
+        result = await bundler.bundle(input_path, output_dir)
 
         # Assert
-        # Second call should be the meta.yaml (first is README.md)
-        assert len(write_calls) >= 2
-        meta_content = write_calls[1]
+        meta_content = (result / "meta.yaml").read_text(encoding="utf-8")
         assert "title: Test Article" in meta_content
         assert "bundled_at:" in meta_content
 
-    def test_extract_frontmatter_parses_yaml(self) -> None:
-        """Test frontmatter extraction parses YAML correctly."""
-        # Arrange
-        config = TransFlowConfig()
-        bundler = AssetBundler(config)
-
-        content = "---\ntitle: Test\nauthor: John\n---\n\nContent"
-
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("---\ntitle: Test\nauthor: John\n---\n\nContent", {"title": "Test", "author": "John"}),
+            ("# Title\n\nContent", {}),
+        ],
+        ids=["yaml", "no-frontmatter"],
+    )
+    def test_extract_frontmatter(
+        self, bundler: AssetBundler, content: str, expected: dict[str, str]
+    ) -> None:
+        """Test frontmatter extraction parses YAML and returns {} when none is present."""
         # Act
         metadata = bundler._extract_frontmatter(content)
 
         # Assert
-        assert metadata["title"] == "Test"
-        assert metadata["author"] == "John"
-
-    def test_extract_frontmatter_handles_no_frontmatter(self) -> None:
-        """Test frontmatter extraction returns empty dict when none present."""
-        # Arrange
-        config = TransFlowConfig()
-        bundler = AssetBundler(config)
-
-        content = "# Title\n\nContent"
-
-        # Act
-        metadata = bundler._extract_frontmatter(content)
-
-        # Assert
-        assert metadata == {}
-
-    def test_extract_image_urls_finds_markdown_images(self) -> None:
-        """Test image URL extraction finds Markdown image syntax."""
-        # Arrange
-        config = TransFlowConfig()
-        bundler = AssetBundler(config)
-
-        content = "![Alt1](https://example.com/img1.png) and ![Alt2](https://example.com/img2.jpg)"
-
-        # Act
-        urls = bundler._extract_image_urls(content)
-
-        # Assert
-        assert len(urls) == 2
-        assert "https://example.com/img1.png" in urls
-        assert "https://example.com/img2.jpg" in urls
-
-    def test_extract_image_urls_ignores_relative_paths(self) -> None:
-        """Test image URL extraction ignores relative image paths."""
-        # Arrange
-        config = TransFlowConfig()
-        bundler = AssetBundler(config)
-
-        content = "![Remote](https://example.com/img.png) and ![Local](./local.png)"
-
-        # Act
-        urls = bundler._extract_image_urls(content)
-
-        # Assert
-        assert len(urls) == 1
-        assert "https://example.com/img.png" in urls
-        assert "./local.png" not in urls
-
-    def test_extract_image_urls_handles_image_titles(self) -> None:
-        """Test image URL extraction handles images with title attributes."""
-        # Arrange
-        config = TransFlowConfig()
-        bundler = AssetBundler(config)
-
-        content = '![Alt](https://example.com/img.png "Image Title")'
-
+        assert metadata == expected
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            (
+                "![Alt1](https://example.com/img1.png) and ![Alt2](https://example.com/img2.jpg)",
+                ["https://example.com/img1.png", "https://example.com/img2.jpg"],
+            ),
+            (
+                "![Remote](https://example.com/img.png) and ![Local](./local.png)",
+                ["https://example.com/img.png"],
+            ),
+            ('![Alt](https://example.com/img.png "Image Title")', ["https://example.com/img.png"]),
+        ],
+        ids=["markdown-images", "ignores-relative-paths", "image-titles"],
+    )
+    def test_extract_image_urls(
+        self, bundler: AssetBundler, content: str, expected: list[str]
+    ) -> None:
+        """Test image URL extraction finds remote Markdown images only."""
         # Act
         urls = bundler._extract_image_urls(content)
 
         # Assert
-        assert len(urls) == 1
-        assert "https://example.com/img.png" in urls
+        assert sorted(urls) == expected
 
-    @pytest.mark.asyncio
-    async def test_download_assets_concurrent_execution(self) -> None:
+    async def test_download_assets_concurrent_execution(
+        self, bundler: AssetBundler, tmp_path: Path
+    ) -> None:
         """Test asset download uses concurrent execution."""
         # Arrange
-        config = TransFlowConfig()
-        bundler = AssetBundler(config)
-
         urls = [f"https://example.com/img{i}.png" for i in range(5)]
-        dest_dir = Path("/tmp/assets")
+        dest_dir = tmp_path / "assets"
 
         download_calls = []
+        in_flight = 0
+        peak = 0
 
         async def track_download(url, path):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)  # Yield so other downloads can start
+            in_flight -= 1
             download_calls.append(url)
-            await asyncio.sleep(0.01)  # Simulate download time
 
         # Act
         with patch.object(bundler.http_client, "download_file", side_effect=track_download):
@@ -242,16 +188,15 @@ class TestAssetBundler:
         # Assert
         assert len(download_calls) == 5
         assert len(result) == 5
+        assert peak > 1
 
-    @pytest.mark.asyncio
-    async def test_download_assets_handles_failures_gracefully(self) -> None:
+    async def test_download_assets_handles_failures_gracefully(
+        self, bundler: AssetBundler, tmp_path: Path
+    ) -> None:
         """Test asset download continues when individual downloads fail."""
         # Arrange
-        config = TransFlowConfig()
-        bundler = AssetBundler(config)
-
         urls = ["https://example.com/good.png", "https://example.com/bad.png"]
-        dest_dir = Path("/tmp/assets")
+        dest_dir = tmp_path / "assets"
 
         async def mock_download(url, path):
             if "bad" in url:
@@ -265,12 +210,31 @@ class TestAssetBundler:
         assert len(result) == 1  # Only successful download
         assert "good.png" in str(result.values())
 
-    def test_generate_asset_filename_from_url(self) -> None:
-        """Test asset filename generation from URL."""
+    async def test_download_assets_reuses_existing_files(
+        self, bundler: AssetBundler, tmp_path: Path
+    ) -> None:
+        """Test non-empty assets from an earlier run are reused and empty ones re-downloaded."""
         # Arrange
-        config = TransFlowConfig()
-        bundler = AssetBundler(config)
+        urls = ["https://example.com/kept.png", "https://example.com/empty.png"]
+        dest_dir = tmp_path / "assets"
+        dest_dir.mkdir()
+        kept = bundler._generate_asset_filename(urls[0])
+        empty = bundler._generate_asset_filename(urls[1])
+        (dest_dir / kept).write_bytes(b"image data")
+        (dest_dir / empty).touch()
+        download = AsyncMock()
+
+        # Act
+        with patch.object(bundler.http_client, "download_file", new=download):
+            result = await bundler._download_assets(urls, dest_dir)
 
+        # Assert
+        assert result == {urls[0]: kept, urls[1]: empty}
+        download.assert_awaited_once_with(urls[1], str(dest_dir / empty))
+
+    def test_generate_asset_filename_from_url(self, bundler: AssetBundler) -> None:
+        """Test asset filename generation from URL."""
+        # Arrange
         url = "https://example.com/path/to/image.png"
 
         # Act
@@ -279,12 +243,9 @@ class TestAssetBundler:
         # Assert
         assert filename == "image.png"
 
-    def test_generate_asset_filename_handles_no_extension(self) -> None:
+    def test_generate_asset_filename_handles_no_extension(self, bundler: AssetBundler) -> None:
         """Test asset filename generation provides default for URLs without extension."""
         # Arrange
-        config = TransFlowConfig()
-        bundler = AssetBundler(config)
-
         url = "https://example.com/image"
 
         # Act
@@ -294,12 +255,9 @@ class TestAssetBundler:
         assert filename.startswith("image_")
         assert filename.endswith(".jpg")
 
-    def test_rewrite_image_links_updates_urls(self) -> None:
+    def test_rewrite_image_links_updates_urls(self, bundler: AssetBundler) -> None:
         """Test image link rewriting replaces URLs with local paths."""
         # Arrange
-        config = TransFlowConfig()
-        bundler = AssetBundler(config)
-
         content = "![Alt](https://example.com/img.png)"
         downloads = {"https://example.com/img.png": "img.png"}
 
@@ -310,12 +268,44 @@ class TestAssetBundler:
         assert "assets/img.png" in result
         assert "https://example.com/img.png" not in result
 
-    def test_generate_metadata_includes_bundle_info(self) -> None:
-        """Test metadata generation includes bundle information."""
+    def test_rewrite_image_links_leaves_other_images_untouched(self, bundler: AssetBundler) -> None:
+        """Test only downloaded images are rewritten, in a single pass."""
         # Arrange
-        config = TransFlowConfig()
-        bundler = AssetBundler(config)
+        content = (
+            "![Kept](https://example.com/failed.png) "
+            '![Logo](https://example.com/logo.png "Title")\n'
+            "![Again](https://example.com/logo.png)"
+        )
+        downloads = {"https://example.com/logo.png": "logo.png"}
+
+        # Act
+        result = bundler._rewrite_image_links(content, downloads)
 
+        # Assert
+        assert result == (
+            "![Kept](https://example.com/failed.png) "
+            "![Logo](assets/logo.png)\n"
+            "![Again](assets/logo.png)"
+        )
+
+    async def test_bundle_null_title_falls_back_to_file_name(
+        self, bundler: AssetBundler, tmp_path: Path
+    ) -> None:
+        """Test a null frontmatter title names the bundle after the input file."""
+        # Arrange
+        input_path = tmp_path / "my-article.md"
+        input_path.write_text("---\ntitle: null\n---\n\nHello\n", encoding="utf-8")
+
+        # Act
+        bundle_dir = await bundler.bundle(input_path, tmp_path / "output")
+
+        # Assert
+        assert bundle_dir == tmp_path / "output" / "my-article"
+        assert (bundle_dir / "README.md").exists()
+
+    def test_generate_metadata_includes_bundle_info(self, bundler: AssetBundler) -> None:
+        """Test metadata generation includes bundle information."""
+        # Arrange
         frontmatter = {"title": "Test", "source_url": "https://example.com"}
         downloads = {"https://example.com/img1.png": "img1.png"}
 
@@ -328,3 +318,125 @@ class TestAssetBundler:
         assert metadata["title"] == "Test"
         assert metadata["source_url"] == "https://example.com"
         assert "img1.png" in metadata["assets"]
+
+    def test_generate_metadata_keeps_null_frontmatter_fields(self, bundler: AssetBundler) -> None:
+        """Test frontmatter fields set to null are copied, and absent ones are not."""
+        # Arrange
+        frontmatter = {"title": None, "source_url": "https://example.com"}
+
+        # Act
+        metadata = bundler._generate_metadata(frontmatter, {})
+
+        # Assert
+        assert "title" in metadata
+        assert metadata["title"] is None
+        assert "fetched_at" not in metadata
+
+    async def test_download_assets_respects_concurrency_limit(self, tmp_path: Path) -> None:
+        """Test asset downloads never exceed the configured concurrency."""
+        # Arrange
+        config = TransFlowConfig(http_concurrent_downloads=2)
+        bundler = AssetBundler(config)
+
+        urls = [f"https://example.com/img{i}.png" for i in range(6)]
+        in_flight = 0
+        peak = 0
+
+        async def track_download(url, path):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        # Act
+        with patch.object(bundler.http_client, "download_file", side_effect=track_download):
+            result = await bundler._download_assets(urls, tmp_path / "assets")
+
+        # Assert
+        assert len(result) == 6
+        assert peak == 2
+
+    async def test_download_assets_fetches_each_url_once(
+        self, bundler: AssetBundler, tmp_path: Path
+    ) -> None:
+        """Test repeated image URLs are downloaded a single time."""
+        # Arrange
+        urls = ["https://example.com/logo.png", "https://example.com/a.png"] * 3
+        download_calls = []
+
+        async def track_download(url, path):
+            download_calls.append(url)
+
+        # Act
+        with patch.object(bundler.http_client, "download_file", side_effect=track_download):
+            result = await bundler._download_assets(urls, tmp_path)
+
+        # Assert
+        assert download_calls == ["https://example.com/logo.png", "https://example.com/a.png"]
+        assert result == {
+            "https://example.com/logo.png": "logo.png",
+            "https://example.com/a.png": "a.png",
+        }
+
+    async def test_download_assets_skips_existing_files(
+        self, bundler: AssetBundler, tmp_path: Path
+    ) -> None:
+        """Test assets already present in the destination are not downloaded again."""
+        # Arrange
+        (tmp_path / "logo.png").write_bytes(b"png")
+
+        # Act
+        with patch.object(bundler.http_client, "download_file", new=AsyncMock()) as mock_download:
+            result = await bundler._download_assets(["https://example.com/logo.png"], tmp_path)
+
+        # Assert
+        mock_download.assert_not_called()
+        assert result == {"https://example.com/logo.png": "logo.png"}
+
+    async def test_download_assets_retries_empty_files(
+        self, bundler: AssetBundler, tmp_path: Path
+    ) -> None:
+        """Test empty leftovers from an interrupted download are fetched again."""
+        # Arrange
+        (tmp_path / "logo.png").touch()
+
+        # Act
+        with patch.object(bundler.http_client, "download_file", new=AsyncMock()) as mock_download:
+            result = await bundler._download_assets(["https://example.com/logo.png"], tmp_path)
+
+        # Assert
+        mock_download.assert_awaited_once()
+        assert result == {"https://example.com/logo.png": "logo.png"}
+
+    async def test_bundle_many_shares_download_limit(self, tmp_path: Path) -> None:
+        """Test concurrent bundles stay within one shared download limit."""
+        # Arrange
+        config = TransFlowConfig(http_concurrent_downloads=2)
+        bundler = AssetBundler(config)
+
+        inputs = []
+        for n in range(3):
+            path = tmp_path / f"doc{n}.md"
+            images = "\n".join(f"![i](https://example.com/d{n}/img{i}.png)" for i in range(3))
+            path.write_text(f"---\ntitle: Doc {n}\n---\n\n{images}\n", encoding="utf-8")
+            inputs.append(path)
+
+        in_flight = 0
+        peak = 0
+
+        async def track_download(url, path):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            Path(path).write_bytes(b"png")
+
+        # Act
+        with patch.object(bundler.http_client, "download_file", side_effect=track_download):
+            results = await bundler.bundle_many(inputs, tmp_path / "out")
+
+        # Assert
+        assert [result.name for result in results] == ["doc-0", "doc-1", "doc-2"]
+        assert peak == 2
@@ -3,9 +3,14 @@
 Following Google Python testing guidelines.
 """
 
+import asyncio
+import json
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from openai import DEFAULT_TIMEOUT
 
 from transflow.config import TransFlowConfig
 from transflow.core.llm import LLMClient
@@ -24,11 +29,8 @@ class TestLLMClient:
         with pytest.raises(APIError, match="OpenAI API key is required"):
             LLMClient(config)
 
-    def test_init_with_valid_config(self) -> None:
+    def test_init_with_valid_config(self, config: TransFlowConfig) -> None:
         """Test LLM client initializes successfully with valid configuration."""
-        # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-
         # Act
         client = LLMClient(config)
 
@@ -38,10 +40,29 @@ class TestLLMClient:
         assert client.client is not None
         assert client.async_client is not None
 
-    def test_init_with_custom_model(self) -> None:
+    def test_sync_client_is_shared(self, config: TransFlowConfig) -> None:
+        """Test clients with the same credentials reuse one sync OpenAI client."""
+        # Act
+        first = LLMClient(config)
+        second = LLMClient(config)
+
+        # Assert
+        assert first.client is second.client
+        assert first.async_client is not second.async_client
+
+    async def test_shared_session_keeps_openai_timeout(self, config: TransFlowConfig) -> None:
+        """Test a shared session's short timeout is not applied to LLM requests."""
+        # Arrange
+        async with httpx.AsyncClient(timeout=30) as session:
+            # Act
+            client = LLMClient(config, session=session)
+
+            # Assert
+            assert client.async_client.timeout == DEFAULT_TIMEOUT
+
+    def test_init_with_custom_model(self, config: TransFlowConfig) -> None:
         """Test LLM client accepts custom model override."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
         custom_model = "gpt-4-turbo"
 
         # Act
@@ -50,115 +71,116 @@ class TestLLMClient:
         # Assert
         assert client.model == custom_model
 
-    @pytest.mark.asyncio
-    async def test_translate_text_success(self) -> None:
+    async def test_translate_text_success(
+        self, llm_client: LLMClient, chat_replies: list[str]
+    ) -> None:
         """Test successful text translation returns translated content."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        client = LLMClient(config)
-
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content="你好，世界"))]
+        chat_replies.append("你好，世界")
 
         # Act
-        with patch.object(
-            client.async_client.chat.completions,
-            "create",
-            new=AsyncMock(return_value=mock_response),
-        ):
-            result = await client.translate_text("Hello, world", "zh")
+        result = await llm_client.translate_text("Hello, world", "zh")
 
         # Assert
         assert result == "你好，世界"
 
-    @pytest.mark.asyncio
-    async def test_translate_text_empty_input_returns_empty(self) -> None:
-        """Test translation of empty text returns empty string without API call."""
+    async def test_translate_text_reuses_previous_translation(
+        self,
+        llm_client: LLMClient,
+        chat_replies: list[str],
+        chat_requests: list[dict[str, Any]],
+    ) -> None:
+        """Test translating the same text again does not call the API."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        client = LLMClient(config)
+        chat_replies.extend(["你好", "こんにちは"])
+
+        # Act
+        first = await llm_client.translate_text("Hello", "zh")
+        second = await llm_client.translate_text("Hello", "zh")
+        await llm_client.translate_text("Hello", "ja")
 
+        # Assert
+        assert first == second == "你好"
+        assert len(chat_requests) == 2
+
+    async def test_translate_text_empty_input_returns_empty(self, llm_client: LLMClient) -> None:
+        """Test translation of empty text returns empty string without API call."""
+        # Arrange
         mock_create = AsyncMock()
 
         # Act
-        with patch.object(client.async_client.chat.completions, "create", new=mock_create):
-            result = await client.translate_text("  ", "zh")
+        with patch.object(llm_client.async_client.chat.completions, "create", new=mock_create):
+            result = await llm_client.translate_text("  ", "zh")
 
         # Assert
         assert result == "  "
         mock_create.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_translate_text_api_error_raises_translation_error(self) -> None:
+    async def test_translate_text_api_error_raises_translation_error(
+        self, llm_client: LLMClient
+    ) -> None:
         """Test translation raises TranslationError on API failure."""
-        # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        client = LLMClient(config)
-
         # Act & Assert
         with patch.object(
-            client.async_client.chat.completions,
+            llm_client.async_client.chat.completions,
             "create",
             new=AsyncMock(side_effect=Exception("API error")),
         ):
             with pytest.raises(TranslationError, match="Failed to translate text"):
-                await client.translate_text("Hello", "zh")
+                await llm_client.translate_text("Hello", "zh")
 
-    @pytest.mark.asyncio
-    async def test_translate_batch_success(self) -> None:
+    async def test_translate_batch_success(
+        self, llm_client: LLMClient, chat_replies: list[str]
+    ) -> None:
         """Test successful batch translation returns list of translations."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        client = LLMClient(config)
-
-        mock_response = MagicMock()
-        mock_response.choices = [
-            MagicMock(message=MagicMock(content="你好\n\n---SPLIT---\n\n世界"))
-        ]
+        chat_replies.append("你好\n\n---SPLIT---\n\n世界")
 
         # Act
-        with patch.object(
-            client.async_client.chat.completions,
-            "create",
-            new=AsyncMock(return_value=mock_response),
-        ):
-            result = await client.translate_batch(["Hello", "World"], "zh")
+        result = await llm_client.translate_batch(["Hello", "World"], "zh")
 
         # Assert
         assert len(result) == 2
         assert result[0] == "你好"
         assert result[1] == "世界"
 
-    @pytest.mark.asyncio
-    async def test_translate_batch_empty_list_returns_empty(self) -> None:
-        """Test batch translation of empty list returns empty list."""
+    async def test_translate_batch_sends_only_new_texts(
+        self,
+        llm_client: LLMClient,
+        chat_replies: list[str],
+        chat_requests: list[dict[str, Any]],
+    ) -> None:
+        """Test repeated and previously translated texts are not sent again."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        client = LLMClient(config)
+        chat_replies.extend(["你好", "世界"])
+
+        # Act
+        await llm_client.translate_batch(["Hello", "Hello"], "zh")
+        result = await llm_client.translate_batch(["Hello", "World", "Hello"], "zh")
+
+        # Assert
+        assert result == ["你好", "世界", "你好"]
+        assert len(chat_requests) == 2
+        last_prompt = chat_requests[-1]["messages"][1]["content"]
+        assert "Hello" not in last_prompt
 
+    async def test_translate_batch_empty_list_returns_empty(self, llm_client: LLMClient) -> None:
+        """Test batch translation of empty list returns empty list."""
         # Act
-        result = await client.translate_batch([], "zh")
+        result = await llm_client.translate_batch([], "zh")
 
         # Assert
         assert result == []
 
-    @pytest.mark.asyncio
-    async def test_translate_batch_preserves_empty_strings(self) -> None:
+    async def test_translate_batch_preserves_empty_strings(
+        self, llm_client: LLMClient, chat_replies: list[str]
+    ) -> None:
         """Test batch translation preserves empty strings in correct positions."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        client = LLMClient(config)
-
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content="你好"))]
+        chat_replies.append("你好")
 
         # Act
-        with patch.object(
-            client.async_client.chat.completions,
-            "create",
-            new=AsyncMock(return_value=mock_response),
-        ):
-            result = await client.translate_batch(["Hello", "", ""], "zh")
+        result = await llm_client.translate_batch(["Hello", "", ""], "zh")
 
         # Assert
         assert len(result) == 3
@@ -166,81 +188,153 @@ class TestLLMClient:
         assert result[1] == ""
         assert result[2] == ""
 
-    @pytest.mark.asyncio
-    async def test_translate_batch_fallback_on_split_mismatch(self) -> None:
+    async def test_translate_batch_fallback_on_split_mismatch(
+        self,
+        llm_client: LLMClient,
+        chat_replies: list[str],
+        chat_requests: list[dict[str, Any]],
+    ) -> None:
         """Test batch translation falls back to individual translation on split error."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
+        # The batch reply has 1 part instead of 2, then each text is sent alone
+        chat_replies.extend(["你好", "你好", "世界"])
+
+        # Act
+        result = await llm_client.translate_batch(["Hello", "World"], "zh")
+
+        # Assert
+        assert len(result) == 2
+        assert len(chat_requests) == 3
+
+    async def test_translate_individually_runs_concurrently(self) -> None:
+        """Test the per-text fallback overlaps requests up to the concurrency limit."""
+        # Arrange
+        config = TransFlowConfig(openai_api_key="test_key", translate_concurrency=2)
         client = LLMClient(config)
 
-        # First call (batch) returns mismatched splits
-        mock_batch_response = MagicMock()
-        mock_batch_response.choices = [
-            MagicMock(message=MagicMock(content="你好"))  # Only 1 instead of 2
-        ]
+        in_flight = 0
+        peak = 0
 
-        # Individual calls return correct translations
-        mock_individual_responses = [
-            MagicMock(choices=[MagicMock(message=MagicMock(content="你好"))]),
-            MagicMock(choices=[MagicMock(message=MagicMock(content="世界"))]),
-        ]
+        async def mock_translate(text, target_language, source_language):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return text.upper()
 
-        call_count = [0]
+        # Act
+        with patch.object(client, "translate_text", side_effect=mock_translate):
+            result = await client._translate_individually(["a", "", "b", "c"], "zh", "auto")
 
-        async def mock_create(*args, **kwargs):
-            if call_count[0] == 0:
-                call_count[0] += 1
-                return mock_batch_response
-            else:
-                idx = call_count[0] - 1
-                call_count[0] += 1
-                return mock_individual_responses[idx]
+        # Assert
+        assert result == ["A", "", "B", "C"]
+        assert peak == 2
+
+    async def test_translate_batch_offline_maps_results_by_custom_id(
+        self, llm_client: LLMClient
+    ) -> None:
+        """Test Batch API output is mapped back to the input order."""
+        # Arrange
+        def output_line(custom_id: str, content: str) -> str:
+            return json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "response": {
+                        "status_code": 200,
+                        "body": {"choices": [{"message": {"content": content}}]},
+                    },
+                }
+            )
+
+        files = MagicMock()
+        files.create = AsyncMock(return_value=MagicMock(id="file-in"))
+        files.content = AsyncMock(
+            return_value=MagicMock(text=output_line("1", "世界") + "\n" + output_line("0", "你好"))
+        )
+        batches = MagicMock()
+        batches.create = AsyncMock(return_value=MagicMock(id="batch-1", status="in_progress"))
+        batches.retrieve = AsyncMock(
+            return_value=MagicMock(id="batch-1", status="completed", output_file_id="file-out")
+        )
 
         # Act
-        with patch.object(
-            client.async_client.chat.completions, "create", new=AsyncMock(side_effect=mock_create)
-        ):
-            result = await client.translate_batch(["Hello", "World"], "zh")
+        with patch.object(llm_client.async_client, "files", new=files):
+            with patch.object(llm_client.async_client, "batches", new=batches):
+                result = await llm_client.translate_batch_offline(
+                    ["Hello", "", "World", "Hello"], "zh", poll_interval=0
+                )
 
         # Assert
-        assert len(result) == 2
+        assert result == ["你好", "", "世界", "你好"]
+        uploaded = files.create.await_args.kwargs["file"][1].decode("utf-8").splitlines()
+        assert len(uploaded) == 2
+        assert json.loads(uploaded[0])["url"] == "/v1/chat/completions"
+
+    async def test_translate_batch_offline_retries_failed_items_live(
+        self, llm_client: LLMClient
+    ) -> None:
+        """Test texts the batch job did not translate are translated live."""
+        # Arrange
+        files = MagicMock()
+        files.create = AsyncMock(return_value=MagicMock(id="file-in"))
+        batches = MagicMock()
+        batches.create = AsyncMock(
+            return_value=MagicMock(id="batch-1", status="failed", output_file_id=None)
+        )
+
+        # Act
+        with patch.object(llm_client.async_client, "files", new=files):
+            with patch.object(llm_client.async_client, "batches", new=batches):
+                with patch.object(
+                    llm_client, "translate_text", new=AsyncMock(return_value="你好")
+                ) as translate_text:
+                    result = await llm_client.translate_batch_offline(["Hello"], "zh", poll_interval=0)
 
-    def test_estimate_tokens_returns_reasonable_estimate(self) -> None:
+        # Assert
+        assert result == ["你好"]
+        translate_text.assert_awaited_once_with("Hello", "zh", "auto")
+
+    def test_estimate_tokens_returns_reasonable_estimate(self, llm_client: LLMClient) -> None:
         """Test token estimation returns plausible value."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        client = LLMClient(config)
         text = "Hello, world! " * 10  # ~130 characters
 
         # Act
-        tokens = client.estimate_tokens(text)
+        tokens = llm_client.estimate_tokens(text)
 
         # Assert
         assert tokens > 0
         assert tokens < len(text)  # Tokens should be less than character count
 
-    def test_build_translation_prompt_auto_language(self) -> None:
-        """Test translation prompt generation with auto language detection."""
+    def test_estimate_tokens_counts_cjk_per_character_without_tiktoken(
+        self, llm_client: LLMClient
+    ) -> None:
+        """Test the fallback estimate does not undercount Chinese text."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        client = LLMClient(config)
+        text = "你好世界" * 10
 
         # Act
-        prompt = client._build_translation_prompt("Hello", "zh", "auto")
+        with patch("transflow.core.llm._get_encoder", return_value=None):
+            tokens = llm_client.estimate_tokens(text)
+
+        # Assert
+        assert tokens == len(text)
+
+    def test_build_translation_prompt_auto_language(self, llm_client: LLMClient) -> None:
+        """Test translation prompt generation with auto language detection."""
+        # Act
+        prompt = llm_client._build_translation_prompt("Hello", "zh", "auto")
 
         # Assert
         assert "Chinese" in prompt
         assert "Hello" in prompt
         assert "Translate" in prompt
 
-    def test_build_translation_prompt_specific_languages(self) -> None:
+    def test_build_translation_prompt_specific_languages(self, llm_client: LLMClient) -> None:
         """Test translation prompt generation with specific source and target languages."""
-        # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        client = LLMClient(config)
-
         # Act
-        prompt = client._build_translation_prompt("Hello", "zh", "en")
+        prompt = llm_client._build_translation_prompt("Hello", "zh", "en")
 
         # Assert
         assert "English" in prompt
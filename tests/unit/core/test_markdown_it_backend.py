@@ -0,0 +1,93 @@
+"""Tests for the markdown-it-py translator backend.
+
+Following Google Python testing guidelines.
+"""
+
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from transflow.config import TransFlowConfig
+from transflow.core.markdown_it_backend import MarkdownItBackend
+from transflow.core.translator import MarkdownTranslator
+
+
+class TestMarkdownItBackend:
+    """Test MarkdownItBackend."""
+
+    def test_extract_translatable_collects_paragraphs_and_headings(self) -> None:
+        """Test paragraphs and headings are collected in document order."""
+        # Arrange
+        backend = MarkdownItBackend()
+        tokens = backend.parse("# Title\n\nFirst paragraph.\n\n> Quoted\n\n- Item\n")
+
+        # Act
+        nodes = backend.extract_translatable(tokens)
+
+        # Assert
+        assert [text for _, text in nodes] == ["Title", "First paragraph.", "Quoted", "Item"]
+
+    def test_extract_translatable_skips_code(self) -> None:
+        """Test code blocks, code spans, HTML and URLs are not collected."""
+        # Arrange
+        backend = MarkdownItBackend()
+        content = (
+            "```python\nprint('hi')\n```\n\n"
+            "<div>html</div>\n\n"
+            "Run `make` and see [docs](https://example.com) ![logo](logo.png)\n"
+        )
+
+        # Act
+        nodes = backend.extract_translatable(backend.parse(content))
+
+        # Assert
+        assert [text for _, text in nodes] == ["Run  and see docs logo"]
+
+    def test_replace_text_renders_escaped(self) -> None:
+        """Test replaced text is rendered as plain, escaped text."""
+        # Arrange
+        backend = MarkdownItBackend()
+        tokens = backend.parse("Hello *world*\n")
+        [(inline, _)] = backend.extract_translatable(tokens)
+
+        # Act
+        backend.replace_text(inline, "你好 <b>")
+        html = backend.render(tokens)
+
+        # Assert
+        assert html == "<p>你好 &lt;b&gt;</p>\n"
+
+    def test_replace_text_keeps_images(self) -> None:
+        """Test images in a translated paragraph are kept after the new text."""
+        # Arrange
+        backend = MarkdownItBackend()
+        tokens = backend.parse("See ![Diagram](assets/diagram.png) here.\n")
+        [(inline, _)] = backend.extract_translatable(tokens)
+
+        # Act
+        backend.replace_text(inline, "见图。")
+        html = backend.render(tokens)
+
+        # Assert
+        assert html == '<p>见图。<img src="assets/diagram.png" alt="Diagram" /></p>\n'
+
+
+class TestMarkdownTranslatorWithMarkdownIt:
+    """Test MarkdownTranslator configured for markdown-it."""
+
+    async def test_translate_file_uses_markdown_it(self, tmp_path: Path) -> None:
+        """Test translate_file parses and renders with markdown-it."""
+        # Arrange
+        config = TransFlowConfig(openai_api_key="test_key", translate_parser="markdown-it")
+        translator = MarkdownTranslator(config, target_language="zh")
+        input_path = tmp_path / "input.md"
+        input_path.write_text("# Hello\n\n```\ncode\n```\n", encoding="utf-8")
+        output_path = tmp_path / "output.md"
+        translator._translate_nodes_in_batches = AsyncMock(return_value={"Hello": "你好"})
+
+        # Act
+        await translator.translate_file(input_path, output_path)
+
+        # Assert
+        assert output_path.read_text(encoding="utf-8") == (
+            "<h1>你好</h1>\n<pre><code>code\n</code></pre>\n"
+        )
@@ -0,0 +1,71 @@
+"""Tests for the persistent translation cache."""
+
+from pathlib import Path
+
+from transflow.core.translation_cache import TranslationCache
+
+
+class TestTranslationCache:
+    """Tests for TranslationCache class."""
+
+    def test_get_many_returns_stored_translations(self, tmp_path: Path) -> None:
+        """Test stored translations are returned for matching texts only."""
+        # Arrange
+        cache = TranslationCache(tmp_path / "translations.db")
+        cache.put_many("gpt-4o", "zh", {"Hello": "你好", "World": "世界"})
+
+        # Act
+        found = cache.get_many("gpt-4o", "zh", ["Hello", "Missing"])
+
+        # Assert
+        assert found == {"Hello": "你好"}
+
+    def test_entries_are_scoped_by_model_and_language(self, tmp_path: Path) -> None:
+        """Test a different model or target language does not reuse an entry."""
+        # Arrange
+        cache = TranslationCache(tmp_path / "translations.db")
+        cache.put_many("gpt-4o", "zh", {"Hello": "你好"})
+
+        # Act & Assert
+        assert cache.get_many("other-model", "zh", ["Hello"]) == {}
+        assert cache.get_many("gpt-4o", "ja", ["Hello"]) == {}
+
+    def test_entries_persist_across_instances(self, tmp_path: Path) -> None:
+        """Test a new cache instance reads translations written by another."""
+        # Arrange
+        path = tmp_path / "translations.db"
+        writer = TranslationCache(path)
+        writer.put_many("gpt-4o", "zh", {"Hello": "你好"})
+        writer.close()
+
+        # Act
+        found = TranslationCache(path).get_many("gpt-4o", "zh", ["Hello"])
+
+        # Assert
+        assert found == {"Hello": "你好"}
+
+    def test_get_many_handles_more_texts_than_one_query_allows(self, tmp_path: Path) -> None:
+        """Test lookups of over a thousand texts are split across queries."""
+        # Arrange
+        cache = TranslationCache(tmp_path / "translations.db")
+        texts = [f"Text {i}" for i in range(1200)]
+        cache.put_many("gpt-4o", "zh", {text: text.upper() for text in texts})
+
+        # Act
+        found = cache.get_many("gpt-4o", "zh", texts)
+
+        # Assert
+        assert len(found) == 1200
+
+    def test_unusable_path_is_ignored(self, tmp_path: Path) -> None:
+        """Test an unwritable cache location behaves like an empty cache."""
+        # Arrange
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+        cache = TranslationCache(blocker / "translations.db")
+
+        # Act
+        cache.put_many("gpt-4o", "zh", {"Hello": "你好"})
+
+        # Assert
+        assert cache.get_many("gpt-4o", "zh", ["Hello"]) == {}
@@ -3,24 +3,25 @@
 Following Google Python testing guidelines.
 """
 
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import marko
 import pytest
 
 from transflow.config import TransFlowConfig
 from transflow.core.translator import MarkdownTranslator
 from transflow.exceptions import TranslationError
 
+_LARGE_NODE_SET = [(None, f"Text {i}") for i in range(25)]
+
 
 class TestMarkdownTranslator:
     """Tests for MarkdownTranslator class."""
 
-    def test_init_creates_llm_client(self) -> None:
+    def test_init_creates_llm_client(self, config: TransFlowConfig) -> None:
         """Test translator initialization creates LLM client."""
-        # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-
         # Act
         translator = MarkdownTranslator(config, target_language="zh")
 
@@ -29,10 +30,9 @@ class TestMarkdownTranslator:
         assert translator.target_language == "zh"
         assert translator.llm_client is not None
 
-    def test_init_with_custom_model(self) -> None:
+    def test_init_with_custom_model(self, config: TransFlowConfig) -> None:
         """Test translator accepts custom model parameter."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
         custom_model = "gpt-4-turbo"
 
         # Act
@@ -41,82 +41,78 @@ class TestMarkdownTranslator:
         # Assert
         assert translator.llm_client.model == custom_model
 
-    @pytest.mark.asyncio
-    async def test_translate_file_creates_output_file(self) -> None:
+    async def test_translate_file_creates_output_file(
+        self, translator: MarkdownTranslator, tmp_path: Path
+    ) -> None:
         """Test translate_file creates output file with translated content."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        translator = MarkdownTranslator(config, target_language="zh")
+        input_path = tmp_path / "test_input.md"
+        input_path.write_text("# Hello World\n\nThis is a test.", encoding="utf-8")
+        output_path = tmp_path / "test_output.md"
+        translator._translate_nodes_in_batches = AsyncMock(return_value={
+            "Hello World": "你好，世界",
+            "This is a test.": "这是一个测试",
+        })
 
-        input_content = "# Hello World\n\nThis is a test."
-        input_path = Path("/tmp/test_input.md")
-        output_path = Path("/tmp/test_output.md")
+        # Act
+        await translator.translate_file(input_path, output_path)
 
-        # Mock file operations
-        with patch.object(Path, "read_text", return_value=input_content):
-            with patch.object(Path, "write_text") as mock_write:
-                with patch.object(Path, "mkdir"):
-                    # Mock translation
-                    mock_translate = AsyncMock(return_value={
-                        "Hello World": "你好，世界",
-                        "This is a test.": "这是一个测试",
-                    })
-                    translator._translate_nodes_in_batches = mock_translate
+        # Assert
+        written_content = output_path.read_text(encoding="utf-8")
+        assert "你好，世界" in written_content
+        assert "这是一个测试" in written_content
+
+    async def test_translate_file_creates_output_directory(
+        self, translator: MarkdownTranslator, tmp_path: Path
+    ) -> None:
+        """Test translate_file creates missing parent directories of the output."""
+        # Arrange
+        input_path = tmp_path / "input.md"
+        input_path.write_text("Hello", encoding="utf-8")
+        output_path = tmp_path / "nested" / "dir" / "output.md"
+        translator._translate_nodes_in_batches = AsyncMock(return_value={"Hello": "你好"})
 
-                    # Act
-                    await translator.translate_file(input_path, output_path)
+        # Act
+        await translator.translate_file(input_path, output_path)
 
         # Assert
-        mock_write.assert_called_once()
-        written_content = mock_write.call_args[0][0]
-        assert isinstance(written_content, str)
+        assert output_path.read_text(encoding="utf-8") == "<p>你好</p>\n"
 
-    @pytest.mark.asyncio
-    async def test_translate_file_handles_empty_content(self) -> None:
+    async def test_translate_file_handles_empty_content(
+        self, translator: MarkdownTranslator, tmp_path: Path
+    ) -> None:
         """Test translate_file handles files with no translatable content."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        translator = MarkdownTranslator(config)
-
         input_content = "```python\nprint('code only')\n```"
-        input_path = Path("/tmp/test_input.md")
-        output_path = Path("/tmp/test_output.md")
+        input_path = tmp_path / "test_input.md"
+        input_path.write_text(input_content, encoding="utf-8")
+        output_path = tmp_path / "test_output.md"
 
-        # Mock file operations
-        with patch.object(Path, "read_text", return_value=input_content):
-            with patch.object(Path, "write_text") as mock_write:
-                with patch.object(Path, "mkdir"):
-                    # Act
-                    await translator.translate_file(input_path, output_path)
+        # Act
+        await translator.translate_file(input_path, output_path)
 
         # Assert
-        mock_write.assert_called_once()
         # Should write original content unchanged
-        written_content = mock_write.call_args[0][0]
-        assert "print('code only')" in written_content
+        assert output_path.read_text(encoding="utf-8") == input_content
 
-    @pytest.mark.asyncio
-    async def test_translate_file_error_raises_translation_error(self) -> None:
+    async def test_translate_file_error_raises_translation_error(
+        self, translator: MarkdownTranslator, tmp_path: Path
+    ) -> None:
         """Test translate_file raises TranslationError on failure."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        translator = MarkdownTranslator(config)
-
-        input_path = Path("/tmp/test_input.md")
-        output_path = Path("/tmp/test_output.md")
+        input_path = tmp_path / "missing.md"
+        output_path = tmp_path / "test_output.md"
 
         # Act & Assert
-        with patch.object(Path, "read_text", side_effect=IOError("Read error")):
-            with pytest.raises(TranslationError, match="Failed to translate file"):
-                await translator.translate_file(input_path, output_path)
+        with pytest.raises(TranslationError, match="Failed to translate file"):
+            await translator.translate_file(input_path, output_path)
+        assert not output_path.exists()
 
-    def test_extract_translatable_nodes_includes_paragraphs(self) -> None:
+    def test_extract_translatable_nodes_includes_paragraphs(
+        self, translator: MarkdownTranslator
+    ) -> None:
         """Test node extraction includes paragraph text."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        translator = MarkdownTranslator(config)
-
-        import marko
         doc = marko.parse("This is a paragraph.")
 
         # Act
@@ -126,13 +122,11 @@ class TestMarkdownTranslator:
         assert len(nodes) > 0
         assert any("paragraph" in str(node).lower() for node, _ in nodes)
 
-    def test_extract_translatable_nodes_includes_headings(self) -> None:
+    def test_extract_translatable_nodes_includes_headings(
+        self, translator: MarkdownTranslator
+    ) -> None:
         """Test node extraction includes heading text."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        translator = MarkdownTranslator(config)
-
-        import marko
         doc = marko.parse("# My Heading\n\nSome content.")
 
         # Act
@@ -143,13 +137,11 @@ class TestMarkdownTranslator:
         texts = [text for _, text in nodes]
         assert any("Heading" in t for t in texts)
 
-    def test_extract_translatable_nodes_skips_code_blocks(self) -> None:
+    def test_extract_translatable_nodes_skips_code_blocks(
+        self, translator: MarkdownTranslator
+    ) -> None:
         """Test node extraction excludes code blocks."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        translator = MarkdownTranslator(config)
-
-        import marko
         doc = marko.parse("```python\nprint('hello')\n```\n\nText content.")
 
         # Act
@@ -160,13 +152,11 @@ class TestMarkdownTranslator:
         assert not any("print" in t for t in texts)  # Code should be excluded
         assert any("Text content" in t for t in texts)  # Text should be included
 
-    def test_extract_text_from_inline_handles_simple_text(self) -> None:
+    def test_extract_text_from_inline_handles_simple_text(
+        self, translator: MarkdownTranslator
+    ) -> None:
         """Test inline text extraction from simple paragraph."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        translator = MarkdownTranslator(config)
-
-        import marko
         doc = marko.parse("Hello world")
         paragraph = doc.children[0]
 
@@ -176,13 +166,11 @@ class TestMarkdownTranslator:
         # Assert
         assert "Hello world" in text
 
-    def test_extract_text_from_inline_skips_code_spans(self) -> None:
+    def test_extract_text_from_inline_skips_code_spans(
+        self, translator: MarkdownTranslator
+    ) -> None:
         """Test inline text extraction excludes inline code."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        translator = MarkdownTranslator(config)
-
-        import marko
         doc = marko.parse("Text with `code` here")
         paragraph = doc.children[0]
 
@@ -193,14 +181,11 @@ class TestMarkdownTranslator:
         # Should include text but may or may not include code
         assert "Text" in text
 
-    @pytest.mark.asyncio
-    async def test_translate_nodes_in_batches_calls_llm(self) -> None:
+    async def test_translate_nodes_in_batches_calls_llm(
+        self, translator: MarkdownTranslator
+    ) -> None:
         """Test batch translation invokes LLM client."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        translator = MarkdownTranslator(config)
-
-        import marko
         doc = marko.parse("# Title\n\nParagraph.")
         nodes = translator._extract_translatable_nodes(doc)
 
@@ -218,16 +203,36 @@ class TestMarkdownTranslator:
         assert len(translations) == len(nodes)
         mock_translate_batch.assert_called()
 
-    @pytest.mark.asyncio
-    async def test_translate_nodes_in_batches_with_large_set(self) -> None:
+    @pytest.mark.parametrize(("batch_size", "expected_calls"), [(5, 5), (10, 3), (25, 1)])
+    async def test_translate_nodes_in_batches_with_large_set(
+        self, translator: MarkdownTranslator, batch_size: int, expected_calls: int
+    ) -> None:
         """Test batch translation splits large node sets into batches."""
         # Arrange
-        config = TransFlowConfig(openai_api_key="test_key")
-        translator = MarkdownTranslator(config)
+        mock_translate_batch = AsyncMock(
+            side_effect=lambda texts, lang: [f"Translated {t}" for t in texts]
+        )
 
-        # Create many nodes
-        nodes = [(None, f"Text {i}") for i in range(25)]
+        # Act
+        with patch.object(
+            translator.llm_client,
+            "translate_batch",
+            new=mock_translate_batch,
+        ):
+            translations = await translator._translate_nodes_in_batches(
+                _LARGE_NODE_SET, batch_size=batch_size
+            )
 
+        # Assert
+        assert len(translations) == 25
+        assert mock_translate_batch.call_count == expected_calls
+
+    async def test_translate_nodes_in_batches_respects_token_budget(
+        self, translator: MarkdownTranslator
+    ) -> None:
+        """Test batches are closed early once the token budget is reached."""
+        # Arrange
+        nodes = [(None, "short"), (None, "x" * 300), (None, "tail")]
         mock_translate_batch = AsyncMock(
             side_effect=lambda texts, lang: [f"Translated {t}" for t in texts]
         )
@@ -238,9 +243,136 @@ class TestMarkdownTranslator:
             "translate_batch",
             new=mock_translate_batch,
         ):
-            translations = await translator._translate_nodes_in_batches(nodes, batch_size=10)
+            translations = await translator._translate_nodes_in_batches(
+                nodes, batch_size=10, batch_tokens=50
+            )
 
         # Assert
-        assert len(translations) == 25
-        # Should have called translate_batch 3 times (10 + 10 + 5)
-        assert mock_translate_batch.call_count == 3
+        assert [call.args[0] for call in mock_translate_batch.await_args_list] == [
+            ["short"],
+            ["x" * 300],
+            ["tail"],
+        ]
+        assert len(translations) == 3
+
+    async def test_translate_nodes_in_batches_sends_repeated_texts_once(
+        self, translator: MarkdownTranslator
+    ) -> None:
+        """Test duplicate texts are translated once and shared."""
+        # Arrange
+        nodes = [(None, "Note:"), (None, "Body"), (None, "Note:")]
+        mock_translate_batch = AsyncMock(return_value=["注意：", "正文"])
+
+        # Act
+        with patch.object(
+            translator.llm_client,
+            "translate_batch",
+            new=mock_translate_batch,
+        ):
+            translations = await translator._translate_nodes_in_batches(nodes)
+
+        # Assert
+        mock_translate_batch.assert_awaited_once_with(["Note:", "Body"], "zh")
+        assert translations == {"Note:": "注意：", "Body": "正文"}
+
+    async def test_translate_nodes_in_batches_runs_batches_concurrently(self) -> None:
+        """Test batches are dispatched concurrently up to the configured limit."""
+        # Arrange
+        config = TransFlowConfig(openai_api_key="test_key", translate_concurrency=2)
+        translator = MarkdownTranslator(config)
+
+        nodes = [(None, f"Text {i}") for i in range(5)]
+        in_flight = 0
+        peak = 0
+
+        async def fake_translate_batch(texts, lang):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [f"Translated {t}" for t in texts]
+
+        # Act
+        with patch.object(
+            translator.llm_client,
+            "translate_batch",
+            new=AsyncMock(side_effect=fake_translate_batch),
+        ):
+            translations = await translator._translate_nodes_in_batches(nodes, batch_size=1)
+
+        # Assert
+        assert peak == 2
+        assert translations == {f"Text {i}": f"Translated Text {i}" for i in range(5)}
+
+    async def test_translate_nodes_in_batches_reuses_cached_translations(self) -> None:
+        """Test texts translated in an earlier run are not sent again."""
+        # Arrange
+        config = TransFlowConfig(openai_api_key="test_key", translate_cache=True)
+        nodes = [(None, "Hello"), (None, "World")]
+
+        first = MarkdownTranslator(config)
+        with patch.object(
+            first.llm_client,
+            "translate_batch",
+            new=AsyncMock(return_value=["你好", "世界"]),
+        ):
+            await first._translate_nodes_in_batches(nodes)
+
+        second = MarkdownTranslator(config)
+        mock_translate_batch = AsyncMock()
+
+        # Act
+        with patch.object(second.llm_client, "translate_batch", new=mock_translate_batch):
+            translations = await second._translate_nodes_in_batches(nodes)
+
+        # Assert
+        mock_translate_batch.assert_not_called()
+        assert translations == {"Hello": "你好", "World": "世界"}
+
+    async def test_translate_file_closes_translation_cache(self, tmp_path: Path) -> None:
+        """Test the cache's database connection is closed once the file is done."""
+        # Arrange
+        config = TransFlowConfig(openai_api_key="test_key", translate_cache=True)
+        translator = MarkdownTranslator(config)
+        input_path = tmp_path / "input.md"
+        input_path.write_text("Hello", encoding="utf-8")
+
+        # Act
+        with patch.object(
+            translator.llm_client,
+            "translate_batch",
+            new=AsyncMock(return_value=["你好"]),
+        ):
+            await translator.translate_file(input_path, tmp_path / "output.md")
+
+        # Assert
+        assert translator.cache is not None
+        assert translator.cache._connection is None
+        assert (tmp_path / "output.md").exists()
+
+    async def test_translate_file_keeps_frontmatter_and_images(
+        self, translator: MarkdownTranslator, tmp_path: Path
+    ) -> None:
+        """Test frontmatter is not translated and images survive translation."""
+        # Arrange
+        input_path = tmp_path / "input.md"
+        input_path.write_text(
+            "---\ntitle: Hello\n---\n\nSee ![Diagram](assets/diagram.png) here.\n",
+            encoding="utf-8",
+        )
+        output_path = tmp_path / "output.md"
+        translator._translate_nodes_in_batches = AsyncMock(
+            return_value={"See Diagram here.": "见图。"}
+        )
+
+        # Act
+        await translator.translate_file(input_path, output_path)
+
+        # Assert
+        [(_, text)] = translator._translate_nodes_in_batches.call_args[0][0]
+        assert text == "See Diagram here."
+        written_content = output_path.read_text(encoding="utf-8")
+        assert written_content.startswith("---\ntitle: Hello\n---\n")
+        assert "见图。" in written_content
+        assert 'src="assets/diagram.png"' in written_content
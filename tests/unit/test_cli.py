@@ -1,12 +1,23 @@
 """Tests for CLI module."""
 
-import pytest
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import yaml
 from typer.testing import CliRunner
 
-from transflow.cli import app
+from transflow.cli import app, make_progress, run_async
+from transflow.commands.run import _run_pipeline
+from transflow.config import TransFlowConfig
 
 
-runner = CliRunner()
+# Plain output: the tests match substrings, so skip Rich's color handling
+runner = CliRunner(env={"NO_COLOR": "1", "TERM": "dumb"})
 
 
 def test_cli_version() -> None:
@@ -22,3 +33,172 @@ def test_cli_help() -> None:
     result = runner.invoke(app, ["--help"])
     assert result.exit_code == 0
     assert "Transform web content" in result.stdout or "download" in result.stdout
+
+
+def test_cli_import_does_not_load_command_dependencies() -> None:
+    """Test importing the CLI does not eagerly import heavy command modules."""
+    code = (
+        "import sys, transflow.cli; "
+        "heavy = ['transflow.core.translator', 'transflow.core.bundler', "
+        "'transflow.core.extractor', 'transflow.config', 'rich.progress']; "
+        "print(','.join(m for m in heavy if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_cli_version_does_not_import_pydantic() -> None:
+    """Test the --version fast path never loads pydantic or the settings model."""
+    code = (
+        "import sys\n"
+        "from transflow.cli import app\n"
+        "try:\n"
+        "    app(['--version'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "loaded = [m for m in ('pydantic', 'pydantic_settings') if m in sys.modules]\n"
+        "print(f'loaded={loaded}')\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert "TransFlow version" in result.stdout
+    assert "loaded=[]" in result.stdout
+
+
+def test_cli_shell_runs_commands_until_exit() -> None:
+    """Test shell dispatches each input line and survives command exits."""
+    result = runner.invoke(app, ["shell"], input="--version\nbogus\n\nexit\n")
+    assert result.exit_code == 0
+    assert result.stdout.count("TransFlow version") == 1
+
+
+def test_cli_shell_reports_unbalanced_quotes() -> None:
+    """Test shell reports parse errors instead of crashing."""
+    result = runner.invoke(app, ["shell"], input="download 'oops\n")
+    assert result.exit_code == 0
+    assert "No closing quotation" in result.stdout
+
+
+async def test_run_pipeline_chains_stages(tmp_path: Path) -> None:
+    """Test the run pipeline bundles the download and translates the bundle's README."""
+    config = TransFlowConfig(firecrawl_api_key="test_key", openai_api_key="test_key")
+    bundle_dir = tmp_path / "bundle"
+
+    with patch(
+        "transflow.core.extractor.MarkdownExtractor.fetch_and_save", new=AsyncMock()
+    ) as mock_fetch, patch(
+        "transflow.core.translator.MarkdownTranslator.translate_file", new=AsyncMock()
+    ) as mock_translate, patch(
+        "transflow.core.bundler.AssetBundler.bundle", new=AsyncMock(return_value=bundle_dir)
+    ) as mock_bundle:
+        result = await _run_pipeline(
+            config, "https://example.com/my-article", tmp_path, "zh", "{slug}"
+        )
+
+    assert result == bundle_dir
+    downloaded_path = mock_fetch.call_args[0][1]
+    assert downloaded_path.name == "my-article.md"
+    assert mock_bundle.call_args[0] == (downloaded_path, tmp_path, "{slug}")
+    readme_path = bundle_dir / "README.md"
+    assert mock_translate.call_args[0] == (readme_path, readme_path)
+
+
+async def test_run_pipeline_localizes_assets(
+    tmp_path: Path, isolated_cache_home: Path
+) -> None:
+    """Test a full run against fake APIs yields a translated bundle with local assets."""
+    config = TransFlowConfig(firecrawl_api_key="test_key", openai_api_key="test_key")
+    scraped = {
+        "success": True,
+        "data": {
+            "markdown": "Intro paragraph.\n\n![Diagram](https://cdn.example.com/diagram.png)\n",
+            "metadata": {"title": "Source Title"},
+        },
+    }
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/scrape"):
+            return httpx.Response(200, json=scraped)
+        if request.url.host == "cdn.example.com":
+            return httpx.Response(200, content=b"\x89PNG")
+        # Chat completions: one "translation" per segment of the batch
+        prompt = json.loads(request.content)["messages"][-1]["content"]
+        segments = prompt.count("\n\n---SPLIT---\n\n") + 1
+        message = {
+            "role": "assistant",
+            "content": "\n\n---SPLIT---\n\n".join(["译文"] * segments),
+        }
+        return httpx.Response(
+            200,
+            json={
+                "id": "chatcmpl-1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": config.openai_model,
+                "choices": [{"index": 0, "finish_reason": "stop", "message": message}],
+            },
+        )
+
+    def create_session(*args: Any, **kwargs: Any) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(handle))
+
+    with patch("transflow.utils.http.create_session", new=create_session):
+        bundle_dir = await _run_pipeline(
+            config, "https://example.com/my-article", tmp_path, "zh", "{slug}"
+        )
+
+    readme = (bundle_dir / "README.md").read_text(encoding="utf-8")
+    meta = yaml.safe_load((bundle_dir / "meta.yaml").read_text(encoding="utf-8"))
+    asset_names = [path.name for path in (bundle_dir / "assets").iterdir()]
+    assert len(asset_names) == 1
+    assert f"assets/{asset_names[0]}" in readme
+    assert "cdn.example.com" not in readme
+    assert "译文" in readme
+    assert readme.startswith("---\ntitle: Source Title\n")
+    assert meta["title"] == "Source Title"
+
+
+def test_make_progress_disabled_without_terminal() -> None:
+    """Test the spinner is transient and disabled when output is not a TTY."""
+    progress = make_progress()
+    assert progress.disable is True
+    assert progress.live.transient is True
+
+
+def test_unexpected_error_exits_without_traceback() -> None:
+    """Test unexpected errors exit with code 1 and no traceback unless verbose."""
+    with patch("transflow.config.load_config", side_effect=ValueError("boom")):
+        result = runner.invoke(app, ["download", "https://example.com"])
+
+    assert result.exit_code == 1
+    assert "Unexpected error" in result.stdout
+    assert "Traceback" not in result.output
+
+
+def test_run_async_falls_back_to_asyncio_without_uvloop() -> None:
+    """Test coroutines still run on the standard loop when uvloop is absent."""
+
+    async def answer() -> int:
+        return 42
+
+    with patch.dict(sys.modules, {"uvloop": None}):
+        assert run_async(answer()) == 42
+
+
+def test_entry_point_version_fast_path() -> None:
+    """Test the console entry point answers --version before importing Typer."""
+    code = (
+        "import sys\n"
+        "sys.argv = ['transflow', '--version']\n"
+        "from transflow.__main__ import main\n"
+        "main()\n"
+        "print(f\"typer_loaded={'typer' in sys.modules}\")\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert "TransFlow version 3.0.0" in result.stdout
+    assert "typer_loaded=False" in result.stdout
@@ -1,18 +1,35 @@
 """Tests for config command in CLI."""
 
-from typer.testing import CliRunner
+import io
+from unittest.mock import patch
 
+import pytest
+from typer.testing import CliRunner, Result
+
+from transflow import cli
 from transflow.cli import app
+from transflow.commands import config as config_command
+from transflow.config_manager import ConfigItem, ConfigSource
+
+# Plain output: the tests match substrings, so skip Rich's color handling
+runner = CliRunner(env={"NO_COLOR": "1", "TERM": "dumb"})
+
 
-runner = CliRunner()
+@pytest.fixture(scope="module")
+def config_show_result(tmp_path_factory: pytest.TempPathFactory) -> Result:
+    """Output of ``transflow config --show``, shared by the tests that only read it."""
+    # Module-scoped fixtures run outside the autouse cache isolation
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+        return runner.invoke(app, ["config", "--show"])
 
 
 class TestConfigCommand:
     """Test config command."""
 
-    def test_config_show(self):
+    def test_config_show(self, config_show_result: Result):
         """Test config show command."""
-        result = runner.invoke(app, ["config", "--show"])
+        result = config_show_result
         assert result.exit_code == 0
         assert "TransFlow Configuration" in result.stdout or "Configuration" in result.stdout
         assert "openai_api_key" in result.stdout or "API" in result.stdout
@@ -42,9 +59,9 @@ class TestConfigCommand:
 class TestConfigIntegration:
     """Integration tests for config command."""
 
-    def test_config_show_includes_all_categories(self):
+    def test_config_show_includes_all_categories(self, config_show_result: Result):
         """Test that config show includes all configuration categories."""
-        result = runner.invoke(app, ["config", "--show"])
+        result = config_show_result
         assert result.exit_code == 0
         # Check for at least one item from each category
         # (exact output format depends on Rich table rendering)
@@ -58,9 +75,9 @@ class TestConfigIntegration:
         for category in categories:
             assert category.lower() in output
 
-    def test_config_show_has_status_indicators(self):
+    def test_config_show_has_status_indicators(self, config_show_result: Result):
         """Test that config show includes status indicators."""
-        result = runner.invoke(app, ["config", "--show"])
+        result = config_show_result
         assert result.exit_code == 0
         # Status indicators: [SET], [OPTIONAL], [MISSING]
         output = result.stdout
@@ -74,10 +91,10 @@ class TestConfigIntegration:
         )
         assert has_status
 
-    def test_config_show_masks_api_keys(self):
+    def test_config_show_masks_api_keys(self, config_show_result: Result):
         """Test that config show masks API keys."""
         # This test ensures that API keys are not shown in plain text
-        result = runner.invoke(app, ["config", "--show"])
+        result = config_show_result
         assert result.exit_code == 0
         # API keys should be masked or hidden
         # They should not contain full "sk_test_" or "sk_live_" prefixes followed by full keys
@@ -88,3 +105,70 @@ class TestConfigIntegration:
             # If API key content is shown, it should have *** (masking indicator)
             # or be [NOT SET] or similar
             assert "***" in output or "NOT SET" in output or "MISSING" in output
+
+
+class _CountingWriter(io.StringIO):
+    """String buffer that counts write() calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.write_count = 0
+
+    def write(self, s: str) -> int:
+        self.write_count += 1
+        return super().write(s)
+
+
+class TestConfigOutputBuffering:
+    """Test config report output is buffered."""
+
+    def test_config_show_writes_once(self):
+        """Test config show flushes the whole report in a single write."""
+        writer = _CountingWriter()
+        cli.console.file = writer
+        try:
+            config_command.config(show=True, validate=False)
+        finally:
+            cli.console.file = None
+
+        assert writer.write_count == 1
+        assert "TransFlow Configuration" in writer.getvalue()
+
+
+class TestConfigCombinedFlags:
+    """Test combining config flags."""
+
+    def test_config_show_and_validate(self):
+        """Test --show --validate renders both reports."""
+        result = runner.invoke(app, ["config", "--show", "--validate"])
+        assert result.exit_code in [0, 1]
+        assert "TransFlow Configuration" in result.stdout
+        assert "Configuration Validation" in result.stdout
+
+
+class TestConfigValidationOutput:
+    """Test validation report formatting."""
+
+    def test_validate_lists_numbered_issues(self):
+        """Test errors and warnings are listed as numbered blocks."""
+        issues = (False, ["Optional value missing"], ["Key A missing", "Key B missing"])
+        with patch("transflow.config_manager.validate_config", return_value=issues):
+            result = runner.invoke(app, ["config", "--validate"])
+
+        assert result.exit_code == 1
+        assert "Errors:\n  1. Key A missing\n  2. Key B missing\n\n" in result.stdout
+        assert "Warnings:\n  1. Optional value missing\n" in result.stdout
+
+
+class TestStyledStatus:
+    """Test status color selection."""
+
+    def test_styled_status_colors(self):
+        """Test each status maps to its color."""
+        missing = ConfigItem("k", None, ConfigSource.NOT_SET, required=True)
+        optional = ConfigItem("k", None, ConfigSource.NOT_SET)
+        set_item = ConfigItem("k", "v", ConfigSource.ENVIRONMENT)
+
+        assert config_command._styled_status(missing) == "[red][MISSING][/red]"
+        assert config_command._styled_status(optional) == "[yellow][OPTIONAL][/yellow]"
+        assert config_command._styled_status(set_item) == "[green][SET][/green]"
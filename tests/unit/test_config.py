@@ -1,14 +1,23 @@
 """Test configuration module."""
 
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 from pydantic import ValidationError
 
-from transflow.config import TransFlowConfig
+from transflow.config import TransFlowConfig, load_config
+
 
+@pytest.fixture(scope="module")
+def default_config() -> TransFlowConfig:
+    """Configuration built from defaults and the unmodified environment."""
+    return TransFlowConfig()
 
-def test_default_config() -> None:
+
+def test_default_config(default_config: TransFlowConfig) -> None:
     """Test default configuration values."""
-    config = TransFlowConfig()
+    config = default_config
     
     assert config.openai_model == "gpt-4o"
     assert config.default_language == "zh"
@@ -16,6 +25,9 @@ def test_default_config() -> None:
     assert config.http_timeout == 30
     assert config.http_max_retries == 3
     assert config.http_concurrent_downloads == 5
+    assert config.translate_batch_size == 10
+    assert config.firecrawl_cache_ttl == 0
+    assert config.translate_concurrency == 4
 
 
 def test_config_validation_timeout() -> None:
@@ -30,6 +42,12 @@ def test_config_validation_log_level() -> None:
         TransFlowConfig(log_level="INVALID")
 
 
+def test_config_log_level_is_normalized() -> None:
+    """Test log level is accepted case-insensitively and upper-cased."""
+    assert TransFlowConfig(log_level="debug").log_level == "DEBUG"
+    assert TransFlowConfig(log_level="WARNING").log_level == "WARNING"
+
+
 def test_config_validation_concurrent_downloads() -> None:
     """Test concurrent downloads validation."""
     with pytest.raises(ValidationError):
@@ -37,3 +55,72 @@ def test_config_validation_concurrent_downloads() -> None:
     
     with pytest.raises(ValidationError):
         TransFlowConfig(http_concurrent_downloads=21)
+
+
+def test_config_validation_translate_batching() -> None:
+    """Test translation batch size and concurrency validation."""
+    with pytest.raises(ValidationError):
+        TransFlowConfig(translate_batch_size=0)
+
+    with pytest.raises(ValidationError):
+        TransFlowConfig(translate_concurrency=0)
+
+    with pytest.raises(ValidationError):
+        TransFlowConfig(translate_concurrency=21)
+
+
+def test_config_validation_translate_parser() -> None:
+    """Test only supported Markdown parsers are accepted."""
+    assert TransFlowConfig(translate_parser="markdown-it").translate_parser == "markdown-it"
+
+    with pytest.raises(ValidationError):
+        TransFlowConfig(translate_parser="mistletoe")
+
+
+def test_load_config_is_cached(isolated_cache_home: Path) -> None:
+    """Test load_config returns the same instance until the cache is cleared."""
+    load_config.cache_clear()
+    try:
+        config = load_config()
+
+        assert load_config() is config
+
+        load_config.cache_clear()
+        assert load_config() is not config
+    finally:
+        load_config.cache_clear()
+
+
+def test_load_config_writes_and_reuses_snapshot(isolated_cache_home: Path) -> None:
+    """Test load_config persists a snapshot and reuses it without validation."""
+    load_config.cache_clear()
+    try:
+        config = load_config()
+        snapshots = list((isolated_cache_home / "transflow").glob("cfg-*.json"))
+        assert len(snapshots) == 1
+
+        load_config.cache_clear()
+        with patch.object(TransFlowConfig, "__init__", side_effect=AssertionError):
+            cached = load_config()
+
+        assert cached == config
+    finally:
+        load_config.cache_clear()
+
+
+def test_load_config_snapshot_invalidated_by_env(
+    isolated_cache_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test changing TRANSFLOW_* variables bypasses the old snapshot."""
+    load_config.cache_clear()
+    try:
+        load_config()
+
+        monkeypatch.setenv("TRANSFLOW_OPENAI_MODEL", "custom-model")
+        load_config.cache_clear()
+        config = load_config()
+
+        assert config.openai_model == "custom-model"
+        assert len(list((isolated_cache_home / "transflow").glob("cfg-*.json"))) == 1
+    finally:
+        load_config.cache_clear()
@@ -1,16 +1,31 @@
 """Tests for config manager module."""
 
 import os
+import re
+
 import pytest
 
 from transflow.config_manager import (
     ConfigItem,
     ConfigSource,
+    clear_config_cache,
     get_config_items,
     validate_config,
 )
 
 
+@pytest.fixture(scope="module")
+def all_config_items() -> dict[str, list[ConfigItem]]:
+    """Configuration items for the unmodified environment, built once per module."""
+    return get_config_items()
+
+
+@pytest.fixture(scope="module")
+def baseline_validation() -> tuple[bool, list[str], list[str]]:
+    """Validation result for the unmodified environment, computed once per module."""
+    return validate_config()
+
+
 class TestConfigItem:
     """Test ConfigItem class."""
 
@@ -28,106 +43,78 @@ class TestConfigItem:
         assert item.value == "test_value"
         assert item.source == ConfigSource.ENVIRONMENT
 
-    def test_api_key_masking(self):
-        """Test API key value masking."""
-        item = ConfigItem(
-            key="openai_api_key",
-            value="sk_test_1234567890abcdefghij",
-            source=ConfigSource.ENVIRONMENT,
-        )
-        display = item.display_value()
-        assert display.startswith("sk_te")
-        assert display.endswith("ghij")
-        assert "***" in display
-
-    def test_api_key_short_masking(self):
-        """Test API key masking for short keys."""
-        item = ConfigItem(
-            key="openai_api_key",
-            value="short",
-            source=ConfigSource.ENVIRONMENT,
-        )
-        assert item.display_value() == "****"
-
-    def test_none_value_display(self):
-        """Test display of None value."""
-        item = ConfigItem(
-            key="test_key",
-            value=None,
-            source=ConfigSource.NOT_SET,
-        )
-        assert item.display_value() == "[NOT SET]"
-
-    def test_empty_string_display(self):
-        """Test display of empty string."""
-        item = ConfigItem(
-            key="test_key",
-            value="",
-            source=ConfigSource.NOT_SET,
-        )
-        assert item.display_value() == "[NOT SET]"
-
-    def test_source_display_environment(self):
-        """Test source display for environment variables."""
-        item = ConfigItem(
-            key="test_key",
-            value="test",
-            source=ConfigSource.ENVIRONMENT,
-        )
-        assert "TRANSFLOW_TEST_KEY" in item.source_display()
-
-    def test_source_display_default(self):
-        """Test source display for default values."""
-        item = ConfigItem(
-            key="test_key",
-            value="default_value",
-            source=ConfigSource.DEFAULT,
-        )
-        assert "(default)" in item.source_display()
-
-    def test_status_display_set(self):
-        """Test status display for set values."""
-        item = ConfigItem(
-            key="test_key",
-            value="test_value",
-            source=ConfigSource.ENVIRONMENT,
-            required=True,
-        )
-        assert "[SET]" in item.status_display()
-
-    def test_status_display_missing_required(self):
-        """Test status display for missing required value."""
-        item = ConfigItem(
-            key="test_key",
-            value=None,
-            source=ConfigSource.NOT_SET,
-            required=True,
-        )
-        assert "[MISSING]" in item.status_display()
-
-    def test_status_display_optional(self):
-        """Test status display for optional missing value."""
-        item = ConfigItem(
-            key="test_key",
-            value=None,
-            source=ConfigSource.NOT_SET,
-            required=False,
-        )
-        assert "[OPTIONAL]" in item.status_display()
+    def test_config_item_is_immutable(self):
+        """Test config items cannot be modified once created."""
+        item = ConfigItem(key="test_key", value="test_value", source=ConfigSource.DEFAULT)
+        with pytest.raises(AttributeError):
+            item.value = "changed"
+        assert not hasattr(item, "__dict__")
+
+    @pytest.mark.parametrize(
+        ("kwargs", "method", "expected"),
+        [
+            pytest.param(
+                {"key": "openai_api_key", "value": "sk_test_1234567890abcdefghij",
+                 "source": ConfigSource.ENVIRONMENT},
+                "display_value", re.compile(r"^sk_te\*{3}ghij$"), id="api_key_masking",
+            ),
+            pytest.param(
+                {"key": "openai_api_key", "value": "short", "source": ConfigSource.ENVIRONMENT},
+                "display_value", re.compile(r"^\*{4}$"), id="api_key_short_masking",
+            ),
+            pytest.param(
+                {"key": "test_key", "value": None, "source": ConfigSource.NOT_SET},
+                "display_value", re.compile(r"^\[NOT SET\]$"), id="none_value_display",
+            ),
+            pytest.param(
+                {"key": "test_key", "value": "", "source": ConfigSource.NOT_SET},
+                "display_value", re.compile(r"^\[NOT SET\]$"), id="empty_string_display",
+            ),
+            pytest.param(
+                {"key": "test_key", "value": "test", "source": ConfigSource.ENVIRONMENT},
+                "source_display", re.compile(r"\(env: TRANSFLOW_TEST_KEY\)"),
+                id="source_display_environment",
+            ),
+            pytest.param(
+                {"key": "test_key", "value": "default_value", "source": ConfigSource.DEFAULT},
+                "source_display", re.compile(r"^\(default\)$"), id="source_display_default",
+            ),
+            pytest.param(
+                {"key": "test_key", "value": "test_value", "source": ConfigSource.ENVIRONMENT,
+                 "required": True},
+                "status_display", re.compile(r"^\[SET\]$"), id="status_display_set",
+            ),
+            pytest.param(
+                {"key": "test_key", "value": None, "source": ConfigSource.NOT_SET,
+                 "required": True},
+                "status_display", re.compile(r"^\[MISSING\]$"),
+                id="status_display_missing_required",
+            ),
+            pytest.param(
+                {"key": "test_key", "value": None, "source": ConfigSource.NOT_SET,
+                 "required": False},
+                "status_display", re.compile(r"^\[OPTIONAL\]$"), id="status_display_optional",
+            ),
+        ],
+    )
+    def test_config_item_display(self, kwargs, method, expected):
+        """Test masking, source and status display strings."""
+        display = getattr(ConfigItem(**kwargs), method)()
+        assert expected.search(display), display
 
 
 class TestGetConfigItems:
     """Test get_config_items function."""
 
-    def test_get_config_items_structure(self):
+    def test_get_config_items_structure(self, all_config_items):
         """Test that get_config_items returns expected structure."""
-        items = get_config_items()
+        items = all_config_items
         assert isinstance(items, dict)
         assert len(items) > 0
 
-    def test_get_config_items_categories(self):
+    def test_get_config_items_categories(self, all_config_items):
         """Test that all expected categories are present."""
-        items = get_config_items()
+        items = all_config_items
         expected_categories = [
             "API Configuration",
             "Extraction Configuration",
@@ -138,16 +125,16 @@ class TestGetConfigItems:
         for category in expected_categories:
             assert category in items
 
-    def test_config_items_have_descriptions(self):
+    def test_config_items_have_descriptions(self, all_config_items):
         """Test that all config items have descriptions."""
-        items = get_config_items()
+        items = all_config_items
         for category, config_items in items.items():
             for item in config_items:
                 assert item.description, f"Missing description for {item.key}"
 
-    def test_config_items_required_status(self):
+    def test_config_items_required_status(self, all_config_items):
         """Test that required status is set appropriately."""
-        items = get_config_items()
+        items = all_config_items
         api_config = items["API Configuration"]
 
         # openai_api_key should be required
@@ -168,9 +155,9 @@ class TestGetConfigItems:
 class TestValidateConfig:
     """Test validate_config function."""
 
-    def test_validate_config_returns_tuple(self):
+    def test_validate_config_returns_tuple(self, baseline_validation):
         """Test that validate_config returns a tuple."""
-        result = validate_config()
+        result = baseline_validation
         assert isinstance(result, tuple)
         assert len(result) == 3
         is_valid, warnings, errors = result
@@ -188,21 +175,21 @@ class TestValidateConfig:
         # but should have error about missing API key
         assert any("openai_api_key" in str(e).lower() for e in errors)
 
-    def test_validate_config_invalid_log_level(self, monkeypatch):
-        """Test validation fails with invalid log level."""
-        monkeypatch.setenv("TRANSFLOW_LOG_LEVEL", "INVALID_LEVEL")
-
-        is_valid, warnings, errors = validate_config()
-        assert not is_valid
-        assert any("log_level" in str(e).lower() for e in errors)
-
-    def test_validate_config_negative_timeout(self, monkeypatch):
-        """Test validation fails with negative timeout."""
-        monkeypatch.setenv("TRANSFLOW_HTTP_TIMEOUT", "-1")
+    @pytest.mark.parametrize(
+        ("env_var", "bad_value", "expected_key"),
+        [
+            ("TRANSFLOW_LOG_LEVEL", "INVALID_LEVEL", "log_level"),
+            ("TRANSFLOW_HTTP_TIMEOUT", "-1", "http_timeout"),
+            ("TRANSFLOW_HTTP_CONCURRENT_DOWNLOADS", "50", "concurrent_downloads"),
+        ],
+    )
+    def test_validate_config_invalid_value(self, monkeypatch, env_var, bad_value, expected_key):
+        """Test validation fails and names the setting for out-of-range values."""
+        monkeypatch.setenv(env_var, bad_value)
 
         is_valid, warnings, errors = validate_config()
         assert not is_valid
-        assert any("http_timeout" in str(e).lower() for e in errors)
+        assert any(expected_key in str(e).lower() for e in errors)
 
     def test_validate_config_missing_firecrawl_warning(self, monkeypatch):
         """Test that missing Firecrawl API key triggers warning."""
@@ -211,13 +198,27 @@ class TestValidateConfig:
         is_valid, warnings, errors = validate_config()
         assert any("firecrawl" in str(w).lower() for w in warnings)
 
-    def test_validate_config_invalid_concurrent_downloads(self, monkeypatch):
-        """Test validation fails with invalid concurrent downloads count."""
-        monkeypatch.setenv("TRANSFLOW_HTTP_CONCURRENT_DOWNLOADS", "50")
 
-        is_valid, warnings, errors = validate_config()
-        assert not is_valid
-        assert any("concurrent_downloads" in str(e).lower() for e in errors)
+class TestConfigCaching:
+    """Test memoization of config_manager results."""
+
+    def test_get_config_items_is_memoized(self):
+        """Test repeated calls reuse the same result."""
+        assert get_config_items() is get_config_items()
+
+    def test_validate_config_cache_tracks_environment(self, monkeypatch):
+        """Test changing TRANSFLOW_* variables bypasses the memoized result."""
+        first = validate_config()
+        assert validate_config() is first
+
+        monkeypatch.setenv("TRANSFLOW_HTTP_TIMEOUT", "-1")
+        assert validate_config() is not first
+
+    def test_clear_config_cache(self):
+        """Test clear_config_cache drops memoized results."""
+        items = get_config_items()
+        clear_config_cache()
+        assert get_config_items() is not items
 
 
 class TestConfigSource:
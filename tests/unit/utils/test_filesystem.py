@@ -9,7 +9,6 @@ Following Google Python testing guidelines:
 
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
@@ -19,27 +18,22 @@ from transflow.utils.filesystem import FileSystemHelper
 class TestFileSystemHelper:
     """Tests for FileSystemHelper utility class."""
 
-    def test_generate_slug_basic(self) -> None:
-        """Test slug generation from simple text."""
-        # Arrange
-        text = "Hello World"
-
-        # Act
-        slug = FileSystemHelper.generate_slug(text)
-
-        # Assert
-        assert slug == "hello-world"
-
-    def test_generate_slug_with_special_characters(self) -> None:
-        """Test slug generation removes special characters."""
-        # Arrange
-        text = "Test: Article & Title!"
-
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Hello World", "hello-world"),
+            ("Test: Article & Title!", "test-article-title"),
+            ("测试文章标题", "ce-shi-wen-zhang-biao-ti"),
+        ],
+        ids=["basic", "special_characters", "chinese_characters"],
+    )
+    def test_generate_slug(self, text: str, expected: str) -> None:
+        """Test slug generation lowercases, drops punctuation and transliterates."""
         # Act
         slug = FileSystemHelper.generate_slug(text)
 
         # Assert
-        assert slug == "test-article-title"
+        assert slug == expected
 
     def test_generate_slug_with_max_length(self) -> None:
         """Test slug generation respects max length constraint."""
@@ -53,62 +47,23 @@ class TestFileSystemHelper:
         # Assert
         assert len(slug) <= max_length
 
-    def test_generate_slug_chinese_characters(self) -> None:
-        """Test slug generation handles non-ASCII characters."""
-        # Arrange
-        text = "测试文章标题"
-
-        # Act
-        slug = FileSystemHelper.generate_slug(text)
-
-        # Assert
-        assert slug == "ce-shi-wen-zhang-biao-ti"
-
-    def test_generate_filename_from_url_simple(self) -> None:
-        """Test filename generation from simple URL."""
-        # Arrange
-        url = "https://example.com/my-article"
-
-        # Act
-        filename = FileSystemHelper.generate_filename_from_url(url)
-
-        # Assert
-        assert filename == "my-article.md"
-
-    def test_generate_filename_from_url_with_query_params(self) -> None:
-        """Test filename generation strips query parameters."""
-        # Arrange
-        url = "https://example.com/article?id=123&lang=en"
-
-        # Act
-        filename = FileSystemHelper.generate_filename_from_url(url)
-
-        # Assert
-        assert filename == "article.md"
-        assert "?" not in filename
-
-    def test_generate_filename_from_url_with_anchor(self) -> None:
-        """Test filename generation strips anchor tags."""
-        # Arrange
-        url = "https://example.com/article#section"
-
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://example.com/my-article", "my-article.md"),
+            ("https://example.com/article?id=123&lang=en", "article.md"),
+            ("https://example.com/article#section", "article.md"),
+            ("https://example.com/my-article/", "my-article.md"),
+        ],
+        ids=["simple", "query_params", "anchor", "trailing_slash"],
+    )
+    def test_generate_filename_from_url(self, url: str, expected: str) -> None:
+        """Test filename generation uses the last path segment, without query or anchor."""
         # Act
         filename = FileSystemHelper.generate_filename_from_url(url)
 
         # Assert
-        assert filename == "article.md"
-        assert "#" not in filename
-
-    def test_generate_filename_from_url_with_trailing_slash(self) -> None:
-        """Test filename generation handles trailing slash."""
-        # Arrange
-        url = "https://example.com/my-article/"
-
-        # Act
-        filename = FileSystemHelper.generate_filename_from_url(url)
-
-        # Assert
-        assert filename == "my-article.md"
+        assert filename == expected
 
     def test_generate_filename_from_url_fallback(self) -> None:
         """Test filename generation provides fallback for root URLs."""
@@ -122,42 +77,39 @@ class TestFileSystemHelper:
         assert filename.endswith(".md")
         assert len(filename) > 3
 
-    def test_ensure_directory_creates_new_directory(self) -> None:
-        """Test ensure_directory creates non-existent directory."""
+    def test_ensure_directory_creates_new_directory(self, tmp_path: Path) -> None:
+        """Test ensure_directory creates non-existent directory and its parents."""
         # Arrange
-        test_path = Path("/tmp/test_transflow_dir")
+        test_path = tmp_path / "parent" / "test_transflow_dir"
 
         # Act
-        with patch.object(Path, "mkdir") as mock_mkdir:
-            FileSystemHelper.ensure_directory(test_path)
+        FileSystemHelper.ensure_directory(test_path)
+        FileSystemHelper.ensure_directory(test_path)  # Existing directory is fine
 
         # Assert
-        mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+        assert test_path.is_dir()
 
-    def test_generate_unique_filename_no_collision(self) -> None:
+    def test_generate_unique_filename_no_collision(self, tmp_path: Path) -> None:
         """Test unique filename generation when no file exists."""
         # Arrange
-        directory = Path("/tmp")
         base_name = "test"
         extension = ".md"
 
         # Act
-        with patch.object(Path, "exists", return_value=False):
-            filename = FileSystemHelper.generate_unique_filename(directory, base_name, extension)
+        filename = FileSystemHelper.generate_unique_filename(tmp_path, base_name, extension)
 
         # Assert
         assert filename == "test.md"
 
-    def test_generate_unique_filename_with_collision(self) -> None:
+    def test_generate_unique_filename_with_collision(self, tmp_path: Path) -> None:
         """Test unique filename generation adds hash suffix on collision."""
         # Arrange
-        directory = Path("/tmp")
         base_name = "test"
         extension = ".md"
+        (tmp_path / "test.md").write_text("existing", encoding="utf-8")
 
         # Act
-        with patch.object(Path, "exists", return_value=True):
-            filename = FileSystemHelper.generate_unique_filename(directory, base_name, extension)
+        filename = FileSystemHelper.generate_unique_filename(tmp_path, base_name, extension)
 
         # Assert
         assert filename.startswith("test_")
@@ -203,6 +155,18 @@ class TestFileSystemHelper:
         # Assert
         assert result == "2026/20260114-test"
 
+    def test_format_folder_path_keeps_unknown_braces(self) -> None:
+        """Test text that is not a known placeholder is left unchanged."""
+        # Arrange
+        pattern = "{year}/{other}/{slug}{"
+        date = datetime(2026, 1, 14)
+
+        # Act
+        result = FileSystemHelper.format_folder_path(pattern, "Test", date)
+
+        # Assert
+        assert result == "2026/{other}/test{"
+
     def test_format_folder_path_defaults_to_current_date(self) -> None:
         """Test folder path formatting uses current date when not provided."""
         # Arrange
@@ -210,9 +174,9 @@ class TestFileSystemHelper:
         title = "Test"
 
         # Act
-        with patch("transflow.utils.filesystem.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(2026, 1, 14)
-            result = FileSystemHelper.format_folder_path(pattern, title)
+        result = FileSystemHelper.format_folder_path(
+            pattern, title, now=lambda: datetime(2026, 1, 14)
+        )
 
         # Assert
-        assert result.startswith("2026/")
+        assert result == "2026/test"
@@ -7,12 +7,20 @@ Following Google Python testing guidelines:
 - Use docstrings to explain test purpose
 """
 
+from collections.abc import Callable
+from pathlib import Path
+
 import pytest
 import httpx
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from transflow.exceptions import NetworkError
-from transflow.utils.http import HTTPClient
+from transflow.utils.http import HTTPClient, create_session, prefetch_dns
+
+
+def _mock_session(handler: Callable[[httpx.Request], httpx.Response]) -> httpx.AsyncClient:
+    """Build a session whose requests are answered by ``handler`` instead of the network."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
 
 
 class TestHTTPClient:
@@ -41,135 +49,208 @@ class TestHTTPClient:
         assert client.max_retries == 5
         assert client.default_headers == custom_headers
 
-    @pytest.mark.asyncio
     async def test_get_success(self) -> None:
         """Test successful GET request returns response."""
         # Arrange
-        client = HTTPClient()
-        mock_response = httpx.Response(
-            status_code=200,
-            json={"data": "test"},
-            request=httpx.Request("GET", "https://example.com"),
+        client = HTTPClient(
+            session=_mock_session(lambda request: httpx.Response(200, json={"data": "test"}))
         )
 
         # Act
-        with patch("httpx.AsyncClient.get", new=AsyncMock(return_value=mock_response)):
-            response = await client.get("https://example.com")
+        response = await client.get("https://example.com")
 
         # Assert
         assert response.status_code == 200
         assert response.json() == {"data": "test"}
 
-    @pytest.mark.asyncio
     async def test_get_with_custom_headers(self) -> None:
         """Test GET request merges custom headers with defaults."""
         # Arrange
         default_headers = {"Authorization": "Bearer token"}
         custom_headers = {"Accept": "application/json"}
-        client = HTTPClient(headers=default_headers)
+        requests = []
 
-        mock_get = AsyncMock(
-            return_value=httpx.Response(
-                status_code=200,
-                request=httpx.Request("GET", "https://example.com"),
-            )
-        )
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200)
+
+        client = HTTPClient(headers=default_headers, session=_mock_session(handler))
 
         # Act
-        with patch("httpx.AsyncClient.get", new=mock_get):
-            await client.get("https://example.com", headers=custom_headers)
+        await client.get("https://example.com", headers=custom_headers)
 
         # Assert
-        call_kwargs = mock_get.call_args.kwargs
-        assert call_kwargs["headers"]["Authorization"] == "Bearer token"
-        assert call_kwargs["headers"]["Accept"] == "application/json"
+        assert requests[0].headers["Authorization"] == "Bearer token"
+        assert requests[0].headers["Accept"] == "application/json"
 
-    @pytest.mark.asyncio
     async def test_get_network_error_raises_network_error(self) -> None:
         """Test GET request raises NetworkError on network failure."""
         # Arrange
-        client = HTTPClient(max_retries=2)
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection failed", request=request)
+
+        client = HTTPClient(max_retries=2, session=_mock_session(handler))
 
         # Act & Assert
-        with patch(
-            "httpx.AsyncClient.get",
-            new=AsyncMock(side_effect=httpx.NetworkError("Connection failed")),
-        ):
-            with pytest.raises(NetworkError):
-                await client.get("https://example.com")
-
-    @pytest.mark.asyncio
+        with pytest.raises(NetworkError):
+            await client.get("https://example.com")
+
     async def test_post_success(self) -> None:
         """Test successful POST request returns response."""
         # Arrange
-        client = HTTPClient()
-        payload = {"key": "value"}
-        mock_response = httpx.Response(
-            status_code=201,
-            json={"result": "created"},
-            request=httpx.Request("POST", "https://example.com"),
+        client = HTTPClient(
+            session=_mock_session(lambda request: httpx.Response(201, json={"result": "created"}))
         )
+        payload = {"key": "value"}
 
         # Act
-        with patch("httpx.AsyncClient.post", new=AsyncMock(return_value=mock_response)):
-            response = await client.post("https://example.com", json=payload)
+        response = await client.post("https://example.com", json=payload)
 
         # Assert
         assert response.status_code == 201
         assert response.json() == {"result": "created"}
 
-    @pytest.mark.asyncio
     async def test_post_timeout_raises_network_error(self) -> None:
         """Test POST request raises NetworkError on timeout."""
         # Arrange
-        client = HTTPClient(max_retries=2, timeout=1)
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("Timeout", request=request)
+
+        client = HTTPClient(max_retries=2, timeout=1, session=_mock_session(handler))
 
         # Act & Assert
-        with patch(
-            "httpx.AsyncClient.post",
-            new=AsyncMock(side_effect=httpx.TimeoutException("Timeout")),
-        ):
-            with pytest.raises(NetworkError):
-                await client.post("https://example.com", json={})
-
-    @pytest.mark.asyncio
-    async def test_download_file_success(self) -> None:
+        with pytest.raises(NetworkError):
+            await client.post("https://example.com", json={})
+
+    async def test_download_file_success(self, tmp_path: Path) -> None:
         """Test successful file download writes content to disk."""
         # Arrange
-        client = HTTPClient()
         url = "https://example.com/image.png"
-        dest_path = "/tmp/image.png"
-        mock_response = httpx.Response(
-            status_code=200,
-            content=b"fake image data",
-            request=httpx.Request("GET", url),
-        )
+        dest_path = tmp_path / "image.png"
+        session = _mock_session(lambda request: httpx.Response(200, content=b"fake image data"))
+        client = HTTPClient(session=session)
 
         # Act
-        mock_open_context = MagicMock()
-        mock_file = MagicMock()
-        mock_open_context.__enter__ = MagicMock(return_value=mock_file)
-        mock_open_context.__exit__ = MagicMock(return_value=False)
-        
-        with patch("httpx.AsyncClient.get", new=AsyncMock(return_value=mock_response)):
-            with patch("builtins.open", return_value=mock_open_context) as mock_open:
-                await client.download_file(url, dest_path)
+        await client.download_file(url, str(dest_path))
 
         # Assert
-        mock_open.assert_called_once_with(dest_path, "wb")
-        mock_file.write.assert_called_once_with(b"fake image data")
+        assert dest_path.read_bytes() == b"fake image data"
+        assert list(tmp_path.iterdir()) == [dest_path]
+
+    async def test_download_file_http_error_leaves_no_file(self, tmp_path: Path) -> None:
+        """Test a failed download leaves neither the file nor a partial file."""
+        # Arrange
+        session = _mock_session(lambda request: httpx.Response(404))
+        client = HTTPClient(max_retries=1, session=session)
+
+        # Act & Assert
+        with pytest.raises(NetworkError):
+            await client.download_file("https://example.com/a.png", str(tmp_path / "a.png"))
+        assert list(tmp_path.iterdir()) == []
 
-    @pytest.mark.asyncio
-    async def test_download_file_network_error(self) -> None:
+    async def test_download_file_network_error(self, tmp_path: Path) -> None:
         """Test file download raises NetworkError on failure."""
         # Arrange
-        client = HTTPClient(max_retries=2)
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Failed", request=request)
+
+        client = HTTPClient(max_retries=2, session=_mock_session(handler))
         url = "https://example.com/image.png"
 
         # Act & Assert
-        with patch(
-            "httpx.AsyncClient.get",
-            new=AsyncMock(side_effect=httpx.NetworkError("Failed")),
-        ):
-            with pytest.raises(NetworkError):
-                await client.download_file(url, "/tmp/image.png")
+        with pytest.raises(NetworkError):
+            await client.download_file(url, str(tmp_path / "image.png"))
+
+    async def test_get_uses_shared_session(self) -> None:
+        """Test GET request reuses an injected session instead of creating a client."""
+        # Arrange
+        session = MagicMock(spec=httpx.AsyncClient)
+        session.get = AsyncMock(
+            return_value=httpx.Response(
+                status_code=200,
+                request=httpx.Request("GET", "https://example.com"),
+            )
+        )
+        client = HTTPClient(timeout=5, session=session)
+
+        # Act
+        with patch("httpx.AsyncClient.__init__") as mock_init:
+            await client.get("https://example.com")
+
+        # Assert
+        mock_init.assert_not_called()
+        session.get.assert_awaited_once()
+        assert session.get.call_args.kwargs["timeout"] == 5
+
+    async def test_requests_reuse_own_client_until_closed(self) -> None:
+        """Test a client without a session keeps one pool across requests."""
+        # Arrange
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200)
+
+        transport = httpx.MockTransport(handler)
+        real_init = httpx.AsyncClient.__init__
+
+        def init(self: httpx.AsyncClient, **kwargs: object) -> None:
+            seen.append(self)
+            real_init(self, transport=transport, **kwargs)
+
+        # Act
+        with patch.object(httpx.AsyncClient, "__init__", new=init):
+            async with HTTPClient() as client:
+                await client.get("https://example.com/a")
+                await client.post("https://example.com/b", json={})
+                own_session = client._own_session
+
+        # Assert
+        assert len(seen) == 1
+        assert own_session is not None and own_session.is_closed
+        assert client._own_session is None
+
+    async def test_create_session_configures_pool(self) -> None:
+        """Test create_session returns a pooled client with the given limits."""
+        # Act
+        async with create_session(timeout=10, max_connections=4) as session:
+            # Assert
+            assert isinstance(session, httpx.AsyncClient)
+            assert session.timeout.read == 10
+
+
+class TestPrefetchDns:
+    """Tests for prefetch_dns function."""
+
+    def test_prefetch_dns_resolves_each_host_once(self) -> None:
+        """Test prefetch_dns looks up every distinct host on its port."""
+        # Arrange
+        urls = (
+            "https://api.openai.com/v1",
+            "https://api.openai.com/v1/",
+            "http://localhost:8000",
+            "",
+        )
+
+        # Act
+        with patch("transflow.utils.http.socket.getaddrinfo") as mock_getaddrinfo:
+            threads = prefetch_dns(*urls)
+            for thread in threads:
+                thread.join()
+
+        # Assert
+        looked_up = {call.args for call in mock_getaddrinfo.call_args_list}
+        assert looked_up == {("api.openai.com", 443), ("localhost", 8000)}
+
+    def test_prefetch_dns_ignores_resolution_errors(self) -> None:
+        """Test prefetch_dns swallows lookup failures."""
+        # Arrange
+        error = OSError("Name or service not known")
+
+        # Act
+        with patch("transflow.utils.http.socket.getaddrinfo", side_effect=error):
+            threads = prefetch_dns("https://unknown.invalid")
+            for thread in threads:
+                thread.join()
+
+        # Assert
+        assert len(threads) == 1
@@ -4,6 +4,7 @@ Following Google Python testing guidelines.
 """
 
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import patch
 
@@ -12,13 +13,16 @@ import pytest
 from transflow.utils.logger import TransFlowLogger
 
 
+@pytest.fixture(autouse=True)
+def _reset_logger() -> Iterator[None]:
+    """Reset logger after each test to avoid state leakage."""
+    yield
+    TransFlowLogger.reset()
+
+
 class TestTransFlowLogger:
     """Tests for TransFlowLogger class."""
 
-    def teardown_method(self) -> None:
-        """Reset logger after each test to avoid state leakage."""
-        TransFlowLogger.reset()
-
     def test_get_logger_returns_logger_instance(self) -> None:
         """Test get_logger returns a valid logging.Logger instance."""
         # Act
@@ -56,18 +60,28 @@ class TestTransFlowLogger:
         handler_types = [type(h).__name__ for h in logger.handlers]
         assert "RichHandler" in handler_types
 
-    def test_get_logger_adds_file_handler_when_specified(self) -> None:
+    @pytest.mark.parametrize(("level", "show_locals"), [("INFO", False), ("DEBUG", True)])
+    def test_traceback_locals_only_when_debugging(self, level: str, show_locals: bool) -> None:
+        """Test tracebacks render local variables only at DEBUG level."""
+        # Act
+        logger = TransFlowLogger.get_logger(level=level)
+
+        # Assert
+        handler = next(h for h in logger.handlers if type(h).__name__ == "RichHandler")
+        assert handler.tracebacks_show_locals is show_locals
+
+    def test_get_logger_adds_file_handler_when_specified(self, tmp_path: Path) -> None:
         """Test get_logger adds file handler when log_file is provided."""
         # Arrange
-        log_file = Path("/tmp/test.log")
+        log_file = tmp_path / "logs" / "test.log"
 
         # Act
-        with patch.object(Path, "mkdir"):
-            with patch("logging.FileHandler") as mock_file_handler:
-                logger = TransFlowLogger.get_logger(log_file=log_file)
+        logger = TransFlowLogger.get_logger(log_file=log_file)
 
         # Assert
-        mock_file_handler.assert_called_once()
+        file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+        assert [h.baseFilename for h in file_handlers] == [str(log_file)]
+        assert log_file.parent.is_dir()
 
     def test_reset_clears_singleton_instance(self) -> None:
         """Test reset() clears the singleton instance."""